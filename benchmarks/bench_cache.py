@@ -0,0 +1,81 @@
+"""
+bench_cache.py
+
+Mide `iter_parsed_commits` desde el último tag con y sin la caché de parseo, sobre un
+repositorio sintético lineal.
+
+Uso:
+    python -m benchmarks.bench_cache [--commits N] [--nuevos K] [--repeticiones R]
+
+Mediciones:
+- sin caché: recorrido y parseo del rango completo.
+- caché fría: igual, más la escritura de la caché.
+- caché caliente: el rango ya está guardado y HEAD no cambió.
+- caché con K nuevos: se agregan K commits; solo se recorren y parsean esos.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from git import Repo
+
+from benchmarks.synthetic_repo import generar_repo_sintetico
+from scripts import changelog_generator as cg
+from scripts.parse_cache import CacheParseo
+
+
+def medir(funcion, repeticiones: int = 1):
+    mejor = None
+    resultado = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        duracion = time.perf_counter() - inicio
+        mejor = duracion if mejor is None else min(mejor, duracion)
+    return mejor, resultado
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--commits", type=int, default=20000)
+    parser.add_argument("--nuevos", type=int, default=10)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo_path = str(generar_repo_sintetico(f"{tmp}/repo", args.commits, args.semilla))
+        ruta_cache = f"{tmp}/cache.sqlite"
+        tiempos = {}
+
+        def leer(cache=None):
+            return list(cg.iter_parsed_commits(repo_path, since="v0.1.0", cache=cache))
+
+        def leer_con_cache(ruta):
+            with CacheParseo(ruta, cg.version_parser()) as cache:
+                return leer(cache)
+
+        def leer_en_frio():
+            # Cada repetición empieza con una caché vacía
+            shutil.rmtree(f"{tmp}/fria", ignore_errors=True)
+            os.makedirs(f"{tmp}/fria")
+            return leer_con_cache(f"{tmp}/fria/cache.sqlite")
+
+        tiempos["sin caché"], esperado = medir(leer, args.repeticiones)
+        tiempos["caché fría"], _ = medir(leer_en_frio, args.repeticiones)
+        leer_con_cache(ruta_cache)
+        tiempos["caché caliente"], commits = medir(lambda: leer_con_cache(ruta_cache), args.repeticiones)
+        assert commits == esperado
+
+        repo = Repo(repo_path)
+        for i in range(args.nuevos):
+            repo.index.commit(f"fix: commit nuevo {i}")
+        tiempos[f"caché con {args.nuevos} nuevos"], commits = medir(lambda: leer_con_cache(ruta_cache))
+        assert commits == leer()
+
+    print(f"{args.commits} commits desde el último tag")
+    for nombre, segundos in tiempos.items():
+        print(f"{nombre:<24} {segundos * 1000:10.1f} ms")
@@ -0,0 +1,84 @@
+"""
+bench_formatos.py
+
+Compara tamaño, tiempo de escritura y tiempo de lectura de los formatos de salida
+de `scripts.formatos` con commits sintéticos (no requiere un repositorio).
+
+Uso:
+    python -m benchmarks.bench_formatos [--commits N]
+
+Los formatos cuyo paquete opcional no está instalado (msgpack, zstandard) se omiten.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.synthetic_repo import TIPOS
+from scripts.formatos import LectorColumnar, escribir_commits, leer_commits, nombre_salida
+
+CASOS = [
+    ("json", None),
+    ("json", "gzip"),
+    ("ndjson", None),
+    ("ndjson", "gzip"),
+    ("ndjson", "zstd"),
+    ("msgpack", None),
+    ("msgpack", "zstd"),
+    ("columnar", None),
+]
+
+
+def commits_sinteticos(n: int, semilla: int = 0):
+    azar = random.Random(semilla)
+    autores = [(f"Autor {i}", f"autor{i}@example.com") for i in range(40)]
+    for i in range(n):
+        nombre, email = azar.choice(autores)
+        yield {
+            "commit": f"{azar.getrandbits(160):040x}",
+            "mensaje": {
+                "tipo": azar.choice(TIPOS),
+                "escopo": azar.choice([None, "core", "api", "cli"]),
+                "descripcion": f"cambio número {i} en el módulo {azar.randrange(200)}",
+                "cuerpo": None if azar.random() < 0.7 else "detalle del cambio\n" * azar.randrange(1, 5),
+            },
+            "timestamp": 1_600_000_000 + i * 600,
+            "autor": {"nombre": nombre, "email": email},
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--commits", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for formato, compresion in CASOS:
+            ruta = os.path.join(tmp, nombre_salida("commits", formato, compresion))
+            etiqueta = f"{formato}+{compresion}" if compresion else formato
+            try:
+                inicio = time.perf_counter()
+                escribir_commits(commits_sinteticos(args.commits), ruta, formato, compresion)
+                t_escritura = time.perf_counter() - inicio
+            except ImportError as e:
+                print(f"{etiqueta:<14} omitido: {e}")
+                continue
+
+            inicio = time.perf_counter()
+            leidos = sum(1 for _ in leer_commits(ruta))
+            t_lectura = time.perf_counter() - inicio
+            assert leidos == args.commits
+            print(
+                f"{etiqueta:<14} {os.path.getsize(ruta) / 1e6:8.1f} MB  "
+                f"escritura {t_escritura:6.2f}s  lectura {t_lectura:6.2f}s"
+            )
+
+            if formato == "columnar":
+                inicio = time.perf_counter()
+                with LectorColumnar(ruta) as lector:
+                    fechas = lector.columna("timestamp")
+                    rango = max(fechas) - min(fechas)
+                    del fechas
+                print(f"{'':<14} columna timestamp con mmap: {time.perf_counter() - inicio:.3f}s (rango {rango}s)")
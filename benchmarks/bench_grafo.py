@@ -0,0 +1,94 @@
+"""
+bench_grafo.py
+
+Compara el cálculo del rango de commits (hashes y fechas de commit) y la lectura
+completa del rango con y sin commit-graph, sobre un repositorio sintético.
+
+Uso:
+    python -m benchmarks.bench_grafo [--commits N] [--ramas R] [--sin-gitpython]
+
+Mediciones:
+- rango con GitPython: `repo.iter_commits(rango)` leyendo `committed_date` de cada commit,
+  como hacía originalmente el generador.
+- rango con git log: un solo `git log --format=%H %ct`.
+- rango con commit-graph: `GrafoCommits.rango` y `GrafoCommits.fecha` sobre el archivo mapeado.
+- lectura completa: `iter_parsed_commits` con git log y con commit-graph + cat-file.
+- fechas de métricas: `calcular_metricas` sobre commits sin "timestamp", que consulta las
+  fechas en el commit-graph si existe y si no con GitPython.
+
+El rango medido va desde el primer tag (v0.1.0, en el primer commit) hasta HEAD.
+"""
+
+import argparse
+import tempfile
+import time
+
+from git import Repo
+
+from benchmarks.synthetic_repo import generar_repo_sintetico
+from scripts import changelog_generator as cg
+from scripts.grafo import GrafoCommits, escribir_grafo, leer_refs, resolver
+
+
+def medir(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return time.perf_counter() - inicio, resultado
+
+
+def rango_gitpython(repo: Repo, desde: str):
+    return [(c.hexsha, c.committed_date) for c in repo.iter_commits(f"{desde}..HEAD")]
+
+
+def rango_git_log(repo: Repo, desde: str):
+    return [linea.split() for linea in repo.git.log("--format=%H %ct", f"{desde}..HEAD").splitlines()]
+
+
+def sin_timestamp(commits):
+    return [{"commit": c["commit"], "mensaje": c["mensaje"]} for c in commits]
+
+
+def rango_grafo(repo: Repo, desde: str):
+    refs = leer_refs(repo.common_dir)
+    with GrafoCommits.abrir(repo) as grafo:
+        hasta = grafo.posicion(resolver(repo, "HEAD", refs))
+        excluido = grafo.posicion(resolver(repo, desde, refs))
+        return [(grafo.sha(p), grafo.fecha(p)) for p in grafo.rango([hasta], [excluido])]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--commits", type=int, default=200000)
+    parser.add_argument("--ramas", type=int, default=20, help="Crear una rama con merge cada R commits (0: lineal)")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--sin-gitpython", action="store_true", help="Omitir la medición con GitPython (lenta)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo_path = str(generar_repo_sintetico(f"{tmp}/repo", args.commits, args.semilla, ramas=args.ramas))
+        repo = Repo(repo_path)
+        desde = "v0.1.0"
+
+        tiempos = {}
+        if not args.sin_gitpython:
+            tiempos["rango GitPython"], esperado = medir(lambda: rango_gitpython(repo, desde))
+        tiempos["rango git log"], por_log = medir(lambda: rango_git_log(repo, desde))
+        commits = sin_timestamp(cg.iter_parsed_commits(repo_path, since=desde))
+        if not args.sin_gitpython:
+            tiempos["fechas GitPython"], metricas = medir(lambda: cg.calcular_metricas(commits, repo))
+        tiempos["escritura del grafo"], _ = medir(lambda: escribir_grafo(repo))
+        tiempos["fechas commit-graph"], metricas_grafo = medir(lambda: cg.calcular_metricas(commits, repo))
+        tiempos["rango commit-graph"], por_grafo = medir(lambda: rango_grafo(repo, desde))
+        tiempos["lectura git log"], commits_log = medir(lambda: list(cg.iter_parsed_commits(repo_path, since=desde)))
+        tiempos["lectura commit-graph"], commits_grafo = medir(
+            lambda: list(cg.iter_parsed_commits(repo_path, since=desde, grafo=True))
+        )
+
+    assert {sha for sha, _ in por_grafo} == {sha for sha, _ in por_log}
+    assert commits_grafo == commits_log
+    if not args.sin_gitpython:
+        assert metricas_grafo == metricas
+
+    print(f"{args.commits} commits, rango {desde}..HEAD: {len(por_grafo)} commits")
+    for nombre, segundos in tiempos.items():
+        print(f"{nombre:<22} {segundos:8.3f}s")
@@ -0,0 +1,91 @@
+"""
+bench_memoria.py
+
+Mide con tracemalloc la memoria que ocupan los commits parseados retenidos en una
+lista, como en el modo por defecto del generador (sin --stream), comparando los
+diccionarios de `iter_parsed_commits` con los registros compactos (`compacto=True`).
+
+Uso:
+    python -m benchmarks.bench_memoria [--commits N] [--cuerpo D] [--stats] [--min-ahorro P]
+
+Para cada representación se reporta la memoria retenida por la lista (bytes por
+commit) y el pico durante la lectura. Después se ejecutan sobre los registros
+compactos las etapas de versión, changelog y métricas, y se verifica que el resultado
+coincida con el de los diccionarios. Con --min-ahorro el script termina con código 1
+si el ahorro de memoria retenida queda por debajo de P por ciento.
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic_repo import DISTRIBUCIONES_CUERPO, generar_repo_sintetico
+from scripts import changelog_generator as cg
+
+
+def medir_memoria(repo_path: str, compacto: bool, stats: bool):
+    """
+    Leer todos los commits del repositorio y medir la memoria que retienen.
+
+    Retorna
+    -------
+    tuple
+        (commits, bytes retenidos, pico de bytes, segundos)
+    """
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    commits = list(cg.iter_parsed_commits(repo_path, stats=stats, compacto=compacto))
+    segundos = time.perf_counter() - inicio
+    gc.collect()
+    retenidos, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return commits, retenidos, pico, segundos
+
+
+def resultados_pipeline(commits):
+    """
+    Ejecutar las etapas que consumen los commits, para comparar ambas representaciones.
+    """
+    version = cg.siguiente_version(commits, "v0.1.0")
+    return version, cg.renderizar_seccion(commits, version), cg.calcular_metricas(commits)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--commits", type=int, default=200000)
+    parser.add_argument("--cuerpo", choices=sorted(DISTRIBUCIONES_CUERPO), default="mixto")
+    parser.add_argument("--stats", action="store_true", help="Incluir estadísticas de archivos")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--min-ahorro", type=float, default=None, help="Ahorro mínimo de memoria retenida, en %%")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo_path = str(generar_repo_sintetico(f"{tmp}/repo", args.commits, args.semilla, cuerpo=args.cuerpo))
+
+        mediciones = {}
+        pipeline = {}
+        for nombre, compacto in (("diccionarios", False), ("compacto", True)):
+            commits, retenidos, pico, segundos = medir_memoria(repo_path, compacto, args.stats)
+            mediciones[nombre] = (retenidos, pico, segundos)
+            pipeline[nombre] = resultados_pipeline(commits)
+            del commits
+
+    total = args.commits
+    for nombre, (retenidos, pico, segundos) in mediciones.items():
+        print(
+            f"{nombre:<13} retenido {retenidos / 2**20:8.1f} MiB ({retenidos / total:6.0f} B/commit)  "
+            f"pico {pico / 2**20:8.1f} MiB  lectura {segundos:6.2f}s"
+        )
+    ahorro = 100 * (1 - mediciones["compacto"][0] / mediciones["diccionarios"][0])
+    print(f"Ahorro de memoria retenida: {ahorro:.1f}%")
+
+    if pipeline["compacto"] != pipeline["diccionarios"]:
+        print("Los registros compactos producen un resultado distinto en el pipeline")
+        sys.exit(1)
+    if args.min_ahorro is not None and ahorro < args.min_ahorro:
+        print(f"Regresión: ahorro por debajo de {args.min_ahorro}%")
+        sys.exit(1)
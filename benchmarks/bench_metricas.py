@@ -0,0 +1,58 @@
+"""
+bench_metricas.py
+
+Compara el cálculo de métricas de flujo consultando cada commit con `repo.commit()`
+(camino anterior) contra los metadatos capturados en la pasada de parseo.
+
+Uso:
+    python -m benchmarks.bench_metricas [--commits N] [--repo RUTA]
+"""
+
+import argparse
+import tempfile
+import time
+
+from git import Repo
+
+from benchmarks.synthetic_repo import generar_repo_sintetico
+from scripts import changelog_generator as cg
+
+
+def camino_por_commit(repo_path: str, salida: str) -> float:
+    """
+    Parseo con `iter_commits` y una consulta `repo.commit()` por commit para las fechas.
+    """
+    inicio = time.perf_counter()
+    repo = Repo(repo_path)
+    commits = [
+        cg.parse_commit_message(c.message, c.hexsha)
+        for c in reversed(list(repo.iter_commits("v0.1.0..HEAD")))
+    ]
+    cg.calcular_metricas_flujo(commits, archivo_salida=salida, repo=repo)
+    return time.perf_counter() - inicio
+
+
+def camino_en_bloque(repo_path: str, salida: str) -> float:
+    """
+    Parseo con una sola pasada de `git log` que ya incluye las fechas.
+    """
+    inicio = time.perf_counter()
+    commits = cg.iter_parsed_commits(repo_path, since="v0.1.0")
+    cg.calcular_metricas_flujo(commits, archivo_salida=salida)
+    return time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--commits", type=int, default=50000)
+    parser.add_argument("--repo", type=str, help="Usar un repositorio existente con tag v0.1.0")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo_path = args.repo or str(generar_repo_sintetico(f"{tmp}/repo", args.commits))
+        t_por_commit = camino_por_commit(repo_path, f"{tmp}/metrics_por_commit.json")
+        t_en_bloque = camino_en_bloque(repo_path, f"{tmp}/metrics_en_bloque.json")
+
+    print(f"repo.commit() por commit: {t_por_commit:.2f}s")
+    print(f"metadatos en bloque:      {t_en_bloque:.2f}s")
+    print(f"aceleración:              {t_por_commit / t_en_bloque:.1f}x")
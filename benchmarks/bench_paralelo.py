@@ -0,0 +1,70 @@
+"""
+bench_paralelo.py
+
+Mide la lectura y el parseo de un rango grande con `iter_parsed_commits(jobs=N)` para
+distintas cantidades de procesos, sobre un repositorio sintético.
+
+Uso:
+    python -m benchmarks.bench_paralelo [--commits N] [--jobs 1 2 4 ...] [--cuerpo D] [--stats]
+
+Para cada N se reporta el tiempo total, los commits por segundo, la aceleración
+respecto de jobs=1 y el tiempo de CPU del proceso principal (sin los procesos git ni
+los trabajadores), que acota la aceleración posible. Se verifica que la salida sea
+idéntica a la secuencial (el repositorio sintético es lineal). Con
+--min-eficiencia E el script termina con código 1 si la aceleración con el mayor N
+queda por debajo de E * N.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic_repo import DISTRIBUCIONES_CUERPO, generar_repo_sintetico
+from scripts import changelog_generator as cg
+
+
+def medir(repo_path: str, jobs: int, stats: bool):
+    inicio, cpu = time.perf_counter(), time.process_time()
+    commits = list(cg.iter_parsed_commits(repo_path, stats=stats, jobs=jobs))
+    return time.perf_counter() - inicio, time.process_time() - cpu, commits
+
+
+if __name__ == "__main__":
+    nucleos = os.cpu_count() or 1
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--commits", type=int, default=500000)
+    parser.add_argument(
+        "--jobs", type=int, nargs="+", default=sorted({1, 2, 4, 8, 16, nucleos} & set(range(1, nucleos + 1)))
+    )
+    parser.add_argument("--cuerpo", choices=sorted(DISTRIBUCIONES_CUERPO), default="mixto")
+    parser.add_argument("--stats", action="store_true", help="Incluir estadísticas de archivos")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--min-eficiencia", type=float, default=None, help="Aceleración mínima / jobs, entre 0 y 1")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo_path = str(generar_repo_sintetico(f"{tmp}/repo", args.commits, args.semilla, cuerpo=args.cuerpo))
+        base, cpu, esperado = medir(repo_path, 1, args.stats)
+        tiempos = {1: base}
+        cpu_principal = {1: cpu}
+        for jobs in args.jobs:
+            if jobs == 1:
+                continue
+            tiempos[jobs], cpu_principal[jobs], commits = medir(repo_path, jobs, args.stats)
+            if commits != esperado:
+                print(f"jobs={jobs} produce una salida distinta de la secuencial")
+                sys.exit(1)
+
+    print(f"{len(esperado)} commits, {nucleos} núcleos")
+    for jobs, segundos in sorted(tiempos.items()):
+        print(
+            f"jobs={jobs:<3} {segundos:8.2f}s  {len(esperado) / segundos:10.0f} commits/s  "
+            f"aceleración {base / segundos:5.2f}x  CPU del proceso principal {cpu_principal[jobs]:6.2f}s"
+        )
+
+    mayor = max(tiempos)
+    if args.min_eficiencia is not None and base / tiempos[mayor] < args.min_eficiencia * mayor:
+        print(f"Regresión: aceleración con jobs={mayor} por debajo de {args.min_eficiencia * mayor:.1f}x")
+        sys.exit(1)
@@ -0,0 +1,109 @@
+"""
+bench_parser.py
+
+Microbenchmark del parseo de mensajes convencionales, en mensajes por segundo.
+
+Compara la implementación original de `parse_commit_message` (regex sin compilar y
+split/join por mensaje) con la versión actual y con el parseo por lotes de
+`parse_commit_messages`.
+
+Uso:
+    python -m benchmarks.bench_parser [--mensajes N] [--repeticiones R] [--min-mps M]
+
+Con --min-mps el script termina con código 1 si el parseo por lotes queda por debajo
+de M mensajes por segundo, para detectar regresiones en CI.
+"""
+
+import argparse
+import random
+import re
+import sys
+import timeit
+
+from scripts import changelog_generator as cg
+
+
+def parse_original(commit_msg: str, commit_hash: str):
+    """
+    Copia de la implementación original, usada como referencia.
+    """
+    lines = commit_msg.strip().split("\n")
+    header = lines[0]
+    body = "\n".join(lines[1:]).strip() if len(lines) > 1 else None
+
+    match = re.match(cg.COMMIT_REGEX, header)
+
+    if match:
+        tipo_base = match.group(1)
+        es_breaking = match.group(2) == "!"
+        escopo = match.group(3)[1:-1] if match.group(3) else None
+        descripcion = match.group(4)
+
+        tipo = "BREAKING CHANGE" if es_breaking else tipo_base
+    else:
+        tipo = "otro"
+        escopo = None
+        descripcion = header
+
+    return {
+        "commit": commit_hash,
+        "mensaje": {
+            "tipo": tipo,
+            "escopo": escopo,
+            "descripcion": descripcion,
+            "cuerpo": body or None,
+        },
+    }
+
+
+def generar_mensajes(cantidad: int, semilla: int = 0):
+    """
+    Generar pares (hash, mensaje) con encabezados y cuerpos de distinto tamaño.
+    """
+    rnd = random.Random(semilla)
+    tipos = ["feat", "fix", "chore", "docs", "refactor", "perf", "feat!"]
+    mensajes = []
+    for i in range(cantidad):
+        if i % 10 == 0:
+            mensaje = f"Merge branch 'rama-{i}'"
+        else:
+            escopo = f"(mod{i % 7})" if i % 2 else ""
+            cuerpo = "\n".join(f"línea {j} del cuerpo" for j in range(rnd.randint(0, 12)))
+            mensaje = f"{rnd.choice(tipos)}{escopo}: descripción del cambio {i}\n\n{cuerpo}\n"
+        mensajes.append((f"{i:040x}", mensaje))
+    return mensajes
+
+
+def medir(funcion, mensajes, repeticiones: int) -> float:
+    """
+    Ejecutar `funcion` sobre todos los mensajes y devolver los mensajes por segundo.
+    """
+    mejor = min(timeit.repeat(lambda: funcion(mensajes), number=1, repeat=repeticiones))
+    return len(mensajes) / mejor
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mensajes", type=int, default=100000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--min-mps", type=float, default=None)
+    args = parser.parse_args()
+
+    mensajes = generar_mensajes(args.mensajes)
+    casos = {
+        "original": lambda ms: [parse_original(m, h) for h, m in ms],
+        "parse_commit_message": lambda ms: [cg.parse_commit_message(m, h) for h, m in ms],
+        "parse_commit_messages": lambda ms: list(cg.parse_commit_messages(ms)),
+        "parse_commit_messages (lazy)": lambda ms: list(
+            cg.parse_commit_messages(ms, cuerpo_lazy=True)
+        ),
+    }
+
+    resultados = {nombre: medir(f, mensajes, args.repeticiones) for nombre, f in casos.items()}
+    base = resultados["original"]
+    for nombre, mps in resultados.items():
+        print(f"{nombre:<30} {mps:>12,.0f} mensajes/s  ({mps / base:.2f}x)")
+
+    if args.min_mps is not None and resultados["parse_commit_messages"] < args.min_mps:
+        print(f"Regresión: parse_commit_messages por debajo de {args.min_mps:,.0f} mensajes/s")
+        sys.exit(1)
@@ -0,0 +1,186 @@
+"""
+bench_pipeline.py
+
+Mide por separado cada etapa del generador sobre un repositorio sintético:
+resolución del último tag, recorrido de `git log`, parseo, cálculo de versión,
+renderizado del changelog y métricas.
+
+Uso:
+    python -m benchmarks.bench_pipeline [--commits N] [--tags T] [--cuerpo D] [--ramas R]
+                                        [--rango completo|ultimo] [--repeticiones K]
+                                        [--salida ARCHIVO] [--umbrales ARCHIVO]
+
+Cada etapa se repite K veces y se reporta el mejor tiempo. Los resultados se guardan
+en JSON (por defecto bench_pipeline.json). Si se indica un archivo de umbrales (por
+defecto benchmarks/umbrales.json) y alguna etapa lo supera, el script termina con
+código 1. Los umbrales se expresan en microsegundos por commit ("max_us_por_commit")
+o en segundos totales ("max_segundos"), de modo que sirven para distintos tamaños.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess  # nosec B404
+import sys
+import tempfile
+import time
+
+from git import Repo
+
+from benchmarks.synthetic_repo import DISTRIBUCIONES_CUERPO, generar_repo_sintetico
+from scripts import changelog_generator as cg
+from scripts.tags import resolver_ultimo_tag
+
+UMBRALES_POR_DEFECTO = os.path.join(os.path.dirname(__file__), "umbrales.json")
+
+
+def medir(funcion, repeticiones: int):
+    """
+    Ejecutar `funcion` varias veces y devolver (mejor tiempo, último resultado).
+    """
+    mejor = None
+    resultado = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        duracion = time.perf_counter() - inicio
+        mejor = duracion if mejor is None else min(mejor, duracion)
+    return mejor, resultado
+
+
+def medir_etapas(repo_path: str, repeticiones: int, directorio: str, desde: str = None):
+    """
+    Medir cada etapa del pipeline. Cada etapa recibe la salida de la anterior,
+    para que los tiempos no se mezclen.
+
+    Si `desde` es None el rango empieza en el último tag, como en el generador;
+    si no, en el tag indicado.
+    """
+    repo = Repo(repo_path)
+    etapas = {}
+
+    etapas["resolver_tag"], tag = medir(lambda: resolver_ultimo_tag(repo, usar_cache=False), repeticiones)
+    tag = desde or tag
+
+    args = ["--reverse", cg.FORMATO_REGISTRO, f"{tag}..HEAD"]
+    etapas["recorrido"], registros = medir(
+        lambda: [r.split("\x1f", 5) for r in cg._iter_registros_git(repo, args, separador=b"\x1e") if r],
+        repeticiones,
+    )
+    etapas["parseo"], commits = medir(lambda: list(cg._parsear_lote(registros, False, None)), repeticiones)
+    etapas["version"], version = medir(lambda: cg.siguiente_version(commits, tag), repeticiones)
+
+    changelog = os.path.join(directorio, "CHANGELOG.md")
+
+    def renderizar():
+        with open(changelog, "w", encoding="utf-8") as f:
+            f.write("# Changelog\n\n" + cg.renderizar_seccion(commits, version))
+
+    etapas["renderizado"], _ = medir(renderizar, repeticiones)
+    etapas["metricas"], _ = medir(lambda: cg.calcular_metricas(commits), repeticiones)
+    return etapas, len(commits), tag
+
+
+def evaluar_umbrales(etapas, total_commits: int, umbrales):
+    """
+    Comparar los tiempos con los umbrales. Devuelve la lista de etapas que los superan.
+    """
+    regresiones = []
+    for etapa, umbral in umbrales.items():
+        if etapa not in etapas:
+            continue
+        segundos = etapas[etapa]
+        if "max_segundos" in umbral and segundos > umbral["max_segundos"]:
+            regresiones.append(f"{etapa}: {segundos:.3f}s > {umbral['max_segundos']}s")
+        us_por_commit = segundos * 1e6 / max(total_commits, 1)
+        if "max_us_por_commit" in umbral and us_por_commit > umbral["max_us_por_commit"]:
+            regresiones.append(f"{etapa}: {us_por_commit:.2f} µs/commit > {umbral['max_us_por_commit']} µs/commit")
+    return regresiones
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--commits", type=int, default=50000)
+    parser.add_argument("--tags", type=int, default=50)
+    parser.add_argument("--cuerpo", choices=sorted(DISTRIBUCIONES_CUERPO), default="mixto")
+    parser.add_argument("--ramas", type=int, default=20, help="Crear una rama con merge cada R commits (0: lineal)")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument(
+        "--rango",
+        choices=["completo", "ultimo"],
+        default="completo",
+        help="Medir desde el primer tag (v0.1.0) o desde el último tag (por defecto: completo)",
+    )
+    parser.add_argument("--repo", type=str, help="Usar un repositorio existente en lugar de uno sintético")
+    parser.add_argument("--salida", type=str, default="bench_pipeline.json")
+    parser.add_argument("--umbrales", type=str, default=UMBRALES_POR_DEFECTO, help="Archivo JSON de umbrales ('' para no evaluar)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        t_generacion = None
+        repo_path = args.repo
+        if not repo_path:
+            inicio = time.perf_counter()
+            repo_path = str(
+                generar_repo_sintetico(
+                    f"{tmp}/repo", args.commits, args.semilla, tags=args.tags, cuerpo=args.cuerpo, ramas=args.ramas
+                )
+            )
+            t_generacion = time.perf_counter() - inicio
+        desde = "v0.1.0" if args.rango == "completo" else None
+        etapas, total_commits, tag = medir_etapas(repo_path, args.repeticiones, tmp, desde)
+
+    umbrales = {}
+    if args.umbrales:
+        with open(args.umbrales, encoding="utf-8") as f:
+            umbrales = json.load(f)
+    regresiones = evaluar_umbrales(etapas, total_commits, umbrales)
+
+    resultados = {
+        "parametros": {
+            "commits": args.commits,
+            "tags": args.tags,
+            "cuerpo": args.cuerpo,
+            "ramas": args.ramas,
+            "semilla": args.semilla,
+            "repeticiones": args.repeticiones,
+            "rango": args.rango,
+            "repo": args.repo,
+        },
+        "entorno": {
+            "python": platform.python_version(),
+            "git": subprocess.run(  # nosec B603 B607
+                ["git", "--version"], capture_output=True, text=True
+            ).stdout.strip(),
+            "plataforma": platform.platform(),
+        },
+        "generacion_segundos": t_generacion,
+        "tag": tag,
+        "commits_en_rango": total_commits,
+        "etapas": {
+            etapa: {
+                "segundos": round(segundos, 6),
+                "us_por_commit": round(segundos * 1e6 / max(total_commits, 1), 3),
+            }
+            for etapa, segundos in etapas.items()
+        },
+        "umbrales": umbrales,
+        "regresiones": regresiones,
+    }
+    with open(args.salida, "w", encoding="utf-8") as f:
+        json.dump(resultados, f, indent=2, ensure_ascii=False)
+
+    if t_generacion is not None:
+        print(f"repositorio sintético: {args.commits} commits en {t_generacion:.2f}s")
+    print(f"rango {tag}..HEAD: {total_commits} commits")
+    for etapa, datos in resultados["etapas"].items():
+        print(f"{etapa:<13} {datos['segundos']:8.4f}s  {datos['us_por_commit']:8.2f} µs/commit")
+    print(f"Resultados guardados en {args.salida}")
+
+    if regresiones:
+        print("Etapas por encima del umbral:")
+        for regresion in regresiones:
+            print(f"  {regresion}")
+        sys.exit(1)
@@ -0,0 +1,68 @@
+"""
+bench_ramas.py
+
+Compara la vista previa de versión de muchas ramas con un recorrido por rama
+(`iter_parsed_commits` + `siguiente_version` para cada una) contra el recorrido
+compartido de `previsualizar_ramas`, sobre un repositorio sintético.
+
+Uso:
+    python -m benchmarks.bench_ramas [--commits N] [--ramas R] [--semilla S]
+
+Las ramas apuntan a commits elegidos al azar en la mitad más reciente del historial,
+de modo que comparten la mayor parte de su rango desde v0.1.0. Se verifica que
+ambos métodos den la misma versión y el mismo changelog para cada rama.
+"""
+
+import argparse
+import random
+import tempfile
+import time
+
+from git import Repo
+
+from benchmarks.synthetic_repo import generar_repo_sintetico
+from scripts import changelog_generator as cg
+from scripts.ramas import previsualizar_ramas
+
+TAG = "v0.1.0"
+
+
+def por_rama(repo_path: str, nombres):
+    resultado = {}
+    for nombre in nombres:
+        commits = list(cg.iter_parsed_commits(repo_path, since=TAG, until=nombre))
+        version = cg.siguiente_version(commits, TAG)
+        resultado[nombre] = (version, cg.renderizar_seccion(commits, version) if commits else "")
+    return resultado
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--commits", type=int, default=20000)
+    parser.add_argument("--ramas", type=int, default=100)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo_path = str(generar_repo_sintetico(f"{tmp}/repo", args.commits, args.semilla, ramas=20))
+        repo = Repo(repo_path)
+        historial = repo.git.rev_list("--first-parent", "HEAD").split()
+        azar = random.Random(args.semilla)
+        nombres = [f"rama-{i}" for i in range(args.ramas)]
+        for nombre in nombres:
+            repo.git.update_ref(f"refs/heads/{nombre}", azar.choice(historial[: len(historial) // 2]))
+
+        inicio = time.perf_counter()
+        esperado = por_rama(repo_path, nombres)
+        separado = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        resumen = previsualizar_ramas(repo_path, [f"refs/heads/{n}" for n in nombres], TAG)
+        compartido = time.perf_counter() - inicio
+
+    obtenido = {r["rama"]: (r["version"], r["changelog"]) for r in resumen["ramas"]}
+    assert obtenido == esperado
+
+    print(f"{args.ramas} ramas, {resumen['commits_recorridos']} commits recorridos")
+    print(f"{'un recorrido por rama':<24} {separado:8.2f}s")
+    print(f"{'recorrido compartido':<24} {compartido:8.2f}s  ({separado / compartido:.1f}x)")
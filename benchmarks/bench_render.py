@@ -0,0 +1,111 @@
+"""
+bench_render.py
+
+Compara la generación de las notas de release en todos los formatos incluidos
+(md, html, json, slack) con una pasada por formato y `string.Template.substitute`
+por pieza, contra `renderizar_notas`, que agrupa una vez y usa las plantillas
+compiladas.
+
+Uso:
+    python -m benchmarks.bench_render [--commits N] [--semilla S]
+
+Los commits se generan en memoria, sin repositorio. Se verifica que ambos métodos
+produzcan los mismos archivos.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from string import Template
+
+from scripts.changelog_generator import TIPO_TO_TITULO
+from scripts.render import ESCAPES, PLANTILLAS_BASE, renderizar_notas
+
+TIPOS = list(TIPO_TO_TITULO)
+
+
+def commits_sinteticos(cantidad: int, semilla: int):
+    azar = random.Random(semilla)
+    return [
+        {
+            "commit": f"{i:040x}",
+            "mensaje": {
+                "tipo": azar.choice(TIPOS),
+                "escopo": azar.choice([None, "api", "ui"]),
+                "descripcion": f"cambio <{i}> & \"{azar.randrange(10**6)}\"",
+            },
+        }
+        for i in range(cantidad)
+    ]
+
+
+def por_formato(commits, version: str, destinos):
+    """
+    Una pasada sobre los commits por formato, sustituyendo cada pieza con string.Template.
+    """
+    for formato, archivo in destinos.items():
+        definicion = PLANTILLAS_BASE[formato]
+        escapar = ESCAPES[definicion.get("escape", "ninguno")]
+
+        def pieza(nombre, valores):
+            return Template(definicion.get(nombre, "")).substitute({k: escapar(v) for k, v in valores.items()})
+
+        grupos = {}
+        for c in commits:
+            grupos.setdefault(c["mensaje"]["tipo"], []).append(c)
+        generales = {"version": version, "total": str(len(commits))}
+        partes = [pieza("encabezado", generales)]
+        secciones = []
+        for tipo, titulo in TIPO_TO_TITULO.items():
+            if tipo not in grupos:
+                continue
+            seccion = {"tipo": tipo, "titulo": titulo.lstrip("# "), "cantidad": str(len(grupos[tipo]))}
+            items = [
+                pieza(
+                    "item",
+                    {
+                        "descripcion": c["mensaje"]["descripcion"],
+                        "escopo": c["mensaje"]["escopo"] or "",
+                        "tipo": tipo,
+                        "commit": c["commit"],
+                        "commit_corto": c["commit"][:7],
+                    },
+                )
+                for c in grupos[tipo]
+            ]
+            cuerpo = definicion.get("separador_items", "").join(items)
+            secciones.append(pieza("seccion", seccion) + cuerpo + pieza("fin_seccion", seccion))
+        partes.append(definicion.get("separador_secciones", "").join(secciones))
+        partes.append(pieza("pie", generales))
+        with open(archivo, "w", encoding="utf-8") as f:
+            f.write("".join(partes))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--commits", type=int, default=200000)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    commits = commits_sinteticos(args.commits, args.semilla)
+    with tempfile.TemporaryDirectory() as tmp:
+        base = {f: os.path.join(tmp, f"base.{f}") for f in PLANTILLAS_BASE}
+        nuevo = {f: os.path.join(tmp, f"nuevo.{f}") for f in PLANTILLAS_BASE}
+
+        inicio = time.perf_counter()
+        por_formato(commits, "v1.0.0", base)
+        separado = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        renderizar_notas(commits, "v1.0.0", nuevo)
+        compartido = time.perf_counter() - inicio
+
+        for formato in PLANTILLAS_BASE:
+            with open(base[formato], encoding="utf-8") as a, open(nuevo[formato], encoding="utf-8") as b:
+                assert a.read() == b.read(), formato
+
+    print(f"{args.commits} commits, {len(PLANTILLAS_BASE)} formatos")
+    print(f"{'una pasada por formato':<24} {separado:8.2f}s")
+    print(f"{'renderizar_notas':<24} {compartido:8.2f}s  ({separado / compartido:.1f}x)")
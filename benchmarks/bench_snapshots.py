@@ -0,0 +1,72 @@
+"""
+bench_snapshots.py
+
+Mide el registro de snapshots de métricas por release y la consulta de tendencias
+sobre un repositorio sintético con varios tags.
+
+Uso:
+    python -m benchmarks.bench_snapshots [--commits N] [--tags T] [--ultimos U]
+
+Mediciones:
+- registro inicial: snapshots de todos los tags (recorre el historial una vez).
+- registro incremental: un commit y un tag nuevos; solo se recorre ese rango.
+- tendencia recorriendo git: métricas de los últimos U releases con `iter_parsed_commits`
+  y `calcular_metricas`, como habría que hacerlo sin snapshots.
+- tendencia desde snapshots: `AlmacenSnapshots.ultimos(U)`, sin git.
+"""
+
+import argparse
+import tempfile
+import time
+
+from git import Repo
+
+from benchmarks.synthetic_repo import generar_repo_sintetico
+from scripts import changelog_generator as cg
+from scripts.snapshots import AlmacenSnapshots, registrar_snapshots, tags_semanticos
+
+
+def medir(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return time.perf_counter() - inicio, resultado
+
+
+def tendencia_git(repo_path: str, tags, ultimos: int):
+    nombres = [tag for tag, _ in tags]
+    resultado = []
+    for i in range(max(0, len(nombres) - ultimos), len(nombres)):
+        anterior = nombres[i - 1] if i else None
+        commits = list(cg.iter_parsed_commits(repo_path, since=anterior, until=nombres[i]))
+        resultado.append(cg.calcular_metricas(commits)["throughput_commits_por_dia"] if commits else 0.0)
+    return resultado
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--commits", type=int, default=200000)
+    parser.add_argument("--tags", type=int, default=100)
+    parser.add_argument("--ultimos", type=int, default=20)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo_path = str(generar_repo_sintetico(f"{tmp}/repo", args.commits, args.semilla, tags=args.tags))
+        repo = Repo(repo_path)
+        tiempos = {}
+        with AlmacenSnapshots(f"{tmp}/snapshots.sqlite") as almacen:
+            tiempos["registro inicial"], _ = medir(lambda: registrar_snapshots(repo_path, almacen))
+            repo.index.commit("feat: nuevo release")
+            repo.create_tag("v99.0.0")
+            tiempos["registro incremental"], nuevos = medir(lambda: registrar_snapshots(repo_path, almacen))
+            assert nuevos == ["v99.0.0"]
+
+            tags = tags_semanticos(repo)
+            tiempos["tendencia recorriendo git"], esperado = medir(lambda: tendencia_git(repo_path, tags, args.ultimos))
+            tiempos["tendencia desde snapshots"], snapshots = medir(lambda: almacen.ultimos(args.ultimos))
+
+    assert [s["throughput_commits_por_dia"] for s in snapshots] == esperado
+
+    print(f"{args.commits} commits, {len(tags)} tags, últimos {args.ultimos} releases")
+    for nombre, segundos in tiempos.items():
+        print(f"{nombre:<28} {segundos * 1000:10.1f} ms")
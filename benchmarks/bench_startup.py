@@ -0,0 +1,68 @@
+"""
+bench_startup.py
+
+Mide el costo de arranque del subcomando `validate` que usan los hooks de git.
+
+Se ejecuta `python -S -X importtime -m scripts.changelog_generator validate` y se suma
+el tiempo propio de cada módulo importado, que es el costo que agrega el proyecto por
+encima del intérprete. También se informa el tiempo total de la ejecución y los
+módulos más costosos.
+
+Uso:
+    python -m benchmarks.bench_startup [--repeticiones N] [--max-ms M]
+
+El script termina con código 1 si el tiempo de importación supera M milisegundos
+(por defecto 30) o si se carga alguno de los módulos pesados.
+"""
+
+import argparse
+import subprocess  # nosec B404
+import sys
+import time
+
+COMANDO = [sys.executable, "-S", "-X", "importtime", "-m", "scripts.changelog_generator",
+           "validate", "feat: medir arranque"]
+
+MODULOS_PESADOS = ("git", "requests", "urllib3", "logging", "sqlite3", "argparse")
+
+
+def medir_importaciones():
+    """
+    Ejecutar el subcomando una vez y devolver (tiempo total en ms, tiempos propios por módulo en ms).
+    """
+    inicio = time.perf_counter()
+    proc = subprocess.run(COMANDO, capture_output=True, text=True, check=True)  # nosec B603
+    total = (time.perf_counter() - inicio) * 1000
+
+    modulos = {}
+    for linea in proc.stderr.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        propio, _, nombre = linea[len("import time:"):].split("|")
+        modulos[nombre.strip()] = int(propio) / 1000
+    return total, modulos
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeticiones", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=30.0)
+    args = parser.parse_args()
+
+    mediciones = [medir_importaciones() for _ in range(args.repeticiones)]
+    total, modulos = min(mediciones, key=lambda m: sum(m[1].values()))
+    importacion = sum(modulos.values())
+
+    print(f"Tiempo total de `validate`: {min(m[0] for m in mediciones):.1f} ms")
+    print(f"Tiempo de importación:      {importacion:.1f} ms (máximo {args.max_ms:.0f} ms)")
+    print("Módulos más costosos:")
+    for nombre, ms in sorted(modulos.items(), key=lambda m: -m[1])[:8]:
+        print(f"  {ms:6.2f} ms  {nombre}")
+
+    pesados = [m for m in modulos if m.split(".")[0] in MODULOS_PESADOS]
+    if pesados:
+        print(f"Se cargaron módulos pesados: {', '.join(pesados)}")
+        sys.exit(1)
+    if importacion > args.max_ms:
+        print("Regresión: el arranque de `validate` supera el máximo")
+        sys.exit(1)
@@ -0,0 +1,139 @@
+"""
+synthetic_repo.py
+
+Generador de repositorios Git sintéticos para benchmarks.
+
+Los commits se escriben con un único `git fast-import`, que crea miles de commits por
+segundo sin pasar por el índice ni por GitPython. Con la misma semilla y los mismos
+parámetros se obtiene siempre el mismo repositorio (los mismos hashes).
+"""
+
+import random
+import subprocess  # nosec B404
+from pathlib import Path
+
+TIPOS = ["feat", "fix", "chore", "docs", "refactor", "test", "perf", "ci"]
+
+# Cantidad de líneas del cuerpo de cada commit: (valores posibles, pesos)
+DISTRIBUCIONES_CUERPO = {
+    "fijo": ([1], [1]),
+    "corto": ([0, 1, 2], [70, 25, 5]),
+    "mixto": ([0, 1, 3, 10, 40], [40, 30, 18, 10, 2]),
+    "largo": ([5, 20, 80, 200], [40, 35, 20, 5]),
+}
+
+# Commits de cada rama antes de volver a integrarse en main
+LARGO_RAMA = 3
+
+
+def _mensaje(rnd: random.Random, i: int, cuerpo: str = "fijo") -> str:
+    """
+    Generar un mensaje de commit convencional (o uno libre cada 20 commits).
+    """
+    if i % 20 == 0:
+        return f"actualizar archivo {i}\n"
+    tipo = rnd.choice(TIPOS)
+    escopo = f"(mod{rnd.randint(1, 9)})" if rnd.random() < 0.5 else ""
+    if cuerpo == "fijo":
+        texto = f"Cuerpo del commit {i}.\n"
+    else:
+        valores, pesos = DISTRIBUCIONES_CUERPO[cuerpo]
+        lineas = rnd.choices(valores, pesos)[0]
+        texto = "".join(f"Línea {n} del cuerpo del commit {i}, con detalle del cambio.\n" for n in range(lineas))
+    return f"{tipo}{escopo}: cambio sintético número {i}\n" + (f"\n{texto}" if texto else "")
+
+
+def generar_repo_sintetico(
+    ruta,
+    commits: int = 50000,
+    semilla: int = 0,
+    tags: int = 1,
+    cuerpo: str = "fijo",
+    ramas: int = 0,
+) -> Path:
+    """
+    Crear un repositorio sintético en la rama main.
+
+    Con los valores por defecto se crean `commits` commits lineales y un tag v0.1.0 en el primero.
+
+    Argumentos
+    ----------
+    ruta: str | Path
+        Directorio donde se inicializa el repositorio
+    commits: int
+        Cantidad total de commits a generar (incluye commits de ramas y merges)
+    semilla: int
+        Semilla para que el repositorio sea reproducible
+    tags: int
+        Cantidad de tags semánticos (v0.1.0, v0.2.0, ...) repartidos en main; el primero
+        siempre está en el primer commit
+    cuerpo: str
+        Distribución del largo del cuerpo de los mensajes (ver DISTRIBUCIONES_CUERPO)
+    ramas: int
+        Si es mayor que 0, cada `ramas` commits de main se crea una rama de LARGO_RAMA
+        commits que se integra con un commit de merge
+
+    Retorna
+    -------
+    Path
+        Ruta del repositorio generado
+    """
+    if cuerpo not in DISTRIBUCIONES_CUERPO:
+        raise ValueError(f"Distribución de cuerpo desconocida: {cuerpo}")
+    ruta = Path(ruta)
+    ruta.mkdir(parents=True, exist_ok=True)
+    subprocess.run(["git", "init", "-q", str(ruta)], check=True)  # nosec B603 B607
+
+    rnd = random.Random(semilla)
+    inicio = 1_600_000_000
+    # Posiciones aproximadamente equidistantes de los tags; cada tag se crea en el
+    # primer commit de main que alcanza su posición
+    posiciones_tags = [1 + k * commits // max(tags, 1) for k in range(tags)]
+    siguiente_tag = 0
+    proc = subprocess.Popen(  # nosec B603 B607
+        ["git", "fast-import", "--quiet"], cwd=ruta, stdin=subprocess.PIPE
+    )
+
+    def escribir_commit(i, ref, mensaje, desde=None, merge=None):
+        mensaje = mensaje.encode("utf-8")
+        contenido = f"linea {i}\n".encode("utf-8")
+        firma = f"Bench <bench@example.com> {inicio + i * 600} +0000"
+        bloque = (
+            f"commit {ref}\nmark :{i}\n"
+            f"author {firma}\ncommitter {firma}\n"
+            f"data {len(mensaje)}\n"
+        ).encode("utf-8") + mensaje
+        if desde:
+            bloque += f"\nfrom :{desde}".encode("utf-8")
+        if merge:
+            bloque += f"\nmerge :{merge}".encode("utf-8")
+        bloque += f"\nM 644 inline archivo{i % 10}.txt\ndata {len(contenido)}\n".encode("utf-8")
+        bloque += contenido + b"\n"
+        proc.stdin.write(bloque)
+
+    i = 0
+    en_main = 0
+    while i < commits:
+        i += 1
+        en_main += 1
+        if ramas and en_main % ramas == 0 and commits - i >= LARGO_RAMA:
+            # Rama desde el último commit de main, integrada con un merge
+            base = i - 1
+            rama = f"refs/heads/rama{i}"
+            for n in range(LARGO_RAMA):
+                escribir_commit(i, rama, _mensaje(rnd, i, cuerpo), desde=base if n == 0 else None)
+                i += 1
+            escribir_commit(i, "refs/heads/main", f"Merge branch 'rama{i - LARGO_RAMA}'\n", merge=i - 1)
+        else:
+            escribir_commit(i, "refs/heads/main", _mensaje(rnd, i, cuerpo))
+        while siguiente_tag < tags and i >= posiciones_tags[siguiente_tag]:
+            siguiente_tag += 1
+            proc.stdin.write(f"reset refs/tags/v0.{siguiente_tag}.0\nfrom :{i}\n\n".encode("utf-8"))
+    proc.stdin.close()
+    if proc.wait() != 0:
+        raise RuntimeError("git fast-import terminó con error")
+
+    subprocess.run(  # nosec B603 B607
+        ["git", "symbolic-ref", "HEAD", "refs/heads/main"], cwd=ruta, check=True
+    )
+    return ruta
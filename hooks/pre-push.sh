@@ -2,26 +2,26 @@
 
 # pre-push: revisa que todos los commits pendientes por subir al remoto tengan un formato válido. Si encuentra errores, se impide el push.
 
-# obtener el nombre de la rama actual
-branch=$(git rev-parse --abbrev-ref HEAD)
+# git entrega por stdin una línea por referencia: <ref local> <sha local> <ref remota> <sha remota>
+# el hash nulo tiene el largo del formato de objetos del repositorio (SHA-1 o SHA-256)
+zero=$(git hash-object --stdin </dev/null | tr '[0-9a-f]' '0')
 
-# obtener los mensajes de commits que aún no han sido enviados al remoto
-commits=$(git log origin/$branch..HEAD --pretty=format:"%s")
+status=0
+while read -r local_ref local_sha remote_ref remote_sha; do
+  # se está borrando la rama remota: no hay commits que revisar
+  if [ "$local_sha" = "$zero" ]; then
+    continue
+  fi
 
-# expresión regular que define un mensaje válido
-# tipo(scope opcional): descripción
-pattern="^(feat|fix|chore|docs|refactor|test|style|perf|ci|build|revert)(!)?(\([^)]+\))?: .+"
+  if [ "$remote_sha" = "$zero" ]; then
+    # rama nueva: revisar solo los commits que ningún remoto conoce
+    range="$local_sha --not --remotes"
+  else
+    range="$remote_sha..$local_sha"
+  fi
 
-# filtrar mensajes que no cumplen con el formato esperado
-invalids=$(echo "$commits" | grep -Ev "$pattern")
+  # el validador reporta todos los commits inválidos con su hash; los ya validados se omiten
+  python -S -m scripts.changelog_generator validate --range "$range" || status=1
+done
 
-# impedir el push si existen commits inválidos
-if [ -n "$invalids" ]; then
-  echo "Existen commits pendientes con formato inválido:"
-  echo "$invalids"
-  echo "Referencia: https://www.conventionalcommits.org/en/v1.0.0/"
-  exit 1
-fi
-
-echo "Todos los commits pendientes tienen formato válido"
-exit 0
+exit $status
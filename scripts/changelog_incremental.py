@@ -0,0 +1,208 @@
+"""
+changelog_incremental.py
+
+Actualización incremental de CHANGELOG.md.
+
+En lugar de reescribir el archivo con una sola versión, se agrega la sección de la
+nueva versión al inicio o se reemplaza la sección existente de esa versión. La
+ubicación de cada encabezado "## vX.Y.Z" se guarda en un índice junto al archivo
+(<archivo>.idx), validado con el tamaño y la fecha de modificación. Así no es necesario
+leer ni parsear el changelog en cada ejecución; solo se vuelve a escanear si el
+archivo se editó por fuera.
+
+El archivo nuevo se arma en un temporal copiando los rangos sin cambios por bloques
+y se reemplaza de forma atómica con os.replace, conservando los permisos del original.
+"""
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+from typing import Dict, Iterable, List
+
+from scripts.changelog_generator import renderizar_seccion
+
+ENCABEZADO = b"# Changelog\n"
+
+TAMANO_BLOQUE = 1 << 20
+
+
+def _huella(contenido: bytes) -> str:
+    return hashlib.sha1(contenido).hexdigest()  # nosec B324
+
+
+def _estado_archivo(ruta: str) -> Dict:
+    st = os.stat(ruta)
+    return {"tamano": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _escanear(ruta: str) -> List[List]:
+    """
+    Reconstruir el índice leyendo el archivo línea por línea.
+
+    Retorna
+    -------
+    List[List]
+        [version, offset, largo, huella] por sección, en el orden del archivo.
+        El largo no incluye la línea en blanco que separa una sección de la siguiente
+    """
+    inicios = []
+    offset = 0
+    with open(ruta, "rb") as f:
+        for linea in f:
+            if linea.startswith(b"## "):
+                inicios.append((linea[3:].strip().decode("utf-8"), offset))
+            offset += len(linea)
+
+    secciones = []
+    with open(ruta, "rb") as f:
+        for i, (version, inicio) in enumerate(inicios):
+            ultima = i == len(inicios) - 1
+            fin = offset if ultima else inicios[i + 1][1] - 1
+            f.seek(inicio)
+            contenido = f.read(fin - inicio)
+            secciones.append([version, inicio, fin - inicio, _huella(contenido)])
+    return secciones
+
+
+def _reemplazar(temporal: str, ruta: str) -> None:
+    """
+    Mover `temporal` a `ruta` con los permisos de `ruta`, o los de un archivo nuevo.
+
+    mkstemp crea los temporales con modo 0600; sin esto cada ejecución dejaría el
+    changelog legible solo por el dueño.
+    """
+    try:
+        modo = stat.S_IMODE(os.stat(ruta).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        modo = 0o666 & ~umask
+    os.chmod(temporal, modo)
+    os.replace(temporal, ruta)
+
+
+def leer_indice(ruta: str) -> List[List]:
+    """
+    Obtener el índice de secciones de un changelog, reconstruyéndolo si está desactualizado.
+
+    Argumentos
+    ----------
+    ruta : str
+        Ruta del changelog
+
+    Retorna
+    -------
+    List[List]
+        [version, offset, largo, huella] por sección, en el orden del archivo
+    """
+    try:
+        with open(ruta + ".idx", encoding="utf-8") as f:
+            indice = json.load(f)
+        if indice["archivo"] == _estado_archivo(ruta):
+            return indice["secciones"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return _escanear(ruta)
+
+
+def _guardar_indice(ruta: str, secciones: List[List]) -> None:
+    indice = {"archivo": _estado_archivo(ruta), "secciones": secciones}
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    fd, temporal = tempfile.mkstemp(dir=directorio, prefix=".changelog-idx-")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(indice, f)
+    _reemplazar(temporal, ruta + ".idx")
+
+
+def _copiar_rango(origen, destino, inicio: int, fin: int) -> None:
+    origen.seek(inicio)
+    restante = fin - inicio
+    while restante > 0:
+        bloque = origen.read(min(TAMANO_BLOQUE, restante))
+        if not bloque:
+            break
+        destino.write(bloque)
+        restante -= len(bloque)
+
+
+def actualizar_changelog_md(
+    parsed_commits: Iterable[Dict], version: str, archivo_salida: str = "CHANGELOG.md"
+) -> bool:
+    """
+    Agregar o reemplazar la sección de una versión en CHANGELOG.md, conservando las anteriores.
+
+    Si la versión no existe, su sección se agrega antes de la más reciente. Si ya existe,
+    se reemplaza solo esa sección. Volver a ejecutar con el mismo contenido no modifica
+    el archivo.
+
+    Argumentos
+    ----------
+    parsed_commits : Iterable[Dict]
+        Commits parseados (lista o generador)
+    version : str
+        Versión de la sección
+    archivo_salida : str
+        Ruta del changelog
+
+    Retorna
+    -------
+    bool
+        True si el archivo se modificó
+    """
+    nueva = renderizar_seccion(parsed_commits, version).encode("utf-8")
+    huella = _huella(nueva)
+
+    if not os.path.exists(archivo_salida):
+        secciones = []
+        inicio = fin = len(ENCABEZADO) + 1
+        prefijo = separador = b""
+        pos = 0
+    else:
+        secciones = leer_indice(archivo_salida)
+        existentes = [s[0] for s in secciones]
+        if version in existentes:
+            pos = existentes.index(version)
+            _, inicio, largo, huella_actual = secciones[pos]
+            if huella_actual == huella:
+                print(f"La sección '{version}' de '{archivo_salida}' ya está actualizada")
+                return False
+            fin = inicio + largo
+            prefijo = separador = b""
+            secciones.pop(pos)
+        else:
+            # Antes de la sección más reciente, o al final si el archivo no tiene secciones
+            pos = 0
+            if secciones:
+                inicio = fin = secciones[0][1]
+                prefijo, separador = b"", b"\n"
+            else:
+                inicio = fin = os.path.getsize(archivo_salida)
+                prefijo, separador = b"\n", b""
+
+    directorio = os.path.dirname(os.path.abspath(archivo_salida))
+    fd, temporal = tempfile.mkstemp(dir=directorio, prefix=".changelog-")
+    try:
+        with os.fdopen(fd, "wb") as destino:
+            if os.path.exists(archivo_salida):
+                with open(archivo_salida, "rb") as origen:
+                    _copiar_rango(origen, destino, 0, inicio)
+                    destino.write(prefijo + nueva + separador)
+                    _copiar_rango(origen, destino, fin, os.path.getsize(archivo_salida))
+            else:
+                destino.write(ENCABEZADO + b"\n" + nueva)
+        _reemplazar(temporal, archivo_salida)
+    except BaseException:
+        os.remove(temporal)
+        raise
+
+    # Desplazar las secciones posteriores según la diferencia de tamaño
+    delta = len(prefijo) + len(nueva) + len(separador) - (fin - inicio)
+    for seccion in secciones[pos:]:
+        seccion[1] += delta
+    secciones.insert(pos, [version, inicio + len(prefijo), len(nueva), huella])
+    _guardar_indice(archivo_salida, secciones)
+
+    print(f"Sección '{version}' actualizada en '{archivo_salida}'")
+    return True
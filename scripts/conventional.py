@@ -0,0 +1,302 @@
+"""
+conventional.py
+
+Parser de mensajes de commit convencionales.
+
+Este módulo solo depende de la biblioteca estándar y no tiene efectos al
+importarse, para que los hooks de git puedan validar mensajes sin cargar
+GitPython ni requests.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from collections.abc import Mapping
+
+# typing solo se usa en anotaciones (que no se evalúan gracias a `annotations`);
+# no se importa en ejecución porque su carga domina el arranque de los hooks.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+# Regex para parsear mensajes convencionales de commits.
+COMMIT_REGEX = r"^(feat|fix|chore|docs|refactor|test|style|perf|ci|build|revert)(!)?(\([^)]+\))?: (.+)$"
+
+# Se incrementa al cambiar la estructura que devuelve parse_commit_message,
+# para invalidar los resultados guardados en la caché de parseo.
+PARSER_VERSION = 1
+
+
+def version_parser() -> str:
+    """
+    Identificador del parser actual, derivado de PARSER_VERSION y COMMIT_REGEX.
+    """
+    import hashlib
+
+    return hashlib.sha1(f"{PARSER_VERSION}:{COMMIT_REGEX}".encode("utf-8")).hexdigest()[:16]  # nosec B324
+
+
+# Patrón precompilado, compartido por el parseo individual y el parseo por lotes
+COMMIT_PATTERN = re.compile(COMMIT_REGEX)
+
+
+class CommitParseado(Mapping):
+    """
+    Registro compacto de un commit convencional parseado.
+
+    Con `cuerpo_lazy` el cuerpo del mensaje se guarda sin procesar y solo se limpia
+    la primera vez que se accede a `cuerpo`. Los registros creados con `compactar`
+    (o `desde_mensaje`) además guardan el hash como bytes (20 bytes en lugar de un
+    str de 40 caracteres) e internan tipo, escopo y autor para que los valores
+    repetidos compartan un único objeto; el constructor guarda los valores tal cual,
+    sin ese costo.
+
+    También se comporta como un Mapping de solo lectura con la estructura de
+    `parse_commit_message` (más "timestamp", "autor" y "stats" si se indicaron),
+    de modo que `registro["mensaje"]["tipo"]` y `registro.get("timestamp")` funcionan
+    como con los diccionarios. `to_dict()` devuelve una copia como diccionario.
+    """
+
+    __slots__ = ("_sha", "tipo", "escopo", "descripcion", "_cuerpo", "_resto", "timestamp", "_autor", "_stats")
+
+    def __init__(
+        self, commit, tipo, escopo, descripcion, cuerpo=None, resto=None, timestamp=None, autor=None, stats=None
+    ):
+        self._sha = commit
+        self.tipo = tipo
+        self.escopo = escopo
+        self.descripcion = descripcion
+        self._cuerpo = cuerpo
+        self._resto = resto
+        self.timestamp = timestamp
+        # (nombre, email)
+        self._autor = autor
+        # (archivos, inserciones, eliminaciones)
+        self._stats = stats
+
+    @classmethod
+    def compactar(
+        cls, commit, tipo, escopo, descripcion, cuerpo=None, resto=None, timestamp=None, autor=None, stats=None
+    ) -> CommitParseado:
+        """
+        Crear un registro con el hash en bytes y tipo, escopo y autor internados.
+
+        Conviene cuando se retienen muchos registros; para recorrerlos una vez, el
+        constructor evita la conversión.
+        """
+        try:
+            sha = bytes.fromhex(commit)
+        except ValueError:
+            # Identificadores que no son hashes (por ejemplo, en pruebas) se guardan tal cual
+            sha = commit
+        return cls(
+            sha,
+            sys.intern(tipo),
+            sys.intern(escopo) if escopo is not None else None,
+            descripcion,
+            cuerpo,
+            resto,
+            timestamp,
+            (sys.intern(autor[0]), sys.intern(autor[1])) if autor is not None else None,
+            stats,
+        )
+
+    @classmethod
+    def desde_mensaje(cls, commit_msg: str, commit_hash: str, **extras) -> CommitParseado:
+        """
+        Parsear un mensaje de commit convencional en un registro compactado, con el cuerpo lazy.
+
+        Argumentos
+        ----------
+        commit_msg: str
+          Mensaje de commit a analizar
+        commit_hash: str
+          Hash del commit
+        extras:
+          timestamp, autor (nombre, email) y stats (archivos, inserciones, eliminaciones)
+        """
+        tipo, escopo, descripcion, resto = _parse_header(commit_msg)
+        return cls.compactar(commit_hash, tipo, escopo, descripcion, resto=resto, **extras)
+
+    @property
+    def commit(self) -> str:
+        return self._sha.hex() if isinstance(self._sha, bytes) else self._sha
+
+    @property
+    def cuerpo(self) -> Optional[str]:
+        if self._resto is not None:
+            self._cuerpo = self._resto.strip() or None
+            self._resto = None
+        return self._cuerpo
+
+    def _claves(self) -> Tuple[str, ...]:
+        claves = ("commit", "mensaje")
+        if self.timestamp is not None:
+            claves += ("timestamp",)
+        if self._autor is not None:
+            claves += ("autor",)
+        if self._stats is not None:
+            claves += ("stats",)
+        return claves
+
+    def __getitem__(self, clave):
+        if clave == "commit":
+            return self.commit
+        if clave == "mensaje":
+            return VistaMensaje(self)
+        if clave == "timestamp" and self.timestamp is not None:
+            return self.timestamp
+        if clave == "autor" and self._autor is not None:
+            return {"nombre": self._autor[0], "email": self._autor[1]}
+        if clave == "stats" and self._stats is not None:
+            return dict(zip(("archivos", "inserciones", "eliminaciones"), self._stats))
+        raise KeyError(clave)
+
+    def __iter__(self):
+        return iter(self._claves())
+
+    def __len__(self):
+        return len(self._claves())
+
+    def to_dict(self) -> Dict:
+        """
+        Convertir el registro al diccionario que devuelve `parse_commit_message`
+        (más "timestamp", "autor" y "stats" si se indicaron).
+        """
+        resultado = {
+            "commit": self.commit,
+            "mensaje": {
+                "tipo": self.tipo,
+                "escopo": self.escopo,
+                "descripcion": self.descripcion,
+                "cuerpo": self.cuerpo,
+            },
+        }
+        for clave in self._claves()[2:]:
+            resultado[clave] = self[clave]
+        return resultado
+
+    def __repr__(self):
+        return f"CommitParseado({self.commit!r}, {self.tipo!r}, {self.escopo!r}, {self.descripcion!r})"
+
+
+class VistaMensaje(Mapping):
+    """
+    Vista de solo lectura de la clave "mensaje" de un CommitParseado, sin copiar sus campos.
+    """
+
+    __slots__ = ("_registro",)
+
+    _CLAVES = ("tipo", "escopo", "descripcion", "cuerpo")
+
+    def __init__(self, registro: CommitParseado):
+        self._registro = registro
+
+    def __getitem__(self, clave):
+        if clave not in self._CLAVES:
+            raise KeyError(clave)
+        return getattr(self._registro, clave)
+
+    def __iter__(self):
+        return iter(self._CLAVES)
+
+    def __len__(self):
+        return len(self._CLAVES)
+
+
+def _parse_header(commit_msg: str):
+    """
+    Separar el mensaje en encabezado y resto, y parsear el encabezado.
+
+    Retorna
+    -------
+    tuple
+      (tipo, escopo, descripcion, resto del mensaje sin limpiar)
+    """
+    commit_msg = commit_msg.strip()
+    fin = commit_msg.find("\n")
+    if fin < 0:
+        header, resto = commit_msg, ""
+    else:
+        header, resto = commit_msg[:fin], commit_msg[fin + 1:]
+
+    match = COMMIT_PATTERN.match(header)
+    if match is None:
+        return "otro", None, header, resto
+
+    tipo_base, breaking, escopo, descripcion = match.groups()
+    tipo = "BREAKING CHANGE" if breaking else tipo_base
+    return tipo, escopo[1:-1] if escopo else None, descripcion, resto
+
+
+def parse_commit_message(commit_msg: str, commit_hash: str) -> Dict:
+    """
+    Leer mensaje de commit convencional.
+
+    Argumentos
+    ----------
+    commit_msg: str
+      Mensaje de commit a analizar
+    commit_hash: str
+      Hash del commit
+
+    Retorna
+    -------
+    Dict
+      Diccionario con la información del commit
+    """
+    tipo, escopo, descripcion, resto = _parse_header(commit_msg)
+
+    return {
+        "commit": commit_hash,
+        "mensaje": {
+            "tipo": tipo,
+            "escopo": escopo,
+            "descripcion": descripcion,
+            "cuerpo": resto.strip() or None,
+        },
+    }
+
+
+def parse_commit_messages(
+    commits: Iterable[Tuple[str, str]], cuerpo_lazy: bool = False
+) -> Iterator[CommitParseado]:
+    """
+    Parsear varios mensajes de commit convencionales en una sola pasada.
+
+    Argumentos
+    ----------
+    commits: Iterable[Tuple[str, str]]
+      Pares (hash, mensaje) a analizar
+    cuerpo_lazy: bool
+      Postergar la limpieza del cuerpo hasta que se acceda a él
+
+    Retorna
+    -------
+    Iterator[CommitParseado]
+      Registros parseados, en el mismo orden de entrada
+    """
+    for commit_hash, commit_msg in commits:
+        tipo, escopo, descripcion, resto = _parse_header(commit_msg)
+        if cuerpo_lazy:
+            yield CommitParseado(commit_hash, tipo, escopo, descripcion, resto=resto)
+        else:
+            yield CommitParseado(commit_hash, tipo, escopo, descripcion, resto.strip() or None)
+
+
+def validar_mensaje(commit_msg: str) -> bool:
+    """
+    Verificar que el encabezado de un mensaje siga el formato de Conventional Commits.
+
+    Argumentos
+    ----------
+    commit_msg: str
+      Mensaje de commit a validar
+
+    Retorna
+    -------
+    bool
+      True si el encabezado es un commit convencional válido
+    """
+    return _parse_header(commit_msg)[0] != "otro"
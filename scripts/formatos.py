@@ -0,0 +1,507 @@
+"""
+formatos.py
+
+Formatos de salida para los commits parseados, con escritura en stream y lectura.
+
+Formatos:
+- json: arreglo JSON con indentación (formato histórico de parsed_commits.json)
+- ndjson: un objeto JSON compacto por línea; se puede leer en stream
+- msgpack: secuencia de objetos MessagePack; requiere el paquete opcional `msgpack`
+- columnar: una columna binaria por campo, alineada a 8 bytes, con un índice JSON al
+  final del archivo (al estilo de Parquet). Se lee con mmap sin copiar las columnas
+  numéricas y sin decodificar los textos que no se usan.
+
+json, ndjson y msgpack se pueden comprimir con gzip o zstd (paquete opcional
+`zstandard`). El formato columnar no se comprime, porque debe poder mapearse en memoria.
+"""
+
+import array
+import gzip
+import io
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from typing import Dict, IO, Iterable, Iterator, List, Optional
+
+FORMATOS = ("json", "ndjson", "msgpack", "columnar")
+
+COMPRESIONES = ("gzip", "zstd")
+
+EXTENSIONES = {"json": ".json", "ndjson": ".ndjson", "msgpack": ".msgpack", "columnar": ".col"}
+
+EXTENSIONES_COMPRESION = {"gzip": ".gz", "zstd": ".zst"}
+
+# Archivo columnar: MAGIA + columnas + índice JSON + largo del índice (<Q) + MAGIA
+MAGIA_COLUMNAR = b"CLGCOL1\n"
+
+# Columnas de texto con pocos valores distintos: códigos uint32 + diccionario en el índice
+COLUMNAS_DICCIONARIO = ("tipo", "escopo", "autor_nombre", "autor_email")
+# Columnas de texto libre: offsets uint64 (n + 1) + bytes UTF-8 concatenados,
+# con una columna uint8 que marca los valores None
+COLUMNAS_TEXTO = ("descripcion", "cuerpo")
+# Columnas enteras int64; -1 indica que el commit no tenía el campo
+COLUMNAS_ENTERAS = ("timestamp", "archivos", "inserciones", "eliminaciones")
+
+FALTANTE = -1
+
+
+def nombre_salida(base: str, formato: str, compresion: Optional[str] = None) -> str:
+    """
+    Construir el nombre de archivo por defecto para un formato y una compresión.
+    """
+    return base + EXTENSIONES[formato] + EXTENSIONES_COMPRESION.get(compresion, "")
+
+
+def inferir_formato(ruta: str):
+    """
+    Deducir (formato, compresión) a partir de la extensión del archivo.
+
+    Retorna
+    -------
+    Tuple[str, Optional[str]]
+        Formato y compresión; json sin comprimir si la extensión no es conocida
+    """
+    raiz, extension = os.path.splitext(ruta)
+    compresion = None
+    for nombre, ext in EXTENSIONES_COMPRESION.items():
+        if extension == ext:
+            compresion = nombre
+            raiz, extension = os.path.splitext(raiz)
+    if extension == ".jsonl":
+        return "ndjson", compresion
+    for formato, ext in EXTENSIONES.items():
+        if extension == ext:
+            return formato, compresion
+    return "json", compresion
+
+
+def _validar(formato: str, compresion: Optional[str]) -> None:
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconocido: {formato}")
+    if compresion is not None and compresion not in COMPRESIONES:
+        raise ValueError(f"Compresión desconocida: {compresion}")
+    if formato == "columnar" and compresion:
+        raise ValueError("El formato columnar no admite compresión (se lee con mmap)")
+
+
+def _importar_opcional(modulo: str, uso: str):
+    try:
+        return __import__(modulo)
+    except ImportError as e:
+        raise ImportError(f"Se requiere el paquete '{modulo}' para {uso} (pip install {modulo})") from e
+
+
+def _serializable(objeto):
+    """
+    Convertir los registros compactos (`CommitParseado`) a diccionarios al serializarlos.
+    """
+    if hasattr(objeto, "to_dict"):
+        return objeto.to_dict()
+    raise TypeError(f"Objeto de tipo {type(objeto).__name__} no serializable")
+
+
+def _abrir(ruta: str, modo: str, compresion: Optional[str]) -> IO[bytes]:
+    """
+    Abrir un archivo binario, comprimido o no. `modo` es "rb" o "wb".
+    """
+    if compresion == "gzip":
+        # Nivel 6: casi el tamaño del nivel 9 con una fracción del tiempo
+        return gzip.open(ruta, modo, compresslevel=6)
+    if compresion == "zstd":
+        zstandard = _importar_opcional("zstandard", "la compresión zstd")
+        f = open(ruta, modo)
+        if modo == "wb":
+            return zstandard.ZstdCompressor().stream_writer(f, closefd=True)
+        return zstandard.ZstdDecompressor().stream_reader(f, closefd=True)
+    return open(ruta, modo)
+
+
+def escribir_commits(
+    parsed_commits: Iterable[Dict],
+    archivo_salida: str,
+    formato: str = "json",
+    compresion: Optional[str] = None,
+) -> int:
+    """
+    Guardar commits parseados en el formato indicado, escribiendo cada commit apenas se recibe.
+
+    Argumentos
+    ----------
+    parsed_commits : Iterable[Dict]
+        Commits parseados (lista o generador)
+    archivo_salida : str
+        Ruta del archivo de salida
+    formato : str
+        Uno de FORMATOS
+    compresion : Optional[str]
+        None, "gzip" o "zstd"
+
+    Retorna
+    -------
+    int
+        Cantidad de commits escritos
+    """
+    _validar(formato, compresion)
+    if formato == "columnar":
+        return _escribir_columnar(parsed_commits, archivo_salida)
+
+    if formato == "msgpack":
+        msgpack = _importar_opcional("msgpack", "el formato msgpack")
+        empaquetar = msgpack.Packer(use_bin_type=True, default=_serializable).pack
+
+    total = 0
+    with _abrir(archivo_salida, "wb", compresion) as binario:
+        if formato == "msgpack":
+            for commit in parsed_commits:
+                binario.write(empaquetar(commit))
+                total += 1
+            return total
+
+        f = io.TextIOWrapper(binario, encoding="utf-8", write_through=False)
+        try:
+            if formato == "ndjson":
+                for commit in parsed_commits:
+                    f.write(json.dumps(commit, ensure_ascii=False, separators=(",", ":"), default=_serializable))
+                    f.write("\n")
+                    total += 1
+            else:
+                f.write("[")
+                for commit in parsed_commits:
+                    f.write(",\n  " if total else "\n  ")
+                    # Se reindenta cada elemento para mantener el formato de json.dump(indent=2)
+                    f.write(json.dumps(commit, indent=2, ensure_ascii=False, default=_serializable).replace("\n", "\n  "))
+                    total += 1
+                f.write("\n]" if total else "]")
+            f.flush()
+        finally:
+            f.detach()
+    return total
+
+
+def leer_commits(
+    archivo: str, formato: Optional[str] = None, compresion: Optional[str] = None
+) -> Iterator[Dict]:
+    """
+    Leer commits guardados con `escribir_commits`.
+
+    ndjson, msgpack y columnar se leen en stream; json carga el arreglo completo.
+
+    Argumentos
+    ----------
+    archivo : str
+        Ruta del archivo
+    formato : Optional[str]
+        Formato del archivo; si es None se deduce de la extensión
+    compresion : Optional[str]
+        Compresión del archivo; si formato es None también se deduce de la extensión
+
+    Retorna
+    -------
+    Iterator[Dict]
+        Commits con la misma estructura que devuelve `iter_parsed_commits`
+    """
+    if formato is None:
+        formato, compresion = inferir_formato(archivo)
+    _validar(formato, compresion)
+
+    if formato == "columnar":
+        with LectorColumnar(archivo) as lector:
+            yield from lector
+        return
+
+    with _abrir(archivo, "rb", compresion) as binario:
+        if formato == "msgpack":
+            msgpack = _importar_opcional("msgpack", "el formato msgpack")
+            yield from msgpack.Unpacker(binario, raw=False)
+        elif formato == "ndjson":
+            for linea in io.TextIOWrapper(binario, encoding="utf-8"):
+                if linea.strip():
+                    yield json.loads(linea)
+        else:
+            yield from json.load(io.TextIOWrapper(binario, encoding="utf-8"))
+
+
+class _ColumnaTexto:
+    """
+    Columna de texto libre en construcción: offsets en memoria y bytes en un archivo temporal.
+    """
+
+    def __init__(self):
+        self.offsets = array.array("Q", [0])
+        self.nulos = array.array("B")
+        self.datos = tempfile.TemporaryFile()
+        self.buffer: List[bytes] = []
+        self.posicion = 0
+
+    def agregar(self, texto: Optional[str]) -> None:
+        self.nulos.append(texto is None)
+        codificado = texto.encode("utf-8") if texto is not None else b""
+        self.posicion += len(codificado)
+        self.offsets.append(self.posicion)
+        self.buffer.append(codificado)
+        if len(self.buffer) >= 4096:
+            self.vaciar()
+
+    def vaciar(self) -> None:
+        self.datos.write(b"".join(self.buffer))
+        self.buffer.clear()
+
+
+def _escribir_columnar(parsed_commits: Iterable[Dict], archivo_salida: str) -> int:
+    shas = tempfile.TemporaryFile()
+    enteras = {nombre: array.array("q") for nombre in COLUMNAS_ENTERAS}
+    diccionarios = {nombre: {} for nombre in COLUMNAS_DICCIONARIO}
+    codigos = {nombre: array.array("I") for nombre in COLUMNAS_DICCIONARIO}
+    textos = {nombre: _ColumnaTexto() for nombre in COLUMNAS_TEXTO}
+    ancho_sha = None
+    total = 0
+
+    for commit in parsed_commits:
+        mensaje = commit["mensaje"]
+        autor = commit.get("autor") or {}
+        stats = commit.get("stats") or {}
+        sha = bytes.fromhex(commit["commit"])
+        if ancho_sha is None:
+            ancho_sha = len(sha)
+        elif len(sha) != ancho_sha:
+            raise ValueError(f"Hash con largo inesperado: {commit['commit']}")
+        shas.write(sha)
+
+        valores = {
+            "tipo": mensaje["tipo"],
+            "escopo": mensaje["escopo"] or "",
+            "autor_nombre": autor.get("nombre", ""),
+            "autor_email": autor.get("email", ""),
+        }
+        for nombre, valor in valores.items():
+            diccionario = diccionarios[nombre]
+            codigo = diccionario.get(valor)
+            if codigo is None:
+                codigo = diccionario[valor] = len(diccionario)
+            codigos[nombre].append(codigo)
+
+        enteras["timestamp"].append(commit.get("timestamp", FALTANTE))
+        for nombre in ("archivos", "inserciones", "eliminaciones"):
+            enteras[nombre].append(stats.get(nombre, FALTANTE))
+        textos["descripcion"].agregar(mensaje["descripcion"])
+        textos["cuerpo"].agregar(mensaje["cuerpo"])
+        total += 1
+
+    columnas = {}
+    with open(archivo_salida, "wb") as f:
+        f.write(MAGIA_COLUMNAR)
+
+        def alinear():
+            relleno = -f.tell() % 8
+            if relleno:
+                f.write(b"\0" * relleno)
+
+        def volcar(nombre, contenido):
+            alinear()
+            inicio = f.tell()
+            if isinstance(contenido, array.array):
+                contenido.tofile(f)
+            else:
+                contenido.seek(0)
+                shutil.copyfileobj(contenido, f)
+                contenido.close()
+            columnas[nombre] = [inicio, f.tell() - inicio]
+
+        volcar("commit", shas)
+        for nombre in COLUMNAS_ENTERAS:
+            volcar(nombre, enteras[nombre])
+        for nombre in COLUMNAS_DICCIONARIO:
+            volcar(nombre, codigos[nombre])
+        for nombre, columna in textos.items():
+            columna.vaciar()
+            volcar(nombre + ".offsets", columna.offsets)
+            volcar(nombre + ".nulos", columna.nulos)
+            volcar(nombre, columna.datos)
+
+        indice = {
+            "filas": total,
+            "ancho_sha": ancho_sha or 20,
+            "orden_bytes": sys.byteorder,
+            "columnas": columnas,
+            # Los diccionarios conservan el orden de inserción, que coincide con los códigos
+            "diccionarios": {nombre: list(d) for nombre, d in diccionarios.items()},
+        }
+        codificado = json.dumps(indice, ensure_ascii=False).encode("utf-8")
+        f.write(codificado)
+        f.write(struct.pack("<Q", len(codificado)))
+        f.write(MAGIA_COLUMNAR)
+    return total
+
+
+class LectorColumnar:
+    """
+    Lector de archivos columnares mapeados en memoria.
+
+    `columna(nombre)` devuelve un memoryview sobre el mmap, sin copiar, para las
+    columnas numéricas ("timestamp", "archivos", ..., y los códigos de las columnas
+    con diccionario). Los registros completos se arman bajo demanda con `lector[i]`
+    o iterando.
+    """
+
+    def __init__(self, ruta: str):
+        self._archivo = open(ruta, "rb")
+        try:
+            self._mmap = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap no acepta archivos vacíos
+            self._archivo.close()
+            raise ValueError(f"{ruta} no es un archivo columnar válido") from None
+        # Antes de validar, para que `cerrar()` pueda liberar todo en los errores
+        self._vista = memoryview(self._mmap)
+        self._vistas = {}
+        largo_magia = len(MAGIA_COLUMNAR)
+        if self._mmap[:largo_magia] != MAGIA_COLUMNAR or self._mmap[-largo_magia:] != MAGIA_COLUMNAR:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es un archivo columnar válido")
+        try:
+            fin_indice = len(self._mmap) - largo_magia - 8
+            (largo_indice,) = struct.unpack_from("<Q", self._mmap, fin_indice)
+            indice = json.loads(self._mmap[fin_indice - largo_indice:fin_indice].decode("utf-8"))
+            orden_bytes = indice["orden_bytes"]
+            self.filas = indice["filas"]
+            self.ancho_sha = indice["ancho_sha"]
+            self.diccionarios = indice["diccionarios"]
+            self._columnas = indice["columnas"]
+        except (struct.error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+            # Índice truncado o corrupto
+            self.cerrar()
+            raise ValueError(f"{ruta} no es un archivo columnar válido") from None
+        if orden_bytes != sys.byteorder:
+            self.cerrar()
+            raise ValueError("El archivo columnar se escribió con otro orden de bytes")
+
+    def _bytes(self, nombre: str) -> memoryview:
+        inicio, largo = self._columnas[nombre]
+        return self._vista[inicio:inicio + largo]
+
+    def columna(self, nombre: str) -> memoryview:
+        """
+        Vista sin copia de una columna numérica.
+        """
+        vista = self._vistas.get(nombre)
+        if vista is None:
+            if nombre in COLUMNAS_ENTERAS:
+                vista = self._bytes(nombre).cast("q")
+            elif nombre in COLUMNAS_DICCIONARIO:
+                vista = self._bytes(nombre).cast("I")
+            elif nombre.endswith(".offsets"):
+                vista = self._bytes(nombre).cast("Q")
+            elif nombre.endswith(".nulos"):
+                vista = self._bytes(nombre).cast("B")
+            else:
+                raise KeyError(f"{nombre} no es una columna numérica")
+            self._vistas[nombre] = vista
+        return vista
+
+    def sha(self, i: int) -> str:
+        inicio = self._columnas["commit"][0] + i * self.ancho_sha
+        return self._mmap[inicio:inicio + self.ancho_sha].hex()
+
+    def texto(self, nombre: str, i: int) -> Optional[str]:
+        if self.columna(nombre + ".nulos")[i]:
+            return None
+        offsets = self.columna(nombre + ".offsets")
+        inicio = self._columnas[nombre][0]
+        return self._mmap[inicio + offsets[i]:inicio + offsets[i + 1]].decode("utf-8")
+
+    def valor(self, nombre: str, i: int) -> str:
+        return self.diccionarios[nombre][self.columna(nombre)[i]]
+
+    def __len__(self) -> int:
+        return self.filas
+
+    def __getitem__(self, i: int) -> Dict:
+        if not 0 <= i < self.filas:
+            raise IndexError(i)
+        commit = {
+            "commit": self.sha(i),
+            "mensaje": {
+                "tipo": self.valor("tipo", i),
+                "escopo": self.valor("escopo", i) or None,
+                "descripcion": self.texto("descripcion", i),
+                "cuerpo": self.texto("cuerpo", i),
+            },
+        }
+        timestamp = self.columna("timestamp")[i]
+        if timestamp != FALTANTE:
+            commit["timestamp"] = timestamp
+        nombre, email = self.valor("autor_nombre", i), self.valor("autor_email", i)
+        if nombre or email:
+            commit["autor"] = {"nombre": nombre, "email": email}
+        if self.columna("archivos")[i] != FALTANTE:
+            commit["stats"] = {
+                campo: self.columna(campo)[i] for campo in ("archivos", "inserciones", "eliminaciones")
+            }
+        return commit
+
+    def __iter__(self) -> Iterator[Dict]:
+        # Igual que self[i] para cada fila, pero resolviendo columnas y diccionarios una sola vez
+        mm = self._mmap
+        ancho, base_sha = self.ancho_sha, self._columnas["commit"][0]
+        dic = {nombre: (self.diccionarios[nombre], self.columna(nombre)) for nombre in COLUMNAS_DICCIONARIO}
+        textos = {
+            nombre: (self._columnas[nombre][0], self.columna(nombre + ".offsets"), self.columna(nombre + ".nulos"))
+            for nombre in COLUMNAS_TEXTO
+        }
+        tipos, cod_tipo = dic["tipo"]
+        escopos, cod_escopo = dic["escopo"]
+        nombres, cod_nombre = dic["autor_nombre"]
+        emails, cod_email = dic["autor_email"]
+        fechas = self.columna("timestamp")
+        archivos, inserciones, eliminaciones = (
+            self.columna(c) for c in ("archivos", "inserciones", "eliminaciones")
+        )
+
+        def texto(nombre, i):
+            base, offsets, nulos = textos[nombre]
+            if nulos[i]:
+                return None
+            return mm[base + offsets[i]:base + offsets[i + 1]].decode("utf-8")
+
+        for i in range(self.filas):
+            inicio = base_sha + i * ancho
+            commit = {
+                "commit": mm[inicio:inicio + ancho].hex(),
+                "mensaje": {
+                    "tipo": tipos[cod_tipo[i]],
+                    "escopo": escopos[cod_escopo[i]] or None,
+                    "descripcion": texto("descripcion", i),
+                    "cuerpo": texto("cuerpo", i),
+                },
+            }
+            if fechas[i] != FALTANTE:
+                commit["timestamp"] = fechas[i]
+            nombre, email = nombres[cod_nombre[i]], emails[cod_email[i]]
+            if nombre or email:
+                commit["autor"] = {"nombre": nombre, "email": email}
+            if archivos[i] != FALTANTE:
+                commit["stats"] = {
+                    "archivos": archivos[i],
+                    "inserciones": inserciones[i],
+                    "eliminaciones": eliminaciones[i],
+                }
+            yield commit
+
+    def cerrar(self) -> None:
+        # Las vistas deben liberarse antes de cerrar el mmap
+        for vista in self._vistas.values():
+            vista.release()
+        self._vistas = {}
+        self._vista.release()
+        self._mmap.close()
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
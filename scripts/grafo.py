@@ -0,0 +1,555 @@
+"""
+grafo.py
+
+Recorrido del historial a partir del archivo commit-graph de git, leído con mmap.
+
+El commit-graph (`.git/objects/info/commit-graph`, o una cadena de capas en
+`.git/objects/info/commit-graphs/`) guarda para cada commit su hash, sus padres,
+su número de generación y su fecha de commit en registros de tamaño fijo. Con él,
+el rango `desde..hasta` se calcula sin descomprimir ningún objeto: se recorren las
+posiciones en orden de generación decreciente y el recorrido se detiene en cuanto
+todos los commits pendientes son alcanzables desde `desde`.
+
+Los refs (tags, ramas, HEAD) se resuelven leyendo los refs sueltos y packed-refs,
+y los mensajes y autores de los commits del rango se leen con un único
+`git cat-file --batch`. Si el repositorio no tiene commit-graph, o el grafo no
+contiene alguno de los extremos del rango (por ejemplo, commits posteriores a la
+última escritura del grafo), `registros_desde_grafo` devuelve None y el llamador
+usa `git log`. `escribir_grafo` ejecuta `git commit-graph write --reachable`.
+
+Formato: https://git-scm.com/docs/gitformat-commit-graph
+"""
+
+import heapq
+import mmap
+import os
+import struct
+import subprocess  # nosec B404
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from git import Repo
+
+FIRMA = b"CGPH"
+# Valores especiales de los padres en el chunk CDAT
+SIN_PADRE = 0x70000000
+PADRES_EXTRA = 0x80000000
+ULTIMO_EXTRA = 0x80000000
+# Registro de CDAT después del hash del árbol: padre 1, padre 2 y generación + fecha
+_DATO = struct.Struct(">IIII")
+
+# Marcas del recorrido de rangos
+DESDE_HASTA = 1
+DESDE_EXCLUIDO = 2
+
+
+class _Capa:
+    """
+    Un archivo commit-graph mapeado en memoria.
+    """
+
+    def __init__(self, ruta: str):
+        with open(ruta, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        datos = self.mmap
+        if datos[:4] != FIRMA:
+            raise ValueError(f"Archivo commit-graph inválido: {ruta}")
+        version_hash = datos[5]
+        self.largo_hash = 32 if version_hash == 2 else 20
+        cantidad_chunks = datos[6]
+        chunks = {}
+        for i in range(cantidad_chunks):
+            identificador, desplazamiento = struct.unpack_from(">4sQ", datos, 8 + 12 * i)
+            chunks[identificador] = desplazamiento
+        self.fanout = chunks[b"OIDF"]
+        self.oids = chunks[b"OIDL"]
+        self.datos = chunks[b"CDAT"]
+        self.extras = chunks.get(b"EDGE")
+        self.total = struct.unpack_from(">I", datos, self.fanout + 255 * 4)[0]
+        self.ancho_dato = self.largo_hash + 16
+
+    def cerrar(self) -> None:
+        self.mmap.close()
+
+
+class _Hashes:
+    """
+    Secuencia de los hashes de una capa, para buscarlos con bisect sin copiarlos.
+    """
+
+    def __init__(self, capa: _Capa):
+        self._capa = capa
+
+    def __len__(self):
+        return self._capa.total
+
+    def __getitem__(self, i):
+        inicio = self._capa.oids + i * self._capa.largo_hash
+        return self._capa.mmap[inicio:inicio + self._capa.largo_hash]
+
+
+class GrafoCommits:
+    """
+    Lector del commit-graph de un repositorio (un archivo o una cadena de capas).
+
+    Cada commit se identifica por su posición global en el grafo: las capas base
+    ocupan las primeras posiciones, como en git.
+
+    Argumentos
+    ----------
+    directorio_objetos : str
+        Directorio `objects` del repositorio
+    """
+
+    def __init__(self, directorio_objetos: str):
+        info = os.path.join(directorio_objetos, "info")
+        cadena = os.path.join(info, "commit-graphs", "commit-graph-chain")
+        if os.path.exists(cadena):
+            with open(cadena, encoding="ascii") as f:
+                rutas = [
+                    os.path.join(info, "commit-graphs", f"graph-{linea.strip()}.graph") for linea in f if linea.strip()
+                ]
+        elif os.path.exists(os.path.join(info, "commit-graph")):
+            rutas = [os.path.join(info, "commit-graph")]
+        else:
+            raise FileNotFoundError(f"No hay commit-graph en {info}")
+
+        self.capas: List[_Capa] = []
+        self._inicios: List[int] = []
+        self.total = 0
+        try:
+            for ruta in rutas:
+                capa = _Capa(ruta)
+                self.capas.append(capa)
+                self._inicios.append(self.total)
+                self.total += capa.total
+        except Exception:
+            self.cerrar()
+            raise
+
+    @classmethod
+    def abrir(cls, repo: Repo) -> Optional["GrafoCommits"]:
+        """
+        Abrir el commit-graph del repositorio, o devolver None si no existe o no se puede leer.
+        """
+        try:
+            return cls(os.path.join(repo.common_dir, "objects"))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _capa(self, posicion: int):
+        if len(self.capas) == 1:
+            return self.capas[0], posicion
+        indice = len(self._inicios) - 1
+        while self._inicios[indice] > posicion:
+            indice -= 1
+        return self.capas[indice], posicion - self._inicios[indice]
+
+    def posicion(self, sha: str) -> Optional[int]:
+        """
+        Posición del commit `sha` (hash hexadecimal completo) en el grafo, o None si no está.
+        """
+        try:
+            binario = bytes.fromhex(sha)
+        except ValueError:
+            return None
+        for capa, inicio in zip(self.capas, self._inicios):
+            if len(binario) != capa.largo_hash:
+                return None
+            primero = binario[0]
+            desde = struct.unpack_from(">I", capa.mmap, capa.fanout + 4 * (primero - 1))[0] if primero else 0
+            hasta = struct.unpack_from(">I", capa.mmap, capa.fanout + 4 * primero)[0]
+            hashes = _Hashes(capa)
+            i = bisect_left(hashes, binario, desde, hasta)
+            if i < hasta and hashes[i] == binario:
+                return inicio + i
+        return None
+
+    def sha(self, posicion: int) -> str:
+        capa, local = self._capa(posicion)
+        inicio = capa.oids + local * capa.largo_hash
+        return capa.mmap[inicio:inicio + capa.largo_hash].hex()
+
+    def commit(self, posicion: int) -> Tuple[List[int], int, int]:
+        """
+        Padres, generación y fecha de un commit, con una sola lectura de su registro.
+
+        Retorna
+        -------
+        Tuple[List[int], int, int]
+            Posiciones de los padres en orden (el primero es el primer padre), número de
+            generación (nivel topológico, mayor que el de todos sus padres) y fecha de
+            commit en segundos desde epoch
+        """
+        capa, local = self._capa(posicion)
+        primero, segundo, alto, bajo = _DATO.unpack_from(
+            capa.mmap, capa.datos + local * capa.ancho_dato + capa.largo_hash
+        )
+        generacion = alto >> 2
+        fecha = ((alto & 0x3) << 32) | bajo
+        if primero == SIN_PADRE:
+            return [], generacion, fecha
+        if segundo == SIN_PADRE:
+            return [primero], generacion, fecha
+        if not segundo & PADRES_EXTRA:
+            return [primero, segundo], generacion, fecha
+        # Merge de más de dos padres: el resto está en la lista EDGE
+        padres = [primero]
+        indice = segundo & ~PADRES_EXTRA
+        while True:
+            valor = struct.unpack_from(">I", capa.mmap, capa.extras + 4 * indice)[0]
+            padres.append(valor & ~ULTIMO_EXTRA)
+            if valor & ULTIMO_EXTRA:
+                return padres, generacion, fecha
+            indice += 1
+
+    def padres(self, posicion: int) -> List[int]:
+        return self.commit(posicion)[0]
+
+    def generacion(self, posicion: int) -> int:
+        return self.commit(posicion)[1]
+
+    def fecha(self, posicion: int) -> int:
+        return self.commit(posicion)[2]
+
+    def rango(self, hasta: List[int], desde: List[int] = (), first_parent: bool = False) -> List[int]:
+        """
+        Commits alcanzables desde `hasta` y no alcanzables desde `desde`.
+
+        Argumentos
+        ----------
+        hasta : List[int]
+            Posiciones incluidas (como `git rev-list hasta`)
+        desde : List[int]
+            Posiciones excluidas (como `^desde`)
+        first_parent : bool
+            Seguir solo el primer padre de cada commit
+
+        Retorna
+        -------
+        List[int]
+            Posiciones del rango, en el orden de `git log --reverse`
+        """
+        marcas: Dict[int, int] = {}
+        # Padres, generación y fecha de cada commit visitado, leídos una sola vez
+        datos: Dict[int, Tuple[List[int], int, int]] = {}
+        cola = []
+        # Cantidad de commits en la cola que todavía no se sabe si están excluidos
+        pendientes = 0
+
+        def agregar(posicion, marca):
+            nonlocal pendientes
+            anterior = marcas.get(posicion)
+            if anterior is None:
+                marcas[posicion] = marca
+                dato = datos[posicion] = self.commit(posicion)
+                heapq.heappush(cola, (-dato[1], posicion))
+                if marca == DESDE_HASTA:
+                    pendientes += 1
+            elif anterior != anterior | marca:
+                marcas[posicion] = anterior | marca
+                if anterior == DESDE_HASTA:
+                    # Estaba en la cola como incluido y pasó a excluido
+                    pendientes -= 1
+
+        for posicion in hasta:
+            agregar(posicion, DESDE_HASTA)
+        for posicion in desde:
+            agregar(posicion, DESDE_EXCLUIDO)
+
+        incluidos = set()
+        # En orden de generación decreciente, las marcas de un commit ya son definitivas
+        # cuando sale de la cola, porque todos sus hijos tienen una generación mayor
+        while cola and pendientes:
+            _, posicion = heapq.heappop(cola)
+            marca = marcas[posicion]
+            padres = datos[posicion][0]
+            if marca == DESDE_HASTA:
+                pendientes -= 1
+                incluidos.add(posicion)
+                if first_parent:
+                    padres = padres[:1]
+            for padre in padres:
+                agregar(padre, marca)
+
+        return orden_log(hasta, incluidos, lambda p: datos[p][0], lambda p: datos[p][2], first_parent)
+
+    def cerrar(self) -> None:
+        for capa in self.capas:
+            capa.cerrar()
+        self.capas = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+
+def orden_log(
+    hasta: Iterable[Hashable],
+    incluidos: Set[Hashable],
+    padres: Callable[[Hashable], List[Hashable]],
+    fecha: Callable[[Hashable], int],
+    first_parent: bool = False,
+) -> List[Hashable]:
+    """
+    Ordenar un rango como `git log --reverse`: git recorre desde `hasta` con una cola
+    de prioridad por fecha de commit, y los empates salen en orden de llegada.
+
+    Argumentos
+    ----------
+    hasta : Iterable[Hashable]
+        Commits desde los que se recorre, en el orden en que se pasarían a git
+    incluidos : Set[Hashable]
+        Commits del rango
+    padres : Callable
+        Padres de un commit
+    fecha : Callable
+        Fecha de commit de un commit
+    first_parent : bool
+        Seguir solo el primer padre
+
+    Retorna
+    -------
+    List[Hashable]
+        Commits de `incluidos` alcanzables desde `hasta`, del más antiguo al más reciente
+    """
+    cola = []
+    contador = 0
+    vistos = set()
+    for commit in hasta:
+        if commit in incluidos and commit not in vistos:
+            vistos.add(commit)
+            heapq.heappush(cola, (-fecha(commit), contador, commit))
+            contador += 1
+    orden = []
+    while cola:
+        _, _, commit = heapq.heappop(cola)
+        orden.append(commit)
+        candidatos = padres(commit)
+        for padre in candidatos[:1] if first_parent else candidatos:
+            if padre in incluidos and padre not in vistos:
+                vistos.add(padre)
+                heapq.heappush(cola, (-fecha(padre), contador, padre))
+                contador += 1
+    orden.reverse()
+    return orden
+
+
+def escribir_grafo(repo: Repo) -> None:
+    """
+    Escribir (o actualizar) el commit-graph con todos los commits alcanzables desde los refs.
+    """
+    repo.git.commit_graph("write", "--reachable")
+
+
+def leer_refs(directorio_comun: str) -> Dict[str, str]:
+    """
+    Leer los refs de packed-refs y los refs sueltos, sin ejecutar git.
+
+    Para los tags anotados de packed-refs se devuelve el commit al que apuntan
+    (la línea "^" que sigue al tag). Los refs sueltos tienen prioridad sobre
+    packed-refs, como en git.
+
+    Retorna
+    -------
+    Dict[str, str]
+        Hash de cada ref, por nombre completo ("refs/tags/v1.0.0")
+    """
+    refs = {}
+    try:
+        with open(os.path.join(directorio_comun, "packed-refs"), encoding="utf-8") as f:
+            anterior = None
+            for linea in f:
+                if linea.startswith("#"):
+                    continue
+                linea = linea.rstrip("\n")
+                if linea.startswith("^") and anterior:
+                    refs[anterior] = linea[1:]
+                    continue
+                sha, _, nombre = linea.partition(" ")
+                if nombre:
+                    refs[nombre] = sha
+                    anterior = nombre
+    except OSError:
+        pass
+
+    raiz = os.path.join(directorio_comun, "refs")
+    for directorio, _, archivos in os.walk(raiz):
+        for archivo in archivos:
+            ruta = os.path.join(directorio, archivo)
+            try:
+                with open(ruta, encoding="utf-8") as f:
+                    contenido = f.read().strip()
+            except OSError:
+                continue
+            if contenido and not contenido.startswith("ref:"):
+                refs["refs/" + os.path.relpath(ruta, raiz).replace(os.sep, "/")] = contenido
+    return refs
+
+
+def resolver(repo: Repo, nombre: str, refs: Dict[str, str]) -> Optional[str]:
+    """
+    Resolver HEAD, un tag, una rama o un hash completo leyendo los refs en disco.
+
+    Retorna None si el nombre necesita la resolución completa de git (hashes
+    abreviados, expresiones como HEAD~2 o refs simbólicos distintos de HEAD).
+    """
+    if nombre == "HEAD":
+        with open(os.path.join(repo.git_dir, "HEAD"), encoding="utf-8") as f:
+            head = f.read().strip()
+        if not head.startswith("ref: "):
+            return head
+        ref = head[5:]
+        sha = refs.get(ref)
+        if sha is None:
+            # Los refs por worktree (por ejemplo, HEAD de un worktree) viven en git_dir
+            try:
+                with open(os.path.join(repo.git_dir, ref), encoding="utf-8") as f:
+                    sha = f.read().strip()
+            except OSError:
+                return None
+        return sha
+    for prefijo in ("", "refs/", "refs/tags/", "refs/heads/"):
+        if prefijo + nombre in refs:
+            return refs[prefijo + nombre]
+    if len(nombre) in (40, 64) and all(c in "0123456789abcdef" for c in nombre):
+        return nombre
+    return None
+
+
+def iter_mensajes(repo: Repo, shas: List[str]) -> Iterator[bytes]:
+    """
+    Leer el contenido de varios commits con un único `git cat-file --batch`.
+
+    Los hashes se escriben desde otro hilo para que git nunca se bloquee esperando
+    que se lea su salida.
+
+    Retorna
+    -------
+    Iterator[bytes]
+        Contenido de cada commit (encabezados y mensaje), en el orden de `shas`
+    """
+    proc = subprocess.Popen(  # nosec B603 B607
+        ["git", "cat-file", "--batch"],
+        cwd=repo.working_dir or repo.git_dir,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+
+    def escribir():
+        try:
+            for sha in shas:
+                proc.stdin.write(sha.encode("ascii") + b"\n")
+            proc.stdin.close()
+        except (BrokenPipeError, ValueError):
+            pass
+
+    escritor = threading.Thread(target=escribir, daemon=True)
+    escritor.start()
+    try:
+        for _ in shas:
+            encabezado = proc.stdout.readline().split()
+            if len(encabezado) != 3 or encabezado[1] != b"commit":
+                raise RuntimeError(f"Respuesta inesperada de git cat-file: {b' '.join(encabezado)!r}")
+            # El contenido va seguido de un salto de línea
+            yield proc.stdout.read(int(encabezado[2]) + 1)[:-1]
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        proc.stdout.close()
+        escritor.join()
+
+
+def _registro(sha: str, fecha: int, padres: List[str], contenido: bytes) -> List[str]:
+    """
+    Convertir un commit de cat-file a los campos que produce FORMATO_REGISTRO.
+    """
+    encabezados, _, mensaje = contenido.partition(b"\n\n")
+    nombre = email = ""
+    for linea in encabezados.split(b"\n"):
+        if linea.startswith(b"author "):
+            autor = linea[7:].decode("utf-8", errors="replace")
+            nombre, _, resto = autor.partition(" <")
+            email = resto.partition(">")[0]
+            break
+    texto = mensaje.decode("utf-8", errors="replace")
+    return [sha, str(fecha), nombre, email, " ".join(padres), texto + "\x1f"]
+
+
+def registros_desde_grafo(
+    repo: Repo,
+    since: Optional[str],
+    until: str,
+    first_parent: bool = False,
+    no_merges: bool = False,
+    padres: bool = True,
+) -> Optional[Iterator[List[str]]]:
+    """
+    Obtener los registros del rango `since..until` usando el commit-graph.
+
+    Argumentos
+    ----------
+    repo : Repo
+        Repositorio
+    since : Optional[str]
+        Ref o hash excluido (None para todo el historial)
+    until : str
+        Ref o hash incluido
+    first_parent : bool
+        Seguir solo el primer padre
+    no_merges : bool
+        Omitir los commits de merge
+    padres : bool
+        Completar el campo de los hashes de los padres (si es False queda vacío)
+
+    Retorna
+    -------
+    Optional[Iterator[List[str]]]
+        Registros [hash, timestamp, nombre, email, padres, mensaje + "\\x1f"] del más
+        antiguo al más reciente, o None si el grafo no está disponible o no contiene
+        los extremos del rango
+    """
+    grafo = GrafoCommits.abrir(repo)
+    if grafo is None:
+        return None
+    refs = leer_refs(repo.common_dir)
+    extremos = []
+    for nombre in (until, since):
+        if nombre is None:
+            extremos.append(None)
+            continue
+        sha = resolver(repo, nombre, refs)
+        posicion = grafo.posicion(sha) if sha else None
+        if posicion is None:
+            # Tags anotados sueltos, expresiones de revisión o commits fuera del grafo
+            try:
+                sha = repo.git.rev_parse("--verify", "--quiet", f"{nombre}^{{commit}}")
+            except Exception:
+                sha = None
+            posicion = grafo.posicion(sha) if sha else None
+        if posicion is None:
+            grafo.cerrar()
+            return None
+        extremos.append(posicion)
+
+    hasta, desde = extremos
+    posiciones = grafo.rango([hasta], [desde] if desde is not None else [], first_parent=first_parent)
+    commits = []
+    for posicion in posiciones:
+        posiciones_padres, _, fecha = grafo.commit(posicion)
+        if no_merges and len(posiciones_padres) > 1:
+            continue
+        hashes_padres = [grafo.sha(p) for p in posiciones_padres] if padres else []
+        commits.append((grafo.sha(posicion), fecha, hashes_padres))
+    grafo.cerrar()
+
+    def registros():
+        contenidos = iter_mensajes(repo, [sha for sha, _, _ in commits])
+        for (sha, fecha, padres), contenido in zip(commits, contenidos):
+            yield _registro(sha, fecha, padres, contenido)
+
+    return registros()
@@ -0,0 +1,140 @@
+"""
+historial.py
+
+Generación del changelog completo, con una sección por cada release, en un solo
+recorrido del historial.
+
+El historial se recorre una vez en orden topológico (hijos antes que padres) y a
+cada commit se le asigna el primer tag de versión que lo contiene, propagando la
+menor versión desde cada commit hacia sus padres. Solo se mantiene en memoria la
+frontera del recorrido; las entradas se vuelcan a una base SQLite temporal que
+luego se lee ordenada para escribir el archivo como stream.
+"""
+
+import os
+import sqlite3
+import tempfile
+from typing import Dict, List
+
+from git import Repo
+
+from scripts.changelog_generator import TIPO_TO_TITULO, _iter_registros_git, parse_commit_message
+from scripts.tags import version_tag
+
+SIN_RELEASE = "Unreleased"
+
+
+def tags_por_commit(repo: Repo) -> Dict[str, str]:
+    """
+    Obtener el tag de versión de cada commit etiquetado.
+
+    Si un commit tiene varios tags de versión se usa el menor.
+
+    Argumentos
+    ----------
+    repo : Repo
+        Repositorio a analizar
+
+    Retorna
+    -------
+    Dict[str, str]
+        Nombre del tag por hash de commit
+    """
+    salida = repo.git.for_each_ref(
+        "--format=%(objectname)%09%(*objectname)%09%(refname:strip=2)", "refs/tags"
+    )
+    tags = {}
+    for linea in salida.splitlines():
+        objeto, apuntado, nombre = linea.split("\t")
+        version = version_tag(nombre)
+        if version is None:
+            continue
+        commit = apuntado or objeto
+        if commit not in tags or version < version_tag(tags[commit]):
+            tags[commit] = nombre
+    return tags
+
+
+def generar_changelog_historico(repo_path=".", archivo_salida: str = "CHANGELOG.md") -> List[str]:
+    """
+    Generar un CHANGELOG.md con todas las versiones del historial de HEAD.
+
+    Cada commit se asigna a la menor versión cuyo tag lo contiene; los commits que
+    ningún tag contiene se listan en la sección "Unreleased".
+
+    Argumentos
+    ----------
+    repo_path : str
+        Ruta del repositorio Git
+    archivo_salida : str
+        Nombre del archivo markdown de salida
+
+    Retorna
+    -------
+    List[str]
+        Versiones escritas, de la más reciente a la más antigua
+    """
+    repo = Repo(repo_path)
+    tags = tags_por_commit(repo)
+    # Rango de cada versión: 0 para la menor; SIN_RELEASE queda después de todas
+    versiones = sorted(set(tags.values()), key=version_tag)
+    rango = {nombre: i for i, nombre in enumerate(versiones)}
+    sin_release = len(versiones)
+    versiones.append(SIN_RELEASE)
+    orden_tipo = {tipo: i for i, tipo in enumerate(TIPO_TO_TITULO)}
+
+    fd, ruta_temporal = tempfile.mkstemp(suffix=".sqlite")
+    os.close(fd)
+    conn = sqlite3.connect(ruta_temporal)
+    try:
+        conn.execute(
+            "CREATE TABLE entradas (version INTEGER, tipo INTEGER, orden INTEGER, descripcion TEXT)"
+        )
+
+        # Menor versión conocida de cada commit pendiente de visitar (la frontera)
+        pendientes = {}
+        lote = []
+        registros = _iter_registros_git(
+            repo, ["--topo-order", "--format=%x1e%H%x1f%P%x1f%B", "HEAD"], separador=b"\x1e"
+        )
+        for orden, registro in enumerate(r for r in registros if r):
+            commit_hash, padres, mensaje = registro.split("\x1f", 2)
+            version = pendientes.pop(commit_hash, sin_release)
+            if commit_hash in tags:
+                version = min(version, rango[tags[commit_hash]])
+            for padre in padres.split():
+                pendientes[padre] = min(pendientes.get(padre, sin_release), version)
+
+            parsed = parse_commit_message(mensaje, commit_hash)["mensaje"]
+            lote.append((version, orden_tipo[parsed["tipo"]], orden, parsed["descripcion"]))
+            if len(lote) >= 10000:
+                conn.executemany("INSERT INTO entradas VALUES (?, ?, ?, ?)", lote)
+                lote = []
+        conn.executemany("INSERT INTO entradas VALUES (?, ?, ?, ?)", lote)
+
+        # El recorrido va del commit más nuevo al más antiguo: "orden DESC" deja
+        # las entradas de cada tipo de la más antigua a la más reciente
+        filas = conn.execute(
+            "SELECT version, tipo, descripcion FROM entradas "
+            "ORDER BY version DESC, tipo, orden DESC"
+        )
+        titulos = list(TIPO_TO_TITULO.values())
+        escritas = []
+        with open(archivo_salida, "w", encoding="utf-8") as f:
+            f.write("# Changelog\n")
+            version_actual = tipo_actual = None
+            for version, tipo, descripcion in filas:
+                if version != version_actual:
+                    version_actual, tipo_actual = version, None
+                    escritas.append(versiones[version])
+                    f.write(f"\n## {versiones[version]}\n")
+                if tipo != tipo_actual:
+                    tipo_actual = tipo
+                    f.write(f"\n{titulos[tipo]}\n")
+                f.write(f"- {descripcion}\n")
+    finally:
+        conn.close()
+        os.remove(ruta_temporal)
+
+    print(f"Changelog histórico con {len(escritas)} versiones generado en '{archivo_salida}'")
+    return escritas
@@ -0,0 +1,224 @@
+"""
+instrumentacion.py
+
+Tiempos y contadores por etapa del generador, con captura opcional de perfil
+(cProfile) y de memoria (tracemalloc).
+
+Cada etapa acumula su tiempo exclusivo: si una etapa ocurre dentro de otra (por
+ejemplo, el recorrido de `git log` mientras se escribe el JSON en modo --stream),
+su tiempo se descuenta de la etapa que la contiene. Así, la suma de las etapas no
+cuenta dos veces el mismo intervalo.
+"""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Umbral de tiempo total usado antes de que los umbrales fueran configurables
+UMBRALES_POR_DEFECTO = {"total": 15.0}
+
+
+def cargar_umbrales(ruta: Optional[str] = None, pares: Optional[List[str]] = None) -> Dict[str, float]:
+    """
+    Combinar los umbrales por defecto con los de un archivo JSON y los pasados como "etapa=segundos".
+
+    Argumentos
+    ----------
+    ruta : Optional[str]
+        Archivo JSON con un objeto {etapa: segundos}
+    pares : Optional[List[str]]
+        Umbrales en formato "etapa=segundos"; tienen prioridad sobre el archivo
+
+    Retorna
+    -------
+    Dict[str, float]
+        Umbral en segundos por etapa ("total" para la ejecución completa)
+    """
+    umbrales = dict(UMBRALES_POR_DEFECTO)
+    if ruta:
+        with open(ruta, encoding="utf-8") as f:
+            umbrales.update({etapa: float(segundos) for etapa, segundos in json.load(f).items()})
+    for par in pares or []:
+        etapa, separador, segundos = par.partition("=")
+        if not separador:
+            raise ValueError(f"Umbral inválido '{par}', se esperaba etapa=segundos")
+        umbrales[etapa.strip()] = float(segundos)
+    return umbrales
+
+
+class Instrumentacion:
+    """
+    Acumulador de tiempos y contadores por etapa.
+
+    Argumentos
+    ----------
+    umbrales : Dict[str, float]
+        Tiempo máximo en segundos por etapa; "total" se compara con la ejecución completa
+    """
+
+    def __init__(self, umbrales: Optional[Dict[str, float]] = None):
+        self.umbrales = dict(UMBRALES_POR_DEFECTO if umbrales is None else umbrales)
+        self.etapas: Dict[str, Dict] = {}
+        self.inicio = time.perf_counter()
+        # Cada elemento es [nombre, inicio, segundos de etapas anidadas]
+        self._pila: List[list] = []
+        self._perfil = None
+        self._ruta_perfil = None
+        self._memoria = None
+
+    def _registro(self, nombre: str) -> Dict:
+        registro = self.etapas.get(nombre)
+        if registro is None:
+            registro = self.etapas[nombre] = {"segundos": 0.0, "llamadas": 0}
+        return registro
+
+    def _abrir(self, nombre: str) -> None:
+        self._pila.append([nombre, time.perf_counter(), 0.0])
+
+    def _cerrar(self) -> None:
+        nombre, inicio, anidados = self._pila.pop()
+        duracion = time.perf_counter() - inicio
+        registro = self._registro(nombre)
+        registro["segundos"] += duracion - anidados
+        registro["llamadas"] += 1
+        if self._pila:
+            self._pila[-1][2] += duracion
+
+    @contextmanager
+    def etapa(self, nombre: str):
+        """
+        Medir el bloque como la etapa `nombre`.
+        """
+        self._abrir(nombre)
+        try:
+            yield
+        finally:
+            self._cerrar()
+
+    def contar(self, nombre: str, contador: str, cantidad: int = 1) -> None:
+        """
+        Sumar `cantidad` al contador `contador` de la etapa `nombre` (p. ej. "commits" o "bytes").
+        """
+        registro = self._registro(nombre)
+        registro[contador] = registro.get(contador, 0) + cantidad
+
+    def medir_iterable(self, iterable: Iterable, nombre: str, contador: Optional[str] = None) -> Iterator:
+        """
+        Atribuir a la etapa `nombre` el tiempo que se pasa obteniendo cada elemento de `iterable`.
+
+        Argumentos
+        ----------
+        iterable : Iterable
+            Iterable a medir (típicamente un generador)
+        nombre : str
+            Nombre de la etapa
+        contador : Optional[str]
+            Si se indica, cuenta los elementos producidos en ese contador
+        """
+        iterador = iter(iterable)
+        elementos = 0
+        try:
+            while True:
+                self._abrir(nombre)
+                try:
+                    elemento = next(iterador)
+                except StopIteration:
+                    return
+                finally:
+                    self._cerrar()
+                elementos += 1
+                yield elemento
+        finally:
+            if contador:
+                self.contar(nombre, contador, elementos)
+
+    def iniciar_perfil(self, ruta: str) -> None:
+        """
+        Activar cProfile hasta `detener()`, que guarda las estadísticas en `ruta`.
+        """
+        import cProfile
+
+        self._perfil = cProfile.Profile()
+        self._ruta_perfil = ruta
+        self._perfil.enable()
+
+    def iniciar_memoria(self) -> None:
+        """
+        Activar tracemalloc hasta `detener()`, que agrega el pico de memoria al resumen.
+        """
+        import tracemalloc
+
+        tracemalloc.start()
+        self._memoria = {}
+
+    def detener(self) -> None:
+        """
+        Detener el perfil y la captura de memoria, si estaban activos.
+        """
+        if self._perfil is not None:
+            self._perfil.disable()
+            self._perfil.dump_stats(self._ruta_perfil)
+            logging.info(f"Perfil de cProfile guardado en '{self._ruta_perfil}'")
+            self._perfil = None
+        if self._memoria == {}:
+            import tracemalloc
+
+            actual, pico = tracemalloc.get_traced_memory()
+            lineas = tracemalloc.take_snapshot().statistics("lineno")[:10]
+            tracemalloc.stop()
+            self._memoria = {
+                "actual_bytes": actual,
+                "pico_bytes": pico,
+                "principales": [
+                    {"linea": str(estadistica.traceback), "bytes": estadistica.size} for estadistica in lineas
+                ],
+            }
+
+    def total(self) -> float:
+        return time.perf_counter() - self.inicio
+
+    def resumen(self) -> Dict:
+        """
+        Resumen serializable: tiempo total, tiempos y tasas por etapa y memoria si se capturó.
+        """
+        etapas = {}
+        for nombre, registro in self.etapas.items():
+            datos = dict(registro)
+            datos["segundos"] = round(registro["segundos"], 6)
+            segundos = registro["segundos"]
+            if segundos > 0:
+                if "commits" in registro:
+                    datos["commits_por_segundo"] = round(registro["commits"] / segundos, 1)
+                if "bytes" in registro:
+                    datos["bytes_por_segundo"] = round(registro["bytes"] / segundos, 1)
+            if nombre in self.umbrales:
+                datos["umbral_segundos"] = self.umbrales[nombre]
+            etapas[nombre] = datos
+        resumen = {"total_segundos": round(self.total(), 6), "etapas": etapas}
+        if self._memoria:
+            resumen["memoria"] = self._memoria
+        return resumen
+
+    def excedidos(self) -> List[Tuple[str, float, float]]:
+        """
+        Etapas cuyo tiempo supera su umbral, como (etapa, segundos, umbral).
+        """
+        excedidos = []
+        for nombre, umbral in self.umbrales.items():
+            segundos = self.total() if nombre == "total" else self.etapas.get(nombre, {}).get("segundos")
+            if segundos is not None and segundos > umbral:
+                excedidos.append((nombre, segundos, umbral))
+        return excedidos
+
+
+def agregar_tiempos(archivo_metricas: str, resumen: Dict) -> None:
+    """
+    Agregar la sección "tiempos" a un metrics.json ya escrito.
+    """
+    with open(archivo_metricas, encoding="utf-8") as f:
+        metricas = json.load(f)
+    metricas["tiempos"] = resumen
+    with open(archivo_metricas, "w", encoding="utf-8") as f:
+        json.dump(metricas, f, indent=2, ensure_ascii=False)
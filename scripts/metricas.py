@@ -0,0 +1,264 @@
+"""
+metricas.py
+
+Motor de métricas de flujo por ventanas de tiempo.
+
+Las fechas y tipos de los commits se cargan una sola vez en columnas compactas
+(`array` de enteros) y todas las métricas se calculan sobre esas columnas:
+
+    - throughput por día o semana, con promedio móvil,
+    - percentiles del tiempo entre commits consecutivos,
+    - percentiles del lead time (tiempo desde cada commit hasta la referencia del release),
+    - tendencia de cada tipo de commit por ventana.
+"""
+
+import json
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional
+
+# Duración de cada ventana en segundos y desplazamiento para alinear el inicio.
+# Las semanas comienzan el lunes (el 1970-01-05 fue lunes).
+VENTANAS = {"dia": (86400, 0), "semana": (604800, 4 * 86400)}
+
+PERCENTILES = (50, 75, 90, 95, 99)
+
+
+class ColumnasCommits:
+    """
+    Fechas y tipos de commits almacenados como columnas.
+
+    Atributos
+    ---------
+    timestamps : array
+        Fecha de commit (segundos desde epoch) de cada commit
+    tipos : array
+        Código del tipo de cada commit, índice en `nombres_tipo`
+    nombres_tipo : List[str]
+        Nombre de cada código de tipo
+    """
+
+    __slots__ = ("timestamps", "tipos", "nombres_tipo")
+
+    def __init__(self):
+        self.timestamps = array("q")
+        self.tipos = array("B")
+        self.nombres_tipo = []
+
+    def __len__(self):
+        return len(self.timestamps)
+
+
+def cargar_columnas(
+    parsed_commits: Iterable[Dict], desde: Optional[int] = None, hasta: Optional[int] = None
+) -> ColumnasCommits:
+    """
+    Cargar en columnas los commits cuya fecha esté en [desde, hasta].
+
+    Argumentos
+    ----------
+    parsed_commits : Iterable[Dict]
+        Commits parseados con la clave "timestamp" (lista o generador)
+    desde : int
+        Fecha mínima (segundos desde epoch), opcional
+    hasta : int
+        Fecha máxima (segundos desde epoch), opcional
+
+    Retorna
+    -------
+    ColumnasCommits
+        Columnas con los commits seleccionados
+    """
+    columnas = ColumnasCommits()
+    codigos = {}
+    timestamps = columnas.timestamps
+    tipos = columnas.tipos
+    for commit in parsed_commits:
+        timestamp = commit["timestamp"]
+        if (desde is not None and timestamp < desde) or (hasta is not None and timestamp > hasta):
+            continue
+        tipo = commit["mensaje"]["tipo"]
+        codigo = codigos.get(tipo)
+        if codigo is None:
+            codigo = codigos[tipo] = len(columnas.nombres_tipo)
+            columnas.nombres_tipo.append(tipo)
+        timestamps.append(timestamp)
+        tipos.append(codigo)
+    return columnas
+
+
+def percentiles(ordenados, ps=PERCENTILES) -> Dict[str, float]:
+    """
+    Calcular percentiles con interpolación lineal sobre valores ya ordenados.
+
+    Argumentos
+    ----------
+    ordenados : Sequence[int]
+        Valores en orden ascendente
+    ps : Iterable[int]
+        Percentiles a calcular (0 a 100)
+
+    Retorna
+    -------
+    Dict[str, float]
+        Valor de cada percentil, con claves "p50", "p90", etc.
+    """
+    if not ordenados:
+        return {f"p{p}": None for p in ps}
+    resultado = {}
+    ultimo = len(ordenados) - 1
+    for p in ps:
+        posicion = ultimo * p / 100
+        inferior = int(posicion)
+        superior = min(inferior + 1, ultimo)
+        fraccion = posicion - inferior
+        valor = ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * fraccion
+        resultado[f"p{p}"] = round(valor, 2)
+    return resultado
+
+
+def _fecha(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).date().isoformat()
+
+
+def calcular_ventanas(
+    columnas: ColumnasCommits,
+    ventana: str = "dia",
+    movil: int = 7,
+    referencia: Optional[int] = None,
+) -> Dict:
+    """
+    Calcular throughput por ventana, percentiles de gaps y lead time, y tendencia por tipo.
+
+    Argumentos
+    ----------
+    columnas : ColumnasCommits
+        Commits cargados con `cargar_columnas`
+    ventana : str
+        "dia" o "semana"
+    movil : int
+        Cantidad de ventanas del promedio móvil de throughput
+    referencia : int
+        Fecha del release para el lead time (por defecto, el commit más reciente)
+
+    Retorna
+    -------
+    Dict
+        Métricas por ventana listas para serializar como JSON
+    """
+    if ventana not in VENTANAS:
+        raise ValueError(f"Ventana desconocida: {ventana}. Opciones: {', '.join(VENTANAS)}")
+    if not len(columnas):
+        raise ValueError("No hay commits para calcular métricas de flujo.")
+
+    duracion, desplazamiento = VENTANAS[ventana]
+    ordenados = array("q", sorted(columnas.timestamps))
+    if referencia is None:
+        referencia = ordenados[-1]
+
+    # Índice de ventana de cada commit, relativo a la primera ventana
+    primera = (ordenados[0] - desplazamiento) // duracion
+    indices = [(t - desplazamiento) // duracion - primera for t in columnas.timestamps]
+    cantidad = (ordenados[-1] - desplazamiento) // duracion - primera + 1
+
+    conteos = [0] * cantidad
+    for indice, total in Counter(indices).items():
+        conteos[indice] = total
+
+    throughput = []
+    acumulado = 0
+    for i, total in enumerate(conteos):
+        acumulado += total
+        if i >= movil:
+            acumulado -= conteos[i - movil]
+        throughput.append(
+            {
+                "inicio": _fecha((primera + i) * duracion + desplazamiento),
+                "commits": total,
+                "promedio_movil": round(acumulado / min(i + 1, movil), 2),
+            }
+        )
+
+    tendencia = {nombre: [0] * cantidad for nombre in columnas.nombres_tipo}
+    for (indice, codigo), total in Counter(zip(indices, columnas.tipos)).items():
+        tendencia[columnas.nombres_tipo[codigo]][indice] = total
+
+    gaps = sorted(b - a for a, b in zip(ordenados, ordenados[1:]))
+    lead_times = [referencia - t for t in reversed(ordenados)]
+
+    return {
+        "ventana": ventana,
+        "desde": _fecha(ordenados[0]),
+        "hasta": _fecha(ordenados[-1]),
+        "throughput_por_ventana": throughput,
+        "gap_entre_commits_segundos": percentiles(gaps),
+        "lead_time_segundos": percentiles(lead_times),
+        "tendencia_por_tipo": tendencia,
+    }
+
+
+def calcular_metricas_ventanas(
+    parsed_commits: Iterable[Dict],
+    archivo_salida: str = "metrics.json",
+    ventana: str = "dia",
+    desde: Optional[int] = None,
+    hasta: Optional[int] = None,
+    referencia: Optional[int] = None,
+) -> Dict:
+    """
+    Calcular métricas de flujo por ventana y guardarlas en metrics.json.
+
+    Además de las métricas por ventana se incluyen el throughput promedio y la
+    distribución por tipo que genera `calcular_metricas_flujo`.
+
+    Argumentos
+    ----------
+    parsed_commits : Iterable[Dict]
+        Commits parseados con la clave "timestamp" (lista o generador)
+    archivo_salida : str
+        Ruta del archivo JSON de salida
+    ventana : str
+        "dia" o "semana"
+    desde : int
+        Fecha mínima de los commits considerados (segundos desde epoch)
+    hasta : int
+        Fecha máxima de los commits considerados (segundos desde epoch)
+    referencia : int
+        Fecha del release para el lead time
+
+    Retorna
+    -------
+    Dict
+        Métricas calculadas
+    """
+    columnas = cargar_columnas(parsed_commits, desde, hasta)
+    movil = 7 if ventana == "dia" else 4
+    por_ventana = calcular_ventanas(columnas, ventana, movil, referencia)
+
+    timestamps = columnas.timestamps
+    dias_rango = (max(timestamps) - min(timestamps)) // 86400 or 1
+    distribucion = Counter(columnas.tipos)
+    metricas = {
+        "throughput_commits_por_dia": round(len(columnas) / dias_rango, 2),
+        "task_distribution": {
+            columnas.nombres_tipo[codigo]: total for codigo, total in distribucion.items()
+        },
+        **por_ventana,
+    }
+
+    with open(archivo_salida, "w", encoding="utf-8") as f:
+        json.dump(metricas, f, indent=2, ensure_ascii=False)
+
+    print(f"Métricas de flujo por {ventana} guardadas en '{archivo_salida}'")
+    return metricas
+
+
+def parsear_fecha(texto: str) -> int:
+    """
+    Convertir una fecha ISO (AAAA-MM-DD o con hora) a segundos desde epoch, en UTC si no tiene zona.
+    """
+    fecha = datetime.fromisoformat(texto)
+    if fecha.tzinfo is None:
+        fecha = fecha.replace(tzinfo=timezone.utc)
+    return int(fecha.timestamp())
@@ -0,0 +1,249 @@
+"""
+monorepo.py
+
+Changelogs por componente de un monorepo, a partir de un único recorrido del historial.
+
+Un archivo de configuración asigna prefijos de directorio a componentes:
+
+    {
+      "componentes": {
+        "api": ["services/api"],
+        "web": ["apps/web", "libs/ui"]
+      }
+    }
+
+Cada componente tiene sus propios tags, con el formato "<componente>/vX.Y.Z". Se hace
+un solo `git log --name-only` desde el ancestro común de los últimos tags de todos los
+componentes, y cada commit se asigna a los componentes cuyas rutas modifica. Un commit
+cuenta para un componente solo si no es alcanzable desde el último tag de ese componente;
+esa alcanzabilidad se calcula en memoria con los padres leídos en el mismo recorrido.
+
+Cada componente escribe parsed_commits.json, CHANGELOG.md y metrics.json en su propio
+subdirectorio, y se genera un resumen.json con la siguiente versión de cada uno.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Set
+
+from git import Repo
+
+from scripts.changelog_generator import (
+    calcular_metricas_flujo,
+    calcular_siguiente_version,
+    escribir_commits_json,
+    generar_changelog_md,
+    iter_parsed_commits,
+)
+from scripts.tags import version_tag
+
+
+def leer_componentes(ruta: str) -> Dict[str, List[str]]:
+    """
+    Leer la configuración de componentes.
+
+    Se acepta un prefijo o una lista de prefijos por componente.
+
+    Argumentos
+    ----------
+    ruta : str
+        Archivo JSON con la clave "componentes"
+
+    Retorna
+    -------
+    Dict[str, List[str]]
+        Prefijos de cada componente, sin "/" final
+    """
+    with open(ruta, encoding="utf-8") as f:
+        configuracion = json.load(f)
+    componentes = {}
+    for nombre, prefijos in configuracion["componentes"].items():
+        if isinstance(prefijos, str):
+            prefijos = [prefijos]
+        componentes[nombre] = [p.strip("/") for p in prefijos]
+    return componentes
+
+
+class Clasificador:
+    """
+    Asigna rutas a componentes por el prefijo de directorio más largo que coincida.
+
+    Argumentos
+    ----------
+    componentes : Dict[str, List[str]]
+        Prefijos de cada componente
+    """
+
+    def __init__(self, componentes: Dict[str, List[str]]):
+        self._prefijos = {}
+        for nombre, prefijos in componentes.items():
+            for prefijo in prefijos:
+                self._prefijos[prefijo.strip("/")] = nombre
+        self._cache: Dict[str, Optional[str]] = {}
+
+    def componente(self, ruta: str) -> Optional[str]:
+        """
+        Componente de una ruta, o None si no pertenece a ninguno.
+        """
+        # Las rutas de un mismo directorio se repiten mucho; se resuelve cada directorio una vez
+        directorio = ruta.rpartition("/")[0]
+        if directorio in self._cache:
+            encontrado = self._cache[directorio]
+        else:
+            encontrado = None
+            actual = directorio
+            while actual:
+                if actual in self._prefijos:
+                    encontrado = self._prefijos[actual]
+                    break
+                actual = actual.rpartition("/")[0]
+            self._cache[directorio] = encontrado
+        # Un prefijo también puede ser un archivo
+        return self._prefijos.get(ruta, encontrado)
+
+    def componentes(self, rutas: Iterable[str]) -> Set[str]:
+        encontrados = set()
+        for ruta in rutas:
+            nombre = self.componente(ruta)
+            if nombre is not None:
+                encontrados.add(nombre)
+        return encontrados
+
+
+def tag_componente(componente: str, version: str) -> str:
+    """
+    Nombre del tag de una versión de un componente, por ejemplo "api/v1.2.0".
+    """
+    return f"{componente}/{version}"
+
+
+def ultimos_tags(repo: Repo, componentes: Iterable[str]) -> Dict[str, Optional[str]]:
+    """
+    Último tag alcanzable desde HEAD de cada componente, con una sola consulta a git.
+
+    Retorna
+    -------
+    Dict[str, Optional[str]]
+        Versión ("vX.Y.Z") del último tag de cada componente, o None si no tiene tags
+    """
+    componentes = set(componentes)
+    mejores = {nombre: None for nombre in componentes}
+    salida = repo.git.for_each_ref("--merged=HEAD", "--format=%(refname:strip=2)", "refs/tags")
+    for nombre_tag in salida.splitlines():
+        componente, _, version = nombre_tag.rpartition("/")
+        if componente not in componentes or version_tag(version) is None:
+            continue
+        actual = mejores[componente]
+        if actual is None or version_tag(version) > version_tag(actual):
+            mejores[componente] = version
+    return mejores
+
+
+def _alcanzables(desde: str, padres: Dict[str, List[str]]) -> Set[str]:
+    """
+    Commits del recorrido alcanzables desde `desde`, siguiendo solo commits recorridos.
+    """
+    alcanzables = set()
+    pendientes = [desde]
+    while pendientes:
+        actual = pendientes.pop()
+        if actual in alcanzables or actual not in padres:
+            continue
+        alcanzables.add(actual)
+        pendientes.extend(padres[actual])
+    return alcanzables
+
+
+def procesar_monorepo(
+    repo_path: str,
+    componentes: Dict[str, List[str]],
+    salida_dir: str = "releases",
+    stats: bool = False,
+) -> Dict:
+    """
+    Generar commits, changelog, versión y métricas de cada componente en un solo recorrido.
+
+    Argumentos
+    ----------
+    repo_path : str
+        Ruta del repositorio
+    componentes : Dict[str, List[str]]
+        Prefijos de cada componente (ver `leer_componentes`)
+    salida_dir : str
+        Directorio base de salida; cada componente usa un subdirectorio propio
+    stats : bool
+        Incluir estadísticas de archivos en los commits
+
+    Retorna
+    -------
+    Dict
+        Resumen con la cantidad de commits recorridos y el resultado de cada componente
+    """
+    repo = Repo(repo_path)
+    clasificador = Clasificador(componentes)
+    versiones = ultimos_tags(repo, componentes)
+
+    # Los commits alcanzables desde todos los últimos tags no cuentan para ningún componente
+    desde = None
+    if versiones and all(versiones.values()):
+        tags = [tag_componente(nombre, version) for nombre, version in versiones.items()]
+        bases = repo.git.merge_base("--octopus", *tags).split() if len(tags) > 1 else tags
+        desde = bases[0] if bases else None
+
+    padres = {}
+    por_componente = {nombre: [] for nombre in componentes}
+    commits = []
+    for commit in iter_parsed_commits(repo_path, since=desde, stats=stats, padres=True, rutas=True):
+        padres[commit["commit"]] = commit.pop("padres")
+        rutas = commit.pop("rutas")
+        tocados = clasificador.componentes(rutas)
+        if tocados:
+            commits.append((commit, tocados))
+
+    excluidos = {}
+    for nombre, version in versiones.items():
+        if version is not None:
+            sha = repo.commit(tag_componente(nombre, version)).hexsha
+            excluidos[nombre] = _alcanzables(sha, padres)
+
+    for commit, tocados in commits:
+        for nombre in tocados:
+            if commit["commit"] not in excluidos.get(nombre, ()):
+                por_componente[nombre].append(commit)
+
+    resultados = []
+    for nombre, commits_componente in por_componente.items():
+        version_actual = versiones[nombre]
+        resultado = {
+            "componente": nombre,
+            "version_actual": version_actual,
+            "commits": len(commits_componente),
+        }
+        if not commits_componente:
+            resultado["estado"] = "sin_cambios"
+            resultados.append(resultado)
+            continue
+
+        destino = os.path.join(salida_dir, nombre)
+        os.makedirs(destino, exist_ok=True)
+        escribir_commits_json(commits_componente, os.path.join(destino, "parsed_commits.json"))
+        nueva_version = calcular_siguiente_version(commits_componente, version_actual or "v0.0.0")
+        generar_changelog_md(commits_componente, nueva_version, os.path.join(destino, "CHANGELOG.md"))
+        calcular_metricas_flujo(commits_componente, os.path.join(destino, "metrics.json"))
+        resultado.update(
+            {
+                "estado": "ok",
+                "version": nueva_version,
+                "tag": tag_componente(nombre, nueva_version),
+                "salida": destino,
+            }
+        )
+        resultados.append(resultado)
+
+    resumen = {"commits_recorridos": len(padres), "desde": desde, "componentes": resultados}
+    os.makedirs(salida_dir, exist_ok=True)
+    archivo_resumen = os.path.join(salida_dir, "resumen.json")
+    with open(archivo_resumen, "w", encoding="utf-8") as f:
+        json.dump(resumen, f, indent=2, ensure_ascii=False)
+    print(f"Resumen de {len(resultados)} componentes guardado en '{archivo_resumen}'")
+    return resumen
@@ -0,0 +1,178 @@
+"""
+multi_repo.py
+
+Generación de changelogs para varios repositorios en paralelo.
+
+Cada repositorio se procesa en un proceso independiente, con su propio `Repo`, y
+escribe su CHANGELOG.md, metrics.json y parsed_commits.json en un subdirectorio
+de salida. Los errores de un repositorio se registran en el resumen sin detener
+al resto.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+from git import Repo
+
+from scripts.changelog_generator import (
+    calcular_metricas_flujo,
+    calcular_siguiente_version,
+    escribir_commits_json,
+    generar_changelog_md,
+    get_commits_since_last_tag,
+)
+from scripts.tags import resolver_ultimo_tag
+
+
+def leer_manifiesto(ruta: str) -> List[str]:
+    """
+    Leer un manifiesto con una ruta de repositorio por línea.
+
+    Las líneas vacías y las que empiezan con "#" se ignoran. Las rutas relativas
+    se resuelven respecto al directorio del manifiesto.
+
+    Argumentos
+    ----------
+    ruta : str
+        Ruta del archivo de manifiesto
+
+    Retorna
+    -------
+    List[str]
+        Rutas de los repositorios
+    """
+    base = Path(ruta).parent
+    rutas = []
+    with open(ruta, encoding="utf-8") as f:
+        for linea in f:
+            linea = linea.strip()
+            if linea and not linea.startswith("#"):
+                rutas.append(str(base / linea))
+    return rutas
+
+
+def procesar_repositorio(repo_path: str, salida_dir: str) -> Dict:
+    """
+    Generar commits parseados, CHANGELOG.md y métricas de un repositorio.
+
+    Nunca lanza excepciones: los errores se devuelven en el resultado para que
+    un repositorio con problemas no afecte a los demás.
+
+    Argumentos
+    ----------
+    repo_path : str
+        Ruta del repositorio Git
+    salida_dir : str
+        Directorio donde se escriben los archivos del repositorio
+
+    Retorna
+    -------
+    Dict
+        Resultado con estado ("ok", "sin_cambios" o "error"), versiones y cantidad de commits
+    """
+    resultado = {"repo": repo_path, "salida": salida_dir, "commits": 0}
+    try:
+        repo = Repo(repo_path)
+        ultimo_tag = resolver_ultimo_tag(repo)
+        resultado["version_actual"] = ultimo_tag
+
+        parsed_commits = get_commits_since_last_tag(repo_path, tag=ultimo_tag)
+        resultado["commits"] = len(parsed_commits)
+        if not parsed_commits:
+            resultado["estado"] = "sin_cambios"
+            return resultado
+
+        os.makedirs(salida_dir, exist_ok=True)
+        escribir_commits_json(parsed_commits, os.path.join(salida_dir, "parsed_commits.json"))
+        nueva_version = calcular_siguiente_version(parsed_commits, ultimo_tag)
+        generar_changelog_md(
+            parsed_commits, nueva_version, os.path.join(salida_dir, "CHANGELOG.md")
+        )
+        calcular_metricas_flujo(
+            parsed_commits, os.path.join(salida_dir, "metrics.json"), repo=repo
+        )
+
+        resultado["version"] = nueva_version
+        resultado["estado"] = "ok"
+    except Exception as e:
+        resultado["estado"] = "error"
+        resultado["error"] = f"{type(e).__name__}: {e}"
+    return resultado
+
+
+def _nombres_salida(rutas: List[str]) -> List[str]:
+    """
+    Asignar un nombre de subdirectorio único a cada repositorio.
+    """
+    usados = {}
+    nombres = []
+    for ruta in rutas:
+        nombre = Path(ruta).resolve().name or "repo"
+        usados[nombre] = usados.get(nombre, 0) + 1
+        nombres.append(nombre if usados[nombre] == 1 else f"{nombre}-{usados[nombre]}")
+    return nombres
+
+
+def procesar_repositorios(
+    rutas: List[str], salida_dir: str = "releases", max_procesos: int = None
+) -> Dict:
+    """
+    Procesar varios repositorios con un pool de procesos y escribir un resumen agregado.
+
+    Argumentos
+    ----------
+    rutas : List[str]
+        Rutas de los repositorios
+    salida_dir : str
+        Directorio base de salida; cada repositorio usa un subdirectorio propio
+    max_procesos : int
+        Cantidad máxima de repositorios procesados a la vez (por defecto: núcleos disponibles)
+
+    Retorna
+    -------
+    Dict
+        Resumen con totales por estado y el resultado de cada repositorio,
+        en el mismo orden de `rutas`
+    """
+    os.makedirs(salida_dir, exist_ok=True)
+    destinos = [os.path.join(salida_dir, nombre) for nombre in _nombres_salida(rutas)]
+    resultados = []
+
+    with ProcessPoolExecutor(max_workers=max_procesos) as pool:
+        futuros = [
+            pool.submit(procesar_repositorio, ruta, destino)
+            for ruta, destino in zip(rutas, destinos)
+        ]
+        for ruta, destino, futuro in zip(rutas, destinos, futuros):
+            try:
+                resultados.append(futuro.result())
+            except Exception as e:
+                # Falla del proceso trabajador (por ejemplo, terminado por el sistema)
+                resultados.append(
+                    {
+                        "repo": ruta,
+                        "salida": destino,
+                        "commits": 0,
+                        "estado": "error",
+                        "error": f"{type(e).__name__}: {e}",
+                    }
+                )
+
+    estados = [r["estado"] for r in resultados]
+    resumen = {
+        "total": len(resultados),
+        "exitosos": estados.count("ok"),
+        "sin_cambios": estados.count("sin_cambios"),
+        "fallidos": estados.count("error"),
+        "repositorios": resultados,
+    }
+
+    archivo_resumen = os.path.join(salida_dir, "resumen.json")
+    with open(archivo_resumen, "w", encoding="utf-8") as f:
+        json.dump(resumen, f, indent=2, ensure_ascii=False)
+    print(f"Resumen de {len(resultados)} repositorios guardado en '{archivo_resumen}'")
+
+    return resumen
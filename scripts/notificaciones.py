@@ -0,0 +1,242 @@
+"""
+notificaciones.py
+
+Envío asíncrono de alertas a webhooks de Slack y Discord.
+
+Las alertas se encolan en una cola acotada y las envían hilos en segundo plano
+usando una sesión HTTP con conexiones reutilizables, timeout y reintentos con
+backoff exponencial. La cola se vacía al terminar el proceso, con un tiempo máximo
+de espera, para que un webhook lento nunca bloquee el job de release.
+
+Las URLs de los webhooks se leen de las variables de entorno SLACK_WEBHOOK_URL y
+DISCORD_WEBHOOK_URL, o de un archivo JSON de configuración.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Clave del payload que espera cada servicio
+PAYLOADS = {"slack": "text", "discord": "content"}
+
+VARIABLES_ENTORNO = {"slack": "SLACK_WEBHOOK_URL", "discord": "DISCORD_WEBHOOK_URL"}
+
+
+def cargar_configuracion(ruta: Optional[str] = None) -> Dict:
+    """
+    Leer la configuración de notificaciones.
+
+    El archivo JSON puede definir "slack", "discord", "timeout", "reintentos",
+    "backoff" y "max_cola". Las variables de entorno tienen prioridad sobre el
+    archivo para las URLs.
+
+    Argumentos
+    ----------
+    ruta : str
+        Archivo JSON de configuración (opcional)
+
+    Retorna
+    -------
+    Dict
+        Configuración con la clave "webhooks" y los parámetros de envío
+    """
+    datos = {}
+    if ruta:
+        with open(ruta, encoding="utf-8") as f:
+            datos = json.load(f)
+
+    webhooks = {}
+    for destino, variable in VARIABLES_ENTORNO.items():
+        url = os.environ.get(variable) or datos.get(destino)
+        if url:
+            webhooks[destino] = url
+
+    configuracion = {"webhooks": webhooks}
+    for clave in ("timeout", "reintentos", "backoff", "max_cola"):
+        if clave in datos:
+            configuracion[clave] = datos[clave]
+    return configuracion
+
+
+class Notificador:
+    """
+    Despachador de alertas en segundo plano.
+
+    Argumentos
+    ----------
+    webhooks : Dict[str, str]
+        URL por destino ("slack", "discord")
+    timeout : float
+        Tiempo máximo en segundos de cada solicitud HTTP
+    reintentos : int
+        Reintentos ante errores de red, 429 o 5xx
+    backoff : float
+        Espera inicial entre reintentos; se duplica en cada intento
+    max_cola : int
+        Cantidad máxima de alertas pendientes; las que excedan se descartan
+    hilos : int
+        Cantidad de hilos que envían alertas
+    """
+
+    def __init__(
+        self,
+        webhooks: Dict[str, str],
+        timeout: float = 5.0,
+        reintentos: int = 3,
+        backoff: float = 0.5,
+        max_cola: int = 100,
+        hilos: int = 2,
+    ):
+        self.webhooks = webhooks
+        self.timeout = timeout
+        self.reintentos = reintentos
+        self.backoff = backoff
+        self.enviados = 0
+        self.fallidos = 0
+        self.descartados = 0
+        # Los contadores se actualizan desde los hilos de envío y desde quien encola
+        self._lock = threading.Lock()
+
+        self._session = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=len(PAYLOADS), pool_maxsize=hilos)
+        self._session.mount("https://", adaptador)
+        self._session.mount("http://", adaptador)
+
+        self._cola = queue.Queue(maxsize=max_cola)
+        self._cerrado = False
+        self._hilos = [
+            threading.Thread(target=self._trabajar, name=f"notificador-{i}", daemon=True)
+            for i in range(hilos)
+        ]
+        for hilo in self._hilos:
+            hilo.start()
+        atexit.register(self.cerrar)
+
+    def enviar(self, destino: str, mensaje: str) -> bool:
+        """
+        Encolar una alerta sin bloquear.
+
+        Argumentos
+        ----------
+        destino : str
+            "slack" o "discord"
+        mensaje : str
+            Texto de la alerta
+
+        Retorna
+        -------
+        bool
+            True si la alerta se encoló; False si el destino no está configurado,
+            el notificador está cerrado o la cola está llena
+        """
+        url = self.webhooks.get(destino)
+        if not url or self._cerrado:
+            return False
+        try:
+            self._cola.put_nowait((destino, url, {PAYLOADS[destino]: mensaje}))
+        except queue.Full:
+            with self._lock:
+                self.descartados += 1
+            logging.warning(f"Cola de notificaciones llena, se descarta alerta a {destino}")
+            return False
+        return True
+
+    def _trabajar(self):
+        while True:
+            tarea = self._cola.get()
+            try:
+                if tarea is None:
+                    return
+                self._entregar(*tarea)
+            finally:
+                self._cola.task_done()
+
+    def _entregar(self, destino: str, url: str, payload: Dict):
+        detalle = ""
+        for intento in range(self.reintentos + 1):
+            try:
+                response = self._session.post(url, json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                detalle = str(e)
+            else:
+                if response.ok:
+                    with self._lock:
+                        self.enviados += 1
+                    return
+                detalle = f"{response.status_code} - {response.text}"
+                if response.status_code != 429 and response.status_code < 500:
+                    # Errores del cliente (URL o payload inválidos) no se reintentan
+                    break
+            if intento < self.reintentos:
+                time.sleep(self.backoff * 2 ** intento)
+
+        with self._lock:
+            self.fallidos += 1
+        logging.warning(f"Alerta {destino.capitalize()} fallida: {detalle}")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Esperar a que se envíen las alertas pendientes.
+
+        Argumentos
+        ----------
+        timeout : float
+            Tiempo máximo de espera en segundos (None espera indefinidamente)
+
+        Retorna
+        -------
+        bool
+            True si la cola quedó vacía antes del timeout
+        """
+        limite = None if timeout is None else time.monotonic() + timeout
+        with self._cola.all_tasks_done:
+            while self._cola.unfinished_tasks:
+                restante = None if limite is None else limite - time.monotonic()
+                if restante is not None and restante <= 0:
+                    return False
+                self._cola.all_tasks_done.wait(restante)
+        return True
+
+    def cerrar(self, timeout: float = 10.0) -> None:
+        """
+        Enviar las alertas pendientes (esperando como máximo `timeout`) y detener los hilos.
+        """
+        if self._cerrado:
+            return
+        self._cerrado = True
+        if not self.flush(timeout):
+            logging.warning("Se cerró el notificador con alertas sin enviar")
+        for _ in self._hilos:
+            try:
+                self._cola.put_nowait(None)
+            except queue.Full:
+                break
+        self._session.close()
+        atexit.unregister(self.cerrar)
+
+
+_notificador: Optional[Notificador] = None
+
+
+def obtener_notificador(ruta_configuracion: Optional[str] = None) -> Notificador:
+    """
+    Obtener el notificador compartido del proceso, creándolo en el primer uso.
+
+    Argumentos
+    ----------
+    ruta_configuracion : str
+        Archivo JSON de configuración, usado solo al crear el notificador
+    """
+    global _notificador
+    if _notificador is None:
+        configuracion = cargar_configuracion(ruta_configuracion)
+        _notificador = Notificador(configuracion.pop("webhooks"), **configuracion)
+    return _notificador
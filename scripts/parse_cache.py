@@ -0,0 +1,266 @@
+"""
+parse_cache.py
+
+Caché persistente de commits parseados, indexada por hash de commit.
+
+Los resultados de `parse_commit_message` se guardan en una base SQLite junto con la
+versión del parser que los produjo. Si la versión cambia (por ejemplo, al modificar
+COMMIT_REGEX) la caché se vacía automáticamente. El tamaño se limita descartando las
+entradas usadas hace más tiempo.
+
+Además se guarda cada rango recorrido (base..punta, con sus opciones de recorrido): los
+registros de `git log` con el mensaje ya parseado, por lotes y en orden, y la punta hasta
+la que se leyeron. Si en la siguiente ejecución la punta anterior es ancestro de la nueva,
+solo se recorren y parsean los commits posteriores a ella; el resto se lee de la caché.
+"""
+
+import json
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+_codificar = json.JSONEncoder(ensure_ascii=False, check_circular=False).encode
+
+# Rangos guardados como máximo; cada release nuevo empieza un rango con otra base
+MAX_RANGOS = 16
+
+
+class CacheParseo:
+    """
+    Caché SQLite de mensajes de commit parseados.
+
+    Argumentos
+    ----------
+    ruta : str
+        Archivo SQLite donde se guarda la caché (se crea si no existe)
+    version_parser : str
+        Identificador del parser; las entradas de otra versión se descartan
+    max_entradas : int
+        Cantidad máxima de commits guardados
+    """
+
+    def __init__(self, ruta: str, version_parser: str, max_entradas: int = 500_000):
+        self.ruta = ruta
+        self.max_entradas = max_entradas
+        self.aciertos = 0
+        self.fallos = 0
+
+        self._conn = sqlite3.connect(ruta)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (clave TEXT PRIMARY KEY, valor TEXT)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS commits "
+            "(sha TEXT PRIMARY KEY, mensaje TEXT NOT NULL, usado INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS commits_usado ON commits (usado)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rangos "
+            "(clave TEXT PRIMARY KEY, base TEXT, punta TEXT NOT NULL, total INTEGER NOT NULL, usado INTEGER NOT NULL)"
+        )
+        # Un lote de registros consecutivos del rango por fila, a partir de `posicion`
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rango_lotes "
+            "(clave TEXT, posicion INTEGER, registros TEXT NOT NULL, mensajes TEXT NOT NULL, "
+            "PRIMARY KEY (clave, posicion)) WITHOUT ROWID"
+        )
+
+        fila = self._conn.execute("SELECT valor FROM meta WHERE clave = 'version'").fetchone()
+        if fila is None or fila[0] != version_parser:
+            # El parser cambió: las entradas anteriores ya no son válidas
+            self._conn.execute("DELETE FROM commits")
+            self._conn.execute("DELETE FROM rangos")
+            self._conn.execute("DELETE FROM rango_lotes")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (clave, valor) VALUES ('version', ?)",
+                (version_parser,),
+            )
+
+        fila = self._conn.execute("SELECT MAX(usado) FROM commits").fetchone()
+        self._reloj = fila[0] or 0
+        # Se cuenta una vez; `guardar` mantiene el total al insertar y descartar
+        self._total = self._conn.execute("SELECT COUNT(*) FROM commits").fetchone()[0]
+        self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def __len__(self) -> int:
+        return self._total
+
+    def obtener(self, shas: List[str]) -> Dict[str, Dict]:
+        """
+        Buscar varios commits en la caché con una sola consulta.
+
+        Argumentos
+        ----------
+        shas : List[str]
+            Hashes de commit a buscar
+
+        Retorna
+        -------
+        Dict[str, Dict]
+            Mensajes parseados de los commits encontrados, por hash
+        """
+        encontrados = {}
+        # SQLite limita la cantidad de parámetros por consulta
+        for i in range(0, len(shas), 900):
+            lote = shas[i:i + 900]
+            marcadores = ",".join("?" * len(lote))
+            filas = self._conn.execute(
+                f"SELECT sha, mensaje FROM commits WHERE sha IN ({marcadores})",  # nosec B608
+                lote,
+            )
+            for sha, mensaje in filas:
+                encontrados[sha] = json.loads(mensaje)
+
+        if encontrados:
+            self._reloj += 1
+            self._conn.executemany(
+                "UPDATE commits SET usado = ? WHERE sha = ?",
+                ((self._reloj, sha) for sha in encontrados),
+            )
+        self.aciertos += len(encontrados)
+        self.fallos += len(shas) - len(encontrados)
+        return encontrados
+
+    def guardar(self, entradas: Iterable[Tuple[str, Dict]]) -> None:
+        """
+        Guardar mensajes parseados y descartar las entradas más antiguas si se supera el límite.
+
+        Los cambios se confirman al cerrar la caché, en una sola transacción.
+
+        Argumentos
+        ----------
+        entradas : Iterable[Tuple[str, Dict]]
+            Pares (hash, mensaje parseado)
+        """
+        self._reloj += 1
+        # Un hash ya guardado con esta versión del parser tiene el mismo resultado
+        cursor = self._conn.executemany(
+            "INSERT OR IGNORE INTO commits (sha, mensaje, usado) VALUES (?, ?, ?)",
+            (
+                (sha, _codificar(mensaje), self._reloj)
+                for sha, mensaje in entradas
+            ),
+        )
+        self._total += cursor.rowcount
+        exceso = self._total - self.max_entradas
+        if exceso > 0:
+            self._conn.execute(
+                "DELETE FROM commits WHERE sha IN "
+                "(SELECT sha FROM commits ORDER BY usado LIMIT ?)",
+                (exceso,),
+            )
+            self._total -= exceso
+
+    def rango(self, clave: str, base: Optional[str]) -> Optional[Tuple[str, int]]:
+        """
+        Buscar un rango guardado que empiece en `base`.
+
+        Los lotes que quedaron de un recorrido interrumpido después de la punta se descartan.
+
+        Argumentos
+        ----------
+        clave : str
+            Identificador del rango (revisiones y opciones de recorrido)
+        base : Optional[str]
+            Hash del commit inicial excluido (None para todo el historial)
+
+        Retorna
+        -------
+        Optional[Tuple[str, int]]
+            (punta, cantidad de registros), o None si el rango no se guardó o su base
+            cambió (por ejemplo, un tag movido)
+        """
+        fila = self._conn.execute("SELECT base, punta, total FROM rangos WHERE clave = ?", (clave,)).fetchone()
+        if fila is None or fila[0] != base:
+            return None
+        self._conn.execute("DELETE FROM rango_lotes WHERE clave = ? AND posicion >= ?", (clave, fila[2]))
+        return fila[1], fila[2]
+
+    def iter_rango(self, clave: str, total: int) -> Iterator[Tuple[List[List[str]], Dict[str, Dict]]]:
+        """
+        Leer en orden los lotes de un rango, con sus mensajes parseados.
+
+        Argumentos
+        ----------
+        clave : str
+            Identificador del rango
+        total : int
+            Cantidad de registros del rango (ver `rango`)
+
+        Retorna
+        -------
+        Iterator[Tuple[List[List[str]], Dict[str, Dict]]]
+            Lotes (registros sin el texto del mensaje, ver `agregar_al_rango`; mensajes por hash)
+        """
+        self._reloj += 1
+        self._conn.execute("UPDATE rangos SET usado = ? WHERE clave = ?", (self._reloj, clave))
+        filas = self._conn.execute(
+            "SELECT registros, mensajes FROM rango_lotes WHERE clave = ? AND posicion < ? ORDER BY posicion",
+            (clave, total),
+        )
+        for registros, mensajes in filas:
+            registros = [registro.split("\x1f", 5) for registro in registros.split("\x1e")]
+            self.aciertos += len(registros)
+            yield registros, {r[0]: mensaje for r, mensaje in zip(registros, json.loads(mensajes))}
+
+    def agregar_al_rango(self, clave: str, posicion: int, registros: List[List[str]], mensajes: List[Dict]) -> None:
+        """
+        Guardar un lote de registros de `git log` y sus mensajes parseados a partir de `posicion`.
+
+        El lote no forma parte del rango hasta que `cerrar_rango` actualiza su total,
+        de modo que un recorrido interrumpido no deja el rango a medias.
+
+        Argumentos
+        ----------
+        clave : str
+            Identificador del rango
+        posicion : int
+            Posición del primer registro del lote
+        registros : List[List[str]]
+            Registros [hash, timestamp, nombre, email, padres, mensaje + "\x1f" + numstat];
+            el texto del mensaje no se guarda
+        mensajes : List[Dict]
+            Mensaje parseado de cada registro
+        """
+        if not registros:
+            return
+        self.fallos += len(registros)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO rango_lotes (clave, posicion, registros, mensajes) VALUES (?, ?, ?, ?)",
+            (
+                clave,
+                posicion,
+                "\x1e".join("\x1f".join(r[:5]) + "\x1f\x1f" + r[5].rpartition("\x1f")[2] for r in registros),
+                _codificar(mensajes),
+            ),
+        )
+
+    def descartar_rango(self, clave: str) -> None:
+        self._conn.execute("DELETE FROM rangos WHERE clave = ?", (clave,))
+        self._conn.execute("DELETE FROM rango_lotes WHERE clave = ?", (clave,))
+
+    def cerrar_rango(self, clave: str, base: Optional[str], punta: str, total: int) -> None:
+        """
+        Registrar que el rango `clave` tiene `total` registros hasta `punta` y confirmar los cambios.
+        """
+        self._reloj += 1
+        self._conn.execute(
+            "INSERT OR REPLACE INTO rangos (clave, base, punta, total, usado) VALUES (?, ?, ?, ?, ?)",
+            (clave, base, punta, total, self._reloj),
+        )
+        viejos = self._conn.execute(
+            "SELECT clave FROM rangos ORDER BY usado DESC LIMIT -1 OFFSET ?", (MAX_RANGOS,)
+        ).fetchall()
+        for (vieja,) in viejos:
+            self.descartar_rango(vieja)
+        self._conn.commit()
+
+    def cerrar(self) -> None:
+        """
+        Guardar los cambios pendientes y cerrar la base de datos.
+        """
+        self._conn.commit()
+        self._conn.close()
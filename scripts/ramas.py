@@ -0,0 +1,223 @@
+"""
+ramas.py
+
+Vista previa de la siguiente versión y del changelog pendiente de varias ramas a la vez.
+
+En lugar de recorrer el historial una vez por rama, se hace un solo `git log` de la
+unión de todas las ramas, excluyendo lo alcanzable desde el último tag
+(`git log ^<tag> <rama1> <rama2> ...`), y cada commit se parsea una sola vez aunque lo
+compartan muchas ramas. La pertenencia de cada commit a cada rama se calcula en memoria
+con los padres leídos en el mismo recorrido: cada rama es un bit, y las máscaras se
+propagan de hijos a padres en orden topológico. Los commits de cada rama se ordenan
+como lo haría `git log <tag>..<rama>` (ver `scripts.grafo.orden_log`).
+
+Uso:
+    python -m scripts.changelog_generator ramas [--dir .] [--refs refs/heads ...] [--tag T]
+                                                [--json] [--salida ARCHIVO]
+"""
+
+import argparse
+import json
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from git import Repo
+
+from scripts.changelog_generator import (
+    FORMATO_REGISTRO,
+    _iter_registros_git,
+    _parsear_lote,
+    renderizar_seccion,
+    siguiente_version,
+)
+from scripts.grafo import orden_log
+from scripts.tags import resolver_ultimo_tag, version_tag
+
+INCREMENTOS = ("mayor", "menor", "parche")
+
+
+def listar_ramas(repo: Repo, patrones: Sequence[str]) -> List[Tuple[str, str]]:
+    """
+    Listar los refs que coinciden con los patrones, con una sola llamada a for-each-ref.
+
+    Argumentos
+    ----------
+    repo : Repo
+        Repositorio
+    patrones : Sequence[str]
+        Patrones de `git for-each-ref` (p. ej. "refs/heads", "refs/remotes/origin")
+
+    Retorna
+    -------
+    List[Tuple[str, str]]
+        Pares (nombre corto, hash del commit), ordenados por nombre
+    """
+    salida = repo.git.for_each_ref("--format=%(refname:short)%00%(objectname)%00%(*objectname)", *patrones)
+    ramas = []
+    for linea in salida.splitlines():
+        nombre, objeto, desreferenciado = linea.split("\0")
+        # Los refs anotados (p. ej. tags) apuntan al commit desreferenciado
+        ramas.append((nombre, desreferenciado or objeto))
+    return ramas
+
+
+def incremento(tag: str, version: str) -> Optional[str]:
+    """
+    Nombre del componente que sube de `tag` a `version` ("mayor", "menor" o "parche"), o None.
+    """
+    for nombre, anterior, nuevo in zip(INCREMENTOS, version_tag(tag), version_tag(version)):
+        if nuevo != anterior:
+            return nombre
+    return None
+
+
+def _mascaras(padres: List[List[int]], puntas: List[int]) -> List[int]:
+    """
+    Calcular, para cada commit del recorrido, la máscara de ramas que lo contienen.
+
+    Las máscaras se propagan de cada commit a sus padres en orden topológico (un
+    commit se procesa cuando ya se procesaron todos sus hijos del recorrido), de modo
+    que el resultado no depende del orden en que git emitió los commits.
+
+    Argumentos
+    ----------
+    padres : List[List[int]]
+        Posiciones de los padres de cada commit que están en el recorrido
+    puntas : List[int]
+        Máscara de las ramas que apuntan a cada commit
+
+    Retorna
+    -------
+    List[int]
+        Máscara de cada commit
+    """
+    mascaras = list(puntas)
+    hijos = [0] * len(padres)
+    for posiciones in padres:
+        for p in posiciones:
+            hijos[p] += 1
+
+    pila = [i for i, cantidad in enumerate(hijos) if not cantidad]
+    while pila:
+        i = pila.pop()
+        for p in padres[i]:
+            mascaras[p] |= mascaras[i]
+            hijos[p] -= 1
+            if not hijos[p]:
+                pila.append(p)
+    return mascaras
+
+
+def previsualizar_ramas(
+    repo_path: str = ".",
+    patrones: Sequence[str] = ("refs/heads",),
+    tag: Optional[str] = None,
+) -> Dict:
+    """
+    Calcular la siguiente versión y el changelog pendiente de cada rama con un solo recorrido.
+
+    Argumentos
+    ----------
+    repo_path : str
+        Ruta del repositorio
+    patrones : Sequence[str]
+        Patrones de `git for-each-ref` que seleccionan las ramas
+    tag : str
+        Tag desde el que se calculan las versiones (por defecto, el último tag alcanzable desde HEAD)
+
+    Retorna
+    -------
+    Dict
+        Resumen con el tag, la cantidad de commits recorridos y, por rama (ordenadas por
+        nombre), su hash, la cantidad de commits pendientes, la siguiente versión, el
+        incremento ("mayor", "menor", "parche" o None) y la sección de changelog
+    """
+    repo = Repo(repo_path)
+    tag = tag or resolver_ultimo_tag(repo)
+    if not tag:
+        raise ValueError("No se encontraron tags en el repositorio.")
+
+    ramas = listar_ramas(repo, patrones)
+    puntas: Dict[str, int] = {}
+    for bit, (_, sha) in enumerate(ramas):
+        puntas[sha] = puntas.get(sha, 0) | (1 << bit)
+
+    commits = []
+    if puntas:
+        args = [FORMATO_REGISTRO, f"^{tag}", *puntas]
+        # Se descarta el registro vacío previo al primer separador
+        registros = [r.split("\x1f", 5) for r in _iter_registros_git(repo, args, separador=b"\x1e") if r]
+        commits = list(_parsear_lote(registros, False, None, padres=True))
+    indice = {c["commit"]: i for i, c in enumerate(commits)}
+    padres = [[indice[p] for p in c["padres"] if p in indice] for c in commits]
+    mascaras = _mascaras(padres, [puntas.get(c["commit"], 0) for c in commits])
+
+    miembros: List[Set[int]] = [set() for _ in ramas]
+    for i, mascara in enumerate(mascaras):
+        while mascara:
+            bit = mascara & -mascara
+            miembros[bit.bit_length() - 1].add(i)
+            mascara ^= bit
+
+    resultados = []
+    for (nombre, sha), incluidos in zip(ramas, miembros):
+        # Mismo orden que `git log --reverse <tag>..<rama>`, incluso con fechas empatadas
+        orden = orden_log([indice.get(sha)], incluidos, padres.__getitem__, lambda i: commits[i]["timestamp"])
+        pendientes = [commits[i] for i in orden]
+        version = siguiente_version(pendientes, tag)
+        resultados.append(
+            {
+                "rama": nombre,
+                "sha": sha,
+                "commits": len(pendientes),
+                "version": version,
+                "incremento": incremento(tag, version),
+                "changelog": renderizar_seccion(pendientes, version) if pendientes else "",
+            }
+        )
+    return {"tag": tag, "commits_recorridos": len(commits), "ramas": resultados}
+
+
+def formatear_tabla(resumen: Dict) -> str:
+    """
+    Formatear el resumen de `previsualizar_ramas` como una tabla de texto.
+    """
+    filas = [("RAMA", "COMMITS", "VERSIÓN", "INCREMENTO")]
+    for rama in resumen["ramas"]:
+        filas.append((rama["rama"], str(rama["commits"]), rama["version"], rama["incremento"] or "-"))
+    anchos = [max(len(fila[i]) for fila in filas) for i in range(len(filas[0]))]
+    lineas = [f"Desde {resumen['tag']} ({resumen['commits_recorridos']} commits recorridos)"]
+    for fila in filas:
+        lineas.append("  ".join(valor.ljust(ancho) for valor, ancho in zip(fila, anchos)).rstrip())
+    return "\n".join(lineas)
+
+
+def ramas_cli(argv: List[str]) -> int:
+    """
+    Subcomando `ramas`: vista previa de la siguiente versión de cada rama.
+
+    Uso:
+        python -m scripts.changelog_generator ramas [--dir .] [--refs refs/heads ...] [--tag T]
+                                                    [--json] [--salida ARCHIVO]
+    """
+    parser = argparse.ArgumentParser(prog="changelog_generator ramas")
+    parser.add_argument("--dir", type=str, default=".", help="Ruta del repositorio")
+    parser.add_argument(
+        "--refs",
+        nargs="+",
+        default=["refs/heads"],
+        help="Patrones de refs a incluir (por defecto: refs/heads; p. ej. refs/remotes/origin refs/pull)",
+    )
+    parser.add_argument("--tag", type=str, default=None, help="Tag base (por defecto: el último alcanzable desde HEAD)")
+    parser.add_argument("--json", action="store_true", help="Imprimir el resumen en JSON, con el changelog de cada rama")
+    parser.add_argument("--salida", type=str, default=None, help="Guardar el resumen JSON en este archivo")
+    args = parser.parse_args(argv)
+
+    resumen = previsualizar_ramas(args.dir, args.refs, args.tag)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(resumen, f, indent=2, ensure_ascii=False)
+    if args.json:
+        print(json.dumps(resumen, indent=2, ensure_ascii=False))
+    else:
+        print(formatear_tabla(resumen))
+    return 0
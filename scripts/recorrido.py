@@ -0,0 +1,159 @@
+"""
+recorrido.py
+
+Filtros aplicados durante el recorrido de `git log` de iter_parsed_commits, antes de parsear:
+
+- Deduplicación por patch-id: un commit cuyo diff es idéntico al de un commit anterior
+  del rango (cherry-pick, o el mismo cambio integrado por dos caminos) se descarta.
+  Los patch-ids se calculan con `git log -p --reverse | git patch-id --stable` en
+  paralelo al recorrido principal, y se leen en el mismo orden.
+- Cancelación de reverts: si un commit revierte ("This reverts commit <hash>") a otro
+  commit del mismo rango, se descartan los dos. Un revert de un commit ya publicado en
+  un release anterior se conserva.
+
+`--first-parent` y `--no-merges` no necesitan filtros: `argumentos_recorrido` los arma
+para pasarlos directamente a git.
+"""
+
+import re
+import subprocess  # nosec B404
+from typing import Iterator, List, Set, Tuple
+
+from git import Repo
+
+REVERT = re.compile(r"^This reverts commit ([0-9a-f]{40,64})", re.MULTILINE)
+
+
+def argumentos_recorrido(first_parent: bool = False, no_merges: bool = False) -> List[str]:
+    """
+    Opciones de git que seleccionan los commits recorridos.
+    """
+    argumentos = []
+    if first_parent:
+        argumentos.append("--first-parent")
+    if no_merges:
+        argumentos.append("--no-merges")
+    return argumentos
+
+
+def commits_cancelados(repo: Repo, rango: List[str]) -> Set[str]:
+    """
+    Buscar los pares revert/revertido contenidos en el rango.
+
+    Los reverts se procesan del más reciente al más antiguo, de modo que en una
+    cadena X <- R1 <- R2 (R2 revierte a R1, que revierte a X) se cancelan R2 y R1
+    y X se conserva.
+
+    Argumentos
+    ----------
+    repo : Repo
+        Repositorio
+    rango : List[str]
+        Argumentos de revisión de git (rango y opciones de recorrido)
+
+    Retorna
+    -------
+    Set[str]
+        Hashes de los commits que deben descartarse
+    """
+    salida = repo.git.log("--grep=^This reverts commit", "--format=%H%x1f%B%x1e", *rango)
+    reverts = []
+    for registro in salida.split("\x1e"):
+        sha, _, mensaje = registro.strip().partition("\x1f")
+        coincidencia = REVERT.search(mensaje)
+        if coincidencia:
+            reverts.append((sha, coincidencia.group(1)))
+    if not reverts:
+        return set()
+
+    en_rango = set(repo.git.rev_list(*rango).split())
+    cancelados = set()
+    for sha, revertido in reverts:
+        if sha in cancelados or revertido in cancelados or revertido not in en_rango:
+            continue
+        cancelados.add(sha)
+        cancelados.add(revertido)
+    return cancelados
+
+
+def iter_patch_ids(repo: Repo, rango: List[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Calcular los patch-ids del rango, del commit más antiguo al más reciente.
+
+    Los commits sin diff (por ejemplo, merges fuera de --first-parent) no aparecen.
+
+    Retorna
+    -------
+    Iterator[Tuple[str, str]]
+        Pares (hash, patch-id)
+    """
+    log = subprocess.Popen(  # nosec B603 B607
+        ["git", "log", "--reverse", "-p", "--format=medium", "--no-color", "--no-ext-diff", *rango],
+        cwd=repo.working_dir,
+        stdout=subprocess.PIPE,
+    )
+    patch_id = subprocess.Popen(  # nosec B603 B607
+        ["git", "patch-id", "--stable"],
+        cwd=repo.working_dir,
+        stdin=log.stdout,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    # Solo git patch-id debe leer la salida de git log
+    log.stdout.close()
+    try:
+        for linea in patch_id.stdout:
+            identificador, sha = linea.split()
+            yield sha, identificador
+    finally:
+        for proc in (patch_id, log):
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+        patch_id.stdout.close()
+
+
+class FiltroRecorrido:
+    """
+    Decide, en el orden del recorrido, qué commits se conservan.
+
+    Argumentos
+    ----------
+    repo : Repo
+        Repositorio
+    rango : List[str]
+        Los mismos argumentos de revisión del recorrido principal (sin --reverse)
+    deduplicar : bool
+        Descartar commits con un patch-id ya visto
+    cancelar_reverts : bool
+        Descartar pares revert/revertido del rango
+    """
+
+    def __init__(self, repo: Repo, rango: List[str], deduplicar: bool = False, cancelar_reverts: bool = False):
+        self.cancelados = commits_cancelados(repo, rango) if cancelar_reverts else set()
+        self._patch_ids = iter_patch_ids(repo, rango) if deduplicar else None
+        self._pendiente = next(self._patch_ids, None) if deduplicar else None
+        self._vistos: Set[str] = set()
+        self.descartados = 0
+
+    def conservar(self, sha: str) -> bool:
+        """
+        Indicar si el commit `sha` se conserva. Debe llamarse para cada commit, en el
+        orden del recorrido (del más antiguo al más reciente).
+        """
+        conservar = sha not in self.cancelados
+        # Ambos streams tienen el mismo orden; un commit sin patch-id no consume ninguno
+        if self._pendiente is not None and self._pendiente[0] == sha:
+            identificador = self._pendiente[1]
+            self._pendiente = next(self._patch_ids, None)
+            if identificador in self._vistos:
+                conservar = False
+            elif conservar:
+                self._vistos.add(identificador)
+        if not conservar:
+            self.descartados += 1
+        return conservar
+
+    def cerrar(self) -> None:
+        if self._patch_ids is not None:
+            self._patch_ids.close()
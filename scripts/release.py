@@ -0,0 +1,327 @@
+"""
+release.py
+
+Flujo de liberación: generar el changelog, calcular la versión, crear el tag y
+enviarlo al remoto, para uno o varios repositorios.
+
+El flujo tiene tres fases:
+
+1. Preparación, en paralelo por repositorio: se generan parsed_commits.json,
+   CHANGELOG.md y metrics.json (ver `scripts.multi_repo.procesar_repositorio`) y se
+   consulta el estado del tag en el remoto con un solo `git ls-remote`.
+2. Decisión, en orden y en el hilo principal: se resuelve si se crea, reetiqueta o
+   fuerza cada tag, preguntando al usuario o, en modo no interactivo, según las
+   opciones `reetiquetar` y `forzar`.
+3. Publicación, en paralelo por repositorio: se crea el tag local y se envía con un
+   solo `git push`. El push usa --force-with-lease con el valor leído en la fase 1,
+   de modo que no se sobrescribe un tag que cambió en el remoto mientras tanto.
+
+Cada repositorio produce un diccionario de resultado; no se interpreta la salida
+estándar de ningún comando.
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from git import GitCommandError, Repo
+
+from scripts.multi_repo import _nombres_salida, procesar_repositorio
+
+
+def tags_remotos(repo: Repo, remoto: str, tags: List[str]) -> Dict[str, Tuple[str, str]]:
+    """
+    Consultar el estado de varios tags en el remoto con un solo `git ls-remote`.
+
+    Argumentos
+    ----------
+    repo : Repo
+        Repositorio local
+    remoto : str
+        Nombre o URL del remoto
+    tags : List[str]
+        Nombres de los tags a consultar
+
+    Retorna
+    -------
+    Dict[str, Tuple[str, str]]
+        Para cada tag que existe en el remoto, el valor del ref y el hash del commit
+        al que apunta (distintos en los tags anotados); los tags ausentes no aparecen
+    """
+    if not tags:
+        return {}
+    salida = repo.git.ls_remote("--tags", remoto, *[f"refs/tags/{tag}" for tag in tags])
+    refs = {}
+    commits = {}
+    for linea in salida.splitlines():
+        sha, _, ref = linea.partition("\t")
+        nombre = ref[len("refs/tags/"):]
+        if nombre.endswith("^{}"):
+            commits[nombre[:-3]] = sha
+        else:
+            refs[nombre] = sha
+    return {nombre: (sha, commits.get(nombre, sha)) for nombre, sha in refs.items()}
+
+
+def preparar_release(repo_path: str, salida_dir: str, remoto: str = "origin") -> Dict:
+    """
+    Generar los archivos del release y leer el estado local y remoto del tag.
+
+    Nunca lanza excepciones: los errores se devuelven en el resultado.
+
+    Argumentos
+    ----------
+    repo_path : str
+        Ruta del repositorio Git
+    salida_dir : str
+        Directorio donde se escriben CHANGELOG.md, metrics.json y parsed_commits.json
+    remoto : str
+        Remoto al que se envía el tag
+
+    Retorna
+    -------
+    Dict
+        Resultado de `procesar_repositorio` más "tag", "sha" (HEAD), "tag_local"
+        (commit del tag local o None), "tag_remoto" (commit del tag remoto o None) y
+        "ref_remoto" (valor del ref remoto, usado como condición del push)
+    """
+    resultado = procesar_repositorio(repo_path, salida_dir)
+    pendiente = resultado["estado"] == "sin_cambios" and resultado.get("version_actual")
+    if resultado["estado"] != "ok" and not pendiente:
+        return resultado
+    try:
+        repo = Repo(repo_path)
+        tag = resultado.get("version") or resultado["version_actual"]
+        resultado["tag"] = tag
+        resultado["sha"] = repo.head.commit.hexsha
+        resultado["tag_local"] = repo.tags[tag].commit.hexsha if tag in repo.tags else None
+        resultado["ref_remoto"], resultado["tag_remoto"] = tags_remotos(repo, remoto, [tag]).get(tag, (None, None))
+        # Sin commits nuevos, el último tag puede no haberse enviado en una ejecución anterior
+        if pendiente and resultado["tag_local"] == resultado["sha"] != resultado["tag_remoto"]:
+            resultado["estado"] = "ok"
+    except Exception as e:
+        resultado["estado"] = "error"
+        resultado["error"] = f"{type(e).__name__}: {e}"
+    return resultado
+
+
+def decidir_release(
+    resultado: Dict,
+    confirmar: Optional[Callable[[str, Dict], bool]] = None,
+    reetiquetar: bool = False,
+    forzar: bool = False,
+) -> None:
+    """
+    Completar el resultado con las acciones a realizar ("accion_tag" y "accion_push").
+
+    Acciones del tag: "crear", "reetiquetar" (mover un tag existente a HEAD) o None.
+    Acciones del push: "nuevo", "forzar", "al_dia" (el remoto ya apunta a HEAD) o None.
+
+    Argumentos
+    ----------
+    resultado : Dict
+        Resultado de `preparar_release`; se modifica en el lugar
+    confirmar : Callable[[str, Dict], bool]
+        Función que hace una pregunta al usuario. Si es None (modo no interactivo),
+        las preguntas se responden con `reetiquetar` y `forzar`
+    reetiquetar : bool
+        Mover a HEAD un tag local existente sin preguntar
+    forzar : bool
+        Reemplazar un tag existente en el remoto sin preguntar
+    """
+    if resultado["estado"] != "ok":
+        return
+
+    def aceptar(pregunta: str, permitido: bool) -> bool:
+        if permitido:
+            return True
+        return confirmar is not None and confirmar(pregunta, resultado)
+
+    tag = resultado["tag"]
+    sha = resultado["sha"]
+    resultado["accion_tag"] = None
+    resultado["accion_push"] = None
+
+    if resultado["tag_local"] is None:
+        resultado["accion_tag"] = "crear"
+    elif resultado["tag_local"] != sha:
+        if not aceptar(f"¿Deseas reetiquetar '{tag}' al último commit?", reetiquetar):
+            resultado["estado"] = "cancelado"
+            return
+        resultado["accion_tag"] = "reetiquetar"
+
+    remoto = resultado["tag_remoto"]
+    if remoto is None:
+        pregunta = f"¿Deseas {'crear y ' if resultado['accion_tag'] == 'crear' else ''}pushear el tag '{tag}'?"
+        if confirmar is not None and not confirmar(pregunta, resultado):
+            resultado["estado"] = "cancelado"
+            return
+        resultado["accion_push"] = "nuevo"
+    elif remoto == sha:
+        resultado["accion_push"] = "al_dia"
+    elif aceptar(f"El tag '{tag}' ya existe en el remoto. ¿Deseas forzar el push?", forzar):
+        resultado["accion_push"] = "forzar"
+
+
+def publicar_release(repo_path: str, resultado: Dict, remoto: str = "origin") -> None:
+    """
+    Crear o mover el tag local y enviarlo al remoto según las acciones decididas.
+
+    Nunca lanza excepciones: el estado final queda en resultado["estado"]
+    ("publicado", "local" si el push no se hizo, o "error").
+    """
+    if resultado["estado"] != "ok":
+        return
+    tag = resultado["tag"]
+    try:
+        repo = Repo(repo_path)
+        if resultado["accion_tag"] == "crear":
+            repo.git.tag(tag, resultado["sha"])
+        elif resultado["accion_tag"] == "reetiquetar":
+            repo.git.tag("-f", tag, resultado["sha"])
+
+        accion = resultado["accion_push"]
+        if accion in ("nuevo", "forzar"):
+            # Se exige que el remoto siga como en la consulta de la preparación
+            esperado = resultado["ref_remoto"] or ""
+            repo.git.push(
+                "--porcelain",
+                f"--force-with-lease=refs/tags/{tag}:{esperado}",
+                remoto,
+                f"refs/tags/{tag}:refs/tags/{tag}",
+            )
+        resultado["estado"] = "local" if accion is None else "publicado"
+    except GitCommandError as e:
+        resultado["estado"] = "error"
+        resultado["error"] = (e.stderr or str(e)).strip()
+    except Exception as e:
+        resultado["estado"] = "error"
+        resultado["error"] = f"{type(e).__name__}: {e}"
+
+
+def ejecutar_releases(
+    rutas: List[str],
+    remoto: str = "origin",
+    salida_dir: Optional[str] = None,
+    max_hilos: Optional[int] = None,
+    confirmar: Optional[Callable[[str, Dict], bool]] = None,
+    reetiquetar: bool = False,
+    forzar: bool = False,
+) -> Dict:
+    """
+    Ejecutar el flujo de liberación completo para varios repositorios.
+
+    Argumentos
+    ----------
+    rutas : List[str]
+        Rutas de los repositorios
+    remoto : str
+        Remoto al que se envían los tags
+    salida_dir : str
+        Directorio base de salida, con un subdirectorio por repositorio. Si es None,
+        cada repositorio escribe sus archivos en su propio directorio
+    max_hilos : int
+        Cantidad máxima de repositorios preparados o publicados a la vez
+    confirmar : Callable[[str, Dict], bool]
+        Función para preguntar al usuario; None para el modo no interactivo
+    reetiquetar : bool
+        Mover tags locales existentes sin preguntar
+    forzar : bool
+        Reemplazar tags remotos existentes sin preguntar
+
+    Retorna
+    -------
+    Dict
+        Resumen con totales por estado y el resultado de cada repositorio,
+        en el mismo orden de `rutas`
+    """
+    if salida_dir is None:
+        destinos = list(rutas)
+    else:
+        destinos = [os.path.join(salida_dir, nombre) for nombre in _nombres_salida(rutas)]
+
+    with ThreadPoolExecutor(max_workers=max_hilos) as pool:
+        resultados = list(pool.map(lambda par: preparar_release(par[0], par[1], remoto), zip(rutas, destinos)))
+        for resultado in resultados:
+            decidir_release(resultado, confirmar, reetiquetar, forzar)
+        list(pool.map(lambda par: publicar_release(par[0], par[1], remoto), zip(rutas, resultados)))
+
+    estados = [r["estado"] for r in resultados]
+    return {
+        "total": len(resultados),
+        "publicados": estados.count("publicado"),
+        "locales": estados.count("local"),
+        "sin_cambios": estados.count("sin_cambios"),
+        "cancelados": estados.count("cancelado"),
+        "fallidos": estados.count("error"),
+        "repositorios": resultados,
+    }
+
+
+def _confirmar_terminal(pregunta: str, resultado: Dict) -> bool:
+    """
+    Mostrar la vista previa del changelog (una vez por repositorio) y preguntar por la terminal.
+    """
+    if not resultado.get("_vista_previa"):
+        resultado["_vista_previa"] = True
+        with open(os.path.join(resultado["salida"], "CHANGELOG.md"), encoding="utf-8") as f:
+            lineas = f.readlines()
+        print(f"\nVista previa del CHANGELOG.md de {resultado['repo']}:")
+        print("----------------------------------------")
+        print("".join(lineas[-20:]).rstrip())
+        print("----------------------------------------")
+        print(f"Versión sugerida: {resultado['tag']} (actual: {resultado['version_actual']})\n")
+    respuesta = input(f"{pregunta} [y/N]: ")
+    return respuesta.strip().lower() in ("y", "s")
+
+
+def release_cli(argv: List[str]) -> int:
+    """
+    Subcomando `release`: generar el changelog, crear el tag y enviarlo al remoto.
+
+    Uso:
+        python -m scripts.changelog_generator release [REPO ...] [--remoto R] [--salida DIR] [--hilos N]
+                                                      [--no-interactivo] [--reetiquetar] [--forzar] [--json]
+
+    Retorna 0 si ningún repositorio falló y 1 en caso contrario.
+    """
+    parser = argparse.ArgumentParser(prog="changelog_generator release")
+    parser.add_argument("repos", nargs="*", default=["."], help="Repositorios a liberar (por defecto: .)")
+    parser.add_argument("--remoto", type=str, default="origin", help="Remoto de los tags (por defecto: origin)")
+    parser.add_argument(
+        "--salida", type=str, default=None, help="Directorio de salida por repositorio (por defecto: cada repositorio)"
+    )
+    parser.add_argument("--hilos", type=int, default=None, help="Repositorios procesados a la vez")
+    parser.add_argument(
+        "--no-interactivo", action="store_true", help="No hacer preguntas; crear y pushear los tags nuevos (para CI)"
+    )
+    parser.add_argument("--reetiquetar", action="store_true", help="Mover tags locales existentes al último commit")
+    parser.add_argument("--forzar", action="store_true", help="Reemplazar tags que ya existen en el remoto")
+    parser.add_argument("--json", action="store_true", help="Imprimir el resumen en JSON")
+    args = parser.parse_args(argv)
+
+    confirmar = None if args.no_interactivo else _confirmar_terminal
+    resumen = ejecutar_releases(
+        args.repos, args.remoto, args.salida, args.hilos, confirmar, args.reetiquetar, args.forzar
+    )
+    for resultado in resumen["repositorios"]:
+        resultado.pop("_vista_previa", None)
+
+    if args.json:
+        print(json.dumps(resumen, indent=2, ensure_ascii=False))
+    else:
+        for resultado in resumen["repositorios"]:
+            detalle = resultado.get("tag") or resultado.get("version_actual") or ""
+            if resultado["estado"] == "error":
+                detalle = resultado["error"]
+            elif resultado.get("accion_push"):
+                detalle += f" (push: {resultado['accion_push']})"
+            print(f"{resultado['repo']}: {resultado['estado']} {detalle}".rstrip())
+    return 1 if resumen["fallidos"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(release_cli(sys.argv[1:]))
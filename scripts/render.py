@@ -0,0 +1,292 @@
+"""
+render.py
+
+Notas de release en varios formatos (markdown, HTML, JSON, resumen de Slack o formatos
+definidos por el usuario) a partir de una sola pasada sobre los commits.
+
+Cada formato es una plantilla con piezas en sintaxis de `string.Template`:
+
+- "encabezado" y "pie": variables $version y $total
+- "seccion" y "fin_seccion": $tipo, $titulo y $cantidad, una vez por tipo de commit
+- "item": $descripcion, $escopo, $tipo, $commit y $commit_corto, una vez por commit
+- "separador_secciones" y "separador_items": texto entre secciones y entre items
+
+Las piezas se compilan una vez a cadenas de `str.format` (las variables desconocidas
+se reportan al cargar la plantilla) y se guardan en caché por archivo. Los valores se
+escapan según el "escape" del formato: "html", "json", "slack" o "ninguno".
+
+Los commits se agrupan por tipo una sola vez; después se recorren los grupos y cada
+pieza se escribe en todos los archivos de salida en la misma pasada.
+
+Plantillas de usuario (`--plantillas`), que agregan formatos o reemplazan piezas de
+los formatos incluidos:
+
+    {
+      "formatos": {
+        "rss": {"extension": "xml", "escape": "html", "item": "<item><title>$descripcion</title></item>\\n"}
+      }
+    }
+"""
+
+import html
+import json
+import os
+from collections import defaultdict
+from string import Template
+from json.encoder import encode_basestring
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from scripts.changelog_generator import TIPO_TO_TITULO
+
+VARIABLES = {
+    "encabezado": {"version", "total"},
+    "pie": {"version", "total"},
+    "seccion": {"tipo", "titulo", "cantidad"},
+    "fin_seccion": {"tipo", "titulo", "cantidad"},
+    "item": {"descripcion", "escopo", "tipo", "commit", "commit_corto"},
+    "separador_secciones": set(),
+    "separador_items": set(),
+}
+
+ESCAPES: Dict[str, Callable[[str], str]] = {
+    "ninguno": lambda texto: texto,
+    "html": html.escape,
+    # Contenido de una cadena JSON, sin las comillas
+    "json": lambda texto: encode_basestring(texto)[1:-1],
+    "slack": lambda texto: texto.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;"),
+}
+
+# El formato "md" produce el mismo CHANGELOG.md que `generar_changelog_md`
+PLANTILLAS_BASE = {
+    "md": {
+        "archivo": "CHANGELOG.md",
+        "encabezado": "# Changelog\n\n## $version\n",
+        "seccion": "\n### $titulo\n",
+        "item": "- $descripcion\n",
+    },
+    "html": {
+        "extension": "html",
+        "escape": "html",
+        "encabezado": '<section class="release">\n<h2>$version</h2>\n',
+        "seccion": "<h3>$titulo</h3>\n<ul>\n",
+        "item": '  <li>$descripcion <code>$commit_corto</code></li>\n',
+        "fin_seccion": "</ul>\n",
+        "pie": "</section>\n",
+    },
+    "json": {
+        "extension": "json",
+        "escape": "json",
+        "encabezado": '{"version": "$version", "total": $total, "secciones": [',
+        "seccion": '{"tipo": "$tipo", "titulo": "$titulo", "commits": [',
+        "item": '{"commit": "$commit", "escopo": "$escopo", "descripcion": "$descripcion"}',
+        "separador_items": ", ",
+        "fin_seccion": "]}",
+        "separador_secciones": ", ",
+        "pie": "]}\n",
+    },
+    "slack": {
+        "extension": "txt",
+        "escape": "slack",
+        "encabezado": "*Release $version* ($total commits)\n",
+        "seccion": "\n*$titulo* ($cantidad)\n",
+        "item": "• $descripcion\n",
+    },
+}
+
+# Plantillas compiladas por archivo: (ruta, mtime, tamaño) -> formatos
+_CACHE: Dict[Tuple, Dict[str, "Plantilla"]] = {}
+
+
+def compilar(texto: str, variables: Iterable[str], pieza: str = "plantilla") -> Tuple[str, Tuple[str, ...]]:
+    """
+    Convertir una pieza en sintaxis de `string.Template` en una cadena de `str.format`.
+
+    Argumentos
+    ----------
+    texto : str
+        Pieza con variables $nombre o ${nombre} ("$$" es un "$" literal)
+    variables : Iterable[str]
+        Variables permitidas en la pieza
+    pieza : str
+        Nombre de la pieza, para los mensajes de error
+
+    Retorna
+    -------
+    Tuple[str, Tuple[str, ...]]
+        Cadena para `str.format_map`, con las llaves literales escapadas, y las variables
+        que usa (solo esas se escapan al renderizar)
+    """
+    variables = set(variables)
+    usadas = {}
+    partes = []
+    inicio = 0
+    for match in Template.pattern.finditer(texto):
+        partes.append(texto[inicio:match.start()].replace("{", "{{").replace("}", "}}"))
+        inicio = match.end()
+        if match.group("escaped") is not None:
+            partes.append("$")
+            continue
+        nombre = match.group("named") or match.group("braced")
+        if nombre is None:
+            raise ValueError(f"Marcador inválido en '{pieza}', posición {match.start()}")
+        if nombre not in variables:
+            disponibles = ", ".join(f"${v}" for v in sorted(variables)) or "ninguna"
+            raise ValueError(f"Variable ${nombre} desconocida en '{pieza}' (disponibles: {disponibles})")
+        usadas[nombre] = None
+        partes.append("{" + nombre + "}")
+    partes.append(texto[inicio:].replace("{", "{{").replace("}", "}}"))
+    return "".join(partes), tuple(usadas)
+
+
+class Plantilla:
+    """
+    Formato de salida con sus piezas ya compiladas.
+
+    Argumentos
+    ----------
+    nombre : str
+        Nombre del formato
+    definicion : Dict
+        Piezas (ver VARIABLES), "escape", "extension" y "archivo" (opcionales)
+    """
+
+    def __init__(self, nombre: str, definicion: Dict):
+        desconocidas = set(definicion) - set(VARIABLES) - {"escape", "extension", "archivo"}
+        if desconocidas:
+            raise ValueError(f"Claves desconocidas en la plantilla '{nombre}': {', '.join(sorted(desconocidas))}")
+        escape = definicion.get("escape", "ninguno")
+        if escape not in ESCAPES:
+            raise ValueError(f"Escape '{escape}' desconocido en la plantilla '{nombre}'")
+        self.nombre = nombre
+        # None si los valores se escriben sin escapar
+        self.escapar = ESCAPES[escape] if escape != "ninguno" else None
+        extension = definicion.get("extension", nombre)
+        self.archivo = definicion.get("archivo", f"release-notes.{extension}")
+        self.piezas = {
+            pieza: compilar(definicion.get(pieza, ""), variables, f"{nombre}.{pieza}")
+            for pieza, variables in VARIABLES.items()
+        }
+
+
+def cargar_plantillas(ruta: Optional[str] = None) -> Dict[str, Plantilla]:
+    """
+    Compilar los formatos incluidos y los del archivo `ruta`, una vez por versión del archivo.
+
+    Argumentos
+    ----------
+    ruta : str
+        Archivo JSON con la clave "formatos" (opcional). Cada formato agrega uno nuevo o
+        reemplaza piezas de uno incluido
+
+    Retorna
+    -------
+    Dict[str, Plantilla]
+        Formatos disponibles por nombre
+    """
+    estado = os.stat(ruta) if ruta else None
+    clave = (ruta, estado.st_mtime_ns, estado.st_size) if estado else (None,)
+    if clave not in _CACHE:
+        definiciones = {nombre: dict(definicion) for nombre, definicion in PLANTILLAS_BASE.items()}
+        if ruta:
+            with open(ruta, encoding="utf-8") as f:
+                for nombre, definicion in json.load(f).get("formatos", {}).items():
+                    definiciones.setdefault(nombre, {}).update(definicion)
+        _CACHE[clave] = {nombre: Plantilla(nombre, d) for nombre, d in definiciones.items()}
+    return _CACHE[clave]
+
+
+def agrupar(parsed_commits: Iterable[Dict]) -> Tuple[Dict[str, List[Dict[str, str]]], int]:
+    """
+    Agrupar los commits por tipo en una sola pasada, con los valores de sus items.
+
+    Retorna
+    -------
+    Tuple[Dict[str, List[Dict[str, str]]], int]
+        Valores de cada item por tipo, en el orden de los commits, y el total de commits
+    """
+    grupos = defaultdict(list)
+    total = 0
+    for c in parsed_commits:
+        mensaje = c["mensaje"]
+        grupos[mensaje["tipo"]].append(
+            {
+                "descripcion": mensaje["descripcion"] or "",
+                "escopo": mensaje["escopo"] or "",
+                "tipo": mensaje["tipo"],
+                "commit": c["commit"],
+                "commit_corto": c["commit"][:7],
+            }
+        )
+        total += 1
+    return grupos, total
+
+
+def renderizar_notas(
+    parsed_commits: Iterable[Dict],
+    version: str,
+    destinos: Dict[str, str],
+    plantillas: Optional[Dict[str, Plantilla]] = None,
+) -> Dict[str, str]:
+    """
+    Escribir las notas de release de una versión en todos los formatos pedidos.
+
+    Argumentos
+    ----------
+    parsed_commits : Iterable[Dict]
+        Commits parseados (lista o generador); se recorren una sola vez
+    version : str
+        Versión de las notas
+    destinos : Dict[str, str]
+        Archivo de salida por nombre de formato
+    plantillas : Dict[str, Plantilla]
+        Formatos disponibles (por defecto, `cargar_plantillas()`)
+
+    Retorna
+    -------
+    Dict[str, str]
+        Los mismos destinos, por formato
+    """
+    plantillas = plantillas if plantillas is not None else cargar_plantillas()
+    desconocidos = set(destinos) - set(plantillas)
+    if desconocidos:
+        raise ValueError(f"Formatos de notas desconocidos: {', '.join(sorted(desconocidos))}")
+
+    grupos, total = agrupar(parsed_commits)
+    salidas = []
+    try:
+        for formato, archivo in destinos.items():
+            salidas.append((plantillas[formato], open(archivo, "w", encoding="utf-8")))
+
+        def escribir(pieza: str, valores: Dict[str, str]) -> None:
+            for plantilla, f in salidas:
+                formato, usadas = plantilla.piezas[pieza]
+                if plantilla.escapar is not None:
+                    escapar = plantilla.escapar
+                    f.write(formato.format_map({clave: escapar(valores[clave]) for clave in usadas}))
+                else:
+                    f.write(formato.format_map(valores))
+
+        generales = {"version": version, "total": str(total)}
+        escribir("encabezado", generales)
+        primera = True
+        for tipo, titulo in TIPO_TO_TITULO.items():
+            if tipo not in grupos:
+                continue
+            if not primera:
+                escribir("separador_secciones", {})
+            primera = False
+            seccion = {"tipo": tipo, "titulo": titulo.lstrip("# "), "cantidad": str(len(grupos[tipo]))}
+            escribir("seccion", seccion)
+            for i, item in enumerate(grupos[tipo]):
+                if i:
+                    escribir("separador_items", {})
+                escribir("item", item)
+            escribir("fin_seccion", seccion)
+        escribir("pie", generales)
+    finally:
+        for _, f in salidas:
+            f.close()
+
+    for formato, archivo in destinos.items():
+        print(f"Notas '{formato}' generadas en '{archivo}'")
+    return destinos
@@ -0,0 +1,375 @@
+"""
+servidor.py
+
+Modo servidor: mantiene el repositorio abierto y un índice en memoria de los commits
+parseados, y responde consultas por HTTP (TCP o socket Unix) sin volver a leer el
+historial en cada llamada.
+
+El índice se actualiza cuando cambian los refs, detectado con `estado_refs` cada
+`intervalo` segundos. Si HEAD avanzó sobre el commit anterior solo se parsean los
+commits nuevos; si el historial se reescribió, el índice se reconstruye.
+
+Endpoints (GET, respuestas JSON salvo /changelog):
+    /next-version?desde=TAG     siguiente versión desde TAG (por defecto, el último tag)
+    /changelog?desde=TAG&version=V   sección markdown del changelog
+    /metrics?desde=TAG          métricas de flujo
+    /commits?tipo=T&desde=TAG   commits parseados de TAG..HEAD, filtrados por tipo
+    /commits/<hash>             un commit
+    /health                     estado del índice
+"""
+
+import argparse
+import json
+import logging
+import os
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Set
+from urllib.parse import parse_qs, urlparse
+
+from git import Repo
+
+from scripts.changelog_generator import (
+    calcular_metricas,
+    iter_parsed_commits,
+    renderizar_seccion,
+    siguiente_version,
+)
+from scripts.tags import estado_refs, version_tag
+
+
+class TagDesconocido(KeyError):
+    """
+    El tag pedido no existe o no es alcanzable desde HEAD.
+    """
+
+
+class IndiceCommits:
+    """
+    Índice en memoria de los commits alcanzables desde HEAD, indexados por hash.
+
+    Los filtros por tipo y por tag recorren `orden` y se reutilizan hasta el siguiente
+    cambio de refs.
+
+    Argumentos
+    ----------
+    repo_path : str
+        Ruta del repositorio
+    """
+
+    def __init__(self, repo_path: str = "."):
+        self.repo_path = repo_path
+        self.repo = Repo(repo_path)
+        self._lock = threading.RLock()
+        self._detener = threading.Event()
+        self._vigilante = None
+        self.estado = None
+        self.head = None
+        self.actualizaciones = 0
+        self._reiniciar()
+        self.actualizar()
+
+    def _reiniciar(self) -> None:
+        self.orden: List[Dict] = []
+        self.por_sha: Dict[str, Dict] = {}
+        self.tags: Dict[str, str] = {}
+        self._alcanzables: Dict[str, Set[str]] = {}
+        self._rangos: Dict[Optional[str], List[Dict]] = {}
+        self._resultados: Dict[tuple, object] = {}
+
+    def _agregar(self, commits) -> int:
+        total = 0
+        for commit in commits:
+            self.orden.append(commit)
+            self.por_sha[commit["commit"]] = commit
+            total += 1
+        return total
+
+    def _leer_tags(self) -> Dict[str, str]:
+        # El índice ya contiene todo lo alcanzable desde HEAD: filtrar ahí evita `--merged=HEAD`,
+        # que recorre el historial completo en cada cambio de refs
+        salida = self.repo.git.for_each_ref(
+            "--format=%(refname:strip=2)%09%(objectname)%09%(*objectname)", "refs/tags"
+        )
+        tags = {}
+        for linea in salida.splitlines():
+            nombre, objeto, apuntado = linea.split("\t")
+            if version_tag(nombre) and (apuntado or objeto) in self.por_sha:
+                tags[nombre] = apuntado or objeto
+        return tags
+
+    def actualizar(self) -> bool:
+        """
+        Actualizar el índice si los refs cambiaron desde la última consulta.
+
+        Retorna
+        -------
+        bool
+            True si el índice cambió
+        """
+        with self._lock:
+            estado = estado_refs(self.repo)
+            if estado == self.estado:
+                return False
+            head = self.repo.git.rev_parse("HEAD")
+            if head != self.head:
+                if self.head and self.repo.is_ancestor(self.head, head):
+                    nuevos = iter_parsed_commits(self.repo_path, since=self.head, until=head, padres=True)
+                    agregados = self._agregar(nuevos)
+                    logging.info(f"Índice actualizado: {agregados} commits nuevos")
+                else:
+                    self._reiniciar()
+                    agregados = self._agregar(iter_parsed_commits(self.repo_path, until=head, padres=True))
+                    logging.info(f"Índice reconstruido: {agregados} commits")
+                self.head = head
+            self.tags = self._leer_tags()
+            # La alcanzabilidad de un commit no cambia; solo los rangos dependen de HEAD y los tags
+            self._rangos = {}
+            self._resultados = {}
+            self.estado = estado
+            self.actualizaciones += 1
+            return True
+
+    def _alcanzables_desde(self, sha: str) -> Set[str]:
+        alcanzables = self._alcanzables.get(sha)
+        if alcanzables is None:
+            alcanzables = set()
+            pendientes = [sha]
+            while pendientes:
+                actual = pendientes.pop()
+                if actual in alcanzables:
+                    continue
+                alcanzables.add(actual)
+                commit = self.por_sha.get(actual)
+                if commit is not None:
+                    pendientes.extend(commit["padres"])
+            self._alcanzables[sha] = alcanzables
+        return alcanzables
+
+    def ultimo_tag(self) -> Optional[str]:
+        """
+        Tag de mayor versión alcanzable desde HEAD, o None si no hay ninguno.
+        """
+        with self._lock:
+            return max(self.tags, key=version_tag, default=None)
+
+    def commit(self, sha: str) -> Optional[Dict]:
+        """
+        Commit parseado con hash `sha`, o None si no está en el índice.
+        """
+        with self._lock:
+            return self.por_sha.get(sha)
+
+    def commits_desde(self, tag: Optional[str] = None) -> List[Dict]:
+        """
+        Commits del rango TAG..HEAD, del más antiguo al más reciente.
+
+        Argumentos
+        ----------
+        tag : Optional[str]
+            Tag inicial (excluido); por defecto el último tag. Sin tags se devuelve todo el historial.
+        """
+        with self._lock:
+            tag = tag or self.ultimo_tag()
+            rango = self._rangos.get(tag)
+            if rango is None:
+                if tag is None:
+                    rango = list(self.orden)
+                else:
+                    if tag not in self.tags:
+                        raise TagDesconocido(tag)
+                    excluidos = self._alcanzables_desde(self.tags[tag])
+                    rango = [c for c in self.orden if c["commit"] not in excluidos]
+                self._rangos[tag] = rango
+            return rango
+
+    def _memorizar(self, clave: tuple, calcular):
+        # Las respuestas se reutilizan hasta que cambian los refs
+        with self._lock:
+            if clave not in self._resultados:
+                self._resultados[clave] = calcular()
+            return self._resultados[clave]
+
+    def siguiente_version(self, tag: Optional[str] = None) -> Dict:
+        def calcular():
+            actual = tag or self.ultimo_tag()
+            commits = self.commits_desde(actual)
+            return {
+                "tag_actual": actual,
+                "siguiente_version": siguiente_version(commits, actual or "v0.0.0"),
+                "commits": len(commits),
+            }
+
+        return self._memorizar(("version", tag), calcular)
+
+    def changelog(self, tag: Optional[str] = None, version: Optional[str] = None) -> str:
+        def calcular():
+            commits = self.commits_desde(tag)
+            titulo = version or self.siguiente_version(tag)["siguiente_version"]
+            return "# Changelog\n\n" + renderizar_seccion(commits, titulo)
+
+        return self._memorizar(("changelog", tag, version), calcular)
+
+    def metricas(self, tag: Optional[str] = None) -> Dict:
+        return self._memorizar(("metricas", tag), lambda: calcular_metricas(self.commits_desde(tag)))
+
+    def commits(self, tipo: Optional[str] = None, tag: Optional[str] = None) -> List[Dict]:
+        """
+        Commits de `commits_desde(tag)`, filtrados por tipo si se indica.
+        """
+        if tipo is None:
+            return self.commits_desde(tag)
+        return self._memorizar(
+            ("commits", tag, tipo), lambda: [c for c in self.commits_desde(tag) if c["mensaje"]["tipo"] == tipo]
+        )
+
+    def iniciar_vigilancia(self, intervalo: float = 1.0) -> None:
+        """
+        Revisar los refs cada `intervalo` segundos en un hilo de fondo.
+        """
+
+        def vigilar():
+            while not self._detener.wait(intervalo):
+                try:
+                    self.actualizar()
+                except Exception as e:
+                    logging.error(f"No se pudo actualizar el índice: {e}")
+
+        self._vigilante = threading.Thread(target=vigilar, name="vigilante-refs", daemon=True)
+        self._vigilante.start()
+
+    def detener(self) -> None:
+        self._detener.set()
+        if self._vigilante is not None:
+            self._vigilante.join()
+
+
+class ManejadorConsultas(BaseHTTPRequestHandler):
+    """
+    Traduce las rutas HTTP a consultas sobre `self.server.indice`.
+    """
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parametros = {clave: valores[-1] for clave, valores in parse_qs(url.query).items()}
+        indice = self.server.indice
+        desde = parametros.get("desde")
+        try:
+            if url.path == "/next-version":
+                self._json(200, indice.siguiente_version(desde))
+            elif url.path == "/changelog":
+                texto = indice.changelog(desde, parametros.get("version"))
+                self._responder(200, texto.encode("utf-8"), "text/markdown; charset=utf-8")
+            elif url.path == "/metrics":
+                self._json(200, indice.metricas(desde))
+            elif url.path == "/commits":
+                self._json(200, indice.commits(parametros.get("tipo"), desde))
+            elif url.path.startswith("/commits/"):
+                commit = indice.commit(url.path[len("/commits/"):])
+                if commit is None:
+                    self._json(404, {"error": "commit no encontrado"})
+                else:
+                    self._json(200, commit)
+            elif url.path == "/health":
+                self._json(
+                    200,
+                    {
+                        "head": indice.head,
+                        "commits": len(indice.orden),
+                        "tags": len(indice.tags),
+                        "actualizaciones": indice.actualizaciones,
+                    },
+                )
+            else:
+                self._json(404, {"error": f"ruta desconocida: {url.path}"})
+        except TagDesconocido as e:
+            self._json(404, {"error": f"tag desconocido: {e.args[0]}"})
+        except ValueError as e:
+            self._json(422, {"error": str(e)})
+
+    def _json(self, codigo: int, datos) -> None:
+        self._responder(codigo, json.dumps(datos, ensure_ascii=False).encode("utf-8"), "application/json")
+
+    def _responder(self, codigo: int, cuerpo: bytes, tipo: str) -> None:
+        self.send_response(codigo)
+        self.send_header("Content-Type", tipo)
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def address_string(self) -> str:
+        # En un socket Unix client_address no es una tupla (host, puerto)
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, formato, *args):
+        logging.debug("%s - %s", self.address_string(), formato % args)
+
+
+class ServidorHTTP(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, direccion, indice: IndiceCommits):
+        super().__init__(direccion, ManejadorConsultas)
+        self.indice = indice
+
+
+class ServidorUnix(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, ruta: str, indice: IndiceCommits):
+        if os.path.exists(ruta):
+            os.unlink(ruta)
+        super().__init__(ruta, ManejadorConsultas)
+        self.indice = indice
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def servir_cli(argv: List[str]) -> int:
+    """
+    Subcomando `serve`: iniciar el servidor hasta recibir Ctrl+C.
+
+    Uso:
+        python -m scripts.changelog_generator serve [-d DIR] [--host H] [--puerto P] [--socket RUTA] [--intervalo S]
+    """
+    parser = argparse.ArgumentParser(prog="changelog_generator serve")
+    parser.add_argument("-d", "--dir", type=str, default=".", help="Ruta al repositorio Git")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Dirección HTTP (por defecto: 127.0.0.1)")
+    parser.add_argument("--puerto", type=int, default=8765, help="Puerto HTTP; 0 desactiva HTTP (por defecto: 8765)")
+    parser.add_argument("--socket", type=str, default=None, help="Ruta de un socket Unix adicional")
+    parser.add_argument(
+        "--intervalo", type=float, default=1.0, help="Segundos entre revisiones de los refs (por defecto: 1)"
+    )
+    args = parser.parse_args(argv)
+    if not args.puerto and not args.socket:
+        parser.error("se necesita --puerto o --socket")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    indice = IndiceCommits(args.dir)
+    indice.iniciar_vigilancia(args.intervalo)
+
+    servidores = []
+    if args.puerto:
+        servidores.append(ServidorHTTP((args.host, args.puerto), indice))
+        logging.info(f"Escuchando en http://{args.host}:{args.puerto}")
+    if args.socket:
+        servidores.append(ServidorUnix(args.socket, indice))
+        logging.info(f"Escuchando en el socket {args.socket}")
+
+    hilos = [threading.Thread(target=s.serve_forever, daemon=True) for s in servidores]
+    for hilo in hilos:
+        hilo.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for servidor in servidores:
+            servidor.shutdown()
+            servidor.server_close()
+        indice.detener()
+    return 0
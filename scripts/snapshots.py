@@ -0,0 +1,390 @@
+"""
+snapshots.py
+
+Snapshots inmutables de métricas por release, para consultar tendencias históricas
+sin volver a recorrer el historial.
+
+Cada tag semántico alcanzable desde HEAD tiene un snapshot con las métricas de su
+rango (desde el tag anterior en orden de versión hasta el tag): cantidad de commits,
+fechas del primer y último commit, throughput (con la misma fórmula que
+`calcular_metricas`), distribución por tipo y conteos por escopo y por autor.
+
+Los snapshots se guardan en una base SQLite. Un snapshot nunca se modifica: la base
+rechaza UPDATE y DELETE con triggers, y si un tag ya registrado apunta a otro commit
+se reporta un error en lugar de recalcularlo. Al registrar solo se recorren los
+rangos de los tags que todavía no tienen snapshot; las consultas (por ejemplo, el
+throughput de los últimos 20 releases) solo leen la base y no ejecutan git.
+
+Uso:
+    python -m scripts.changelog_generator snapshots registrar [--dir .] [--db ARCHIVO]
+    python -m scripts.changelog_generator snapshots consultar [--db ARCHIVO] [--ultimos N]
+                                                              [--dimension tipo|escopo|autor] [--json]
+"""
+
+import argparse
+import json
+import sqlite3
+import subprocess  # nosec B404
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+ARCHIVO_SNAPSHOTS = "metrics-snapshots.sqlite"
+
+DIMENSIONES = ("tipo", "escopo", "autor")
+
+# Clave de cada dimensión en los snapshots devueltos
+CLAVES_DIMENSION = {"tipo": "task_distribution", "escopo": "escopos", "autor": "autores"}
+
+
+def orden_version(version: Tuple[int, int, int]) -> int:
+    """
+    Entero que ordena las versiones (mayor, menor, parche) como la comparación semántica.
+    """
+    mayor, menor, parche = version
+    return (mayor << 40) | (menor << 20) | parche
+
+
+class AlmacenSnapshots:
+    """
+    Base SQLite de snapshots de métricas por tag.
+
+    Argumentos
+    ----------
+    ruta : str
+        Archivo SQLite (se crea si no existe)
+    """
+
+    def __init__(self, ruta: str = ARCHIVO_SNAPSHOTS):
+        self.ruta = ruta
+        self._conn = sqlite3.connect(ruta)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS snapshots (
+                tag TEXT PRIMARY KEY,
+                sha TEXT NOT NULL,
+                anterior TEXT,
+                orden INTEGER NOT NULL,
+                commits INTEGER NOT NULL,
+                fecha_inicio INTEGER,
+                fecha_fin INTEGER,
+                throughput REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS snapshots_orden ON snapshots (orden);
+            CREATE TABLE IF NOT EXISTS conteos (
+                tag TEXT NOT NULL,
+                dimension TEXT NOT NULL,
+                clave TEXT NOT NULL,
+                cantidad INTEGER NOT NULL,
+                PRIMARY KEY (tag, dimension, clave)
+            ) WITHOUT ROWID;
+            CREATE TRIGGER IF NOT EXISTS snapshots_sin_update BEFORE UPDATE ON snapshots
+                BEGIN SELECT RAISE(ABORT, 'los snapshots son inmutables'); END;
+            CREATE TRIGGER IF NOT EXISTS snapshots_sin_delete BEFORE DELETE ON snapshots
+                BEGIN SELECT RAISE(ABORT, 'los snapshots son inmutables'); END;
+            CREATE TRIGGER IF NOT EXISTS conteos_sin_update BEFORE UPDATE ON conteos
+                BEGIN SELECT RAISE(ABORT, 'los snapshots son inmutables'); END;
+            CREATE TRIGGER IF NOT EXISTS conteos_sin_delete BEFORE DELETE ON conteos
+                BEGIN SELECT RAISE(ABORT, 'los snapshots son inmutables'); END;
+            """
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    def registrados(self) -> Dict[str, str]:
+        """
+        Hash del commit de cada tag con snapshot.
+        """
+        return dict(self._conn.execute("SELECT tag, sha FROM snapshots"))
+
+    def guardar(self, snapshot: Dict) -> None:
+        """
+        Guardar un snapshot nuevo, en una sola transacción.
+
+        Argumentos
+        ----------
+        snapshot : Dict
+            Snapshot de `calcular_snapshot`
+        """
+        from scripts.tags import version_tag
+
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    snapshot["tag"],
+                    snapshot["sha"],
+                    snapshot["anterior"],
+                    orden_version(version_tag(snapshot["tag"])),
+                    snapshot["commits"],
+                    snapshot["fecha_inicio"],
+                    snapshot["fecha_fin"],
+                    snapshot["throughput_commits_por_dia"],
+                ),
+            )
+            self._conn.executemany(
+                "INSERT INTO conteos VALUES (?, ?, ?, ?)",
+                (
+                    (snapshot["tag"], dimension, clave, cantidad)
+                    for dimension in DIMENSIONES
+                    for clave, cantidad in snapshot[CLAVES_DIMENSION[dimension]].items()
+                ),
+            )
+
+    def ultimos(self, cantidad: int = 20, dimensiones: Iterable[str] = DIMENSIONES) -> List[Dict]:
+        """
+        Leer los snapshots de los últimos releases, sin ejecutar git.
+
+        Argumentos
+        ----------
+        cantidad : int
+            Cantidad de releases, contando desde la versión más alta
+        dimensiones : Iterable[str]
+            Conteos a incluir ("tipo", "escopo", "autor")
+
+        Retorna
+        -------
+        List[Dict]
+            Snapshots en orden de versión, del más antiguo al más reciente
+        """
+        dimensiones = list(dimensiones)
+        filas = self._conn.execute(
+            "SELECT tag, sha, anterior, commits, fecha_inicio, fecha_fin, throughput "
+            "FROM snapshots ORDER BY orden DESC LIMIT ?",
+            (cantidad,),
+        ).fetchall()
+        filas.reverse()
+        snapshots = {
+            tag: {
+                "tag": tag,
+                "sha": sha,
+                "anterior": anterior,
+                "commits": commits,
+                "fecha_inicio": fecha_inicio,
+                "fecha_fin": fecha_fin,
+                "throughput_commits_por_dia": throughput,
+                **{CLAVES_DIMENSION[d]: {} for d in dimensiones},
+            }
+            for tag, sha, anterior, commits, fecha_inicio, fecha_fin, throughput in filas
+        }
+        if snapshots and dimensiones:
+            marcadores = ",".join("?" * len(dimensiones))
+            conteos = self._conn.execute(
+                "SELECT tag, dimension, clave, cantidad FROM conteos "  # nosec B608
+                "WHERE tag IN (SELECT tag FROM snapshots ORDER BY orden DESC LIMIT ?) "
+                f"AND dimension IN ({marcadores}) ORDER BY tag, dimension, cantidad DESC, clave",
+                [cantidad, *dimensiones],
+            )
+            for tag, dimension, clave, cantidad in conteos:
+                snapshots[tag][CLAVES_DIMENSION[dimension]][clave] = cantidad
+        return list(snapshots.values())
+
+    def cerrar(self) -> None:
+        self._conn.close()
+
+
+def calcular_snapshot(commits: Iterable[Dict], tag: str, sha: str, anterior: Optional[str]) -> Dict:
+    """
+    Calcular las métricas del rango de un release en una sola pasada.
+
+    Argumentos
+    ----------
+    commits : Iterable[Dict]
+        Commits parseados del rango `anterior..tag`, con "timestamp" y "autor"
+    tag : str
+        Tag del release
+    sha : str
+        Hash del commit del tag
+    anterior : str
+        Tag anterior en orden de versión (None para el primero)
+
+    Retorna
+    -------
+    Dict
+        Snapshot con commits, fechas, throughput, task_distribution, escopos y autores
+    """
+    tipos = Counter()
+    escopos = Counter()
+    autores = Counter()
+    fecha_inicio = fecha_fin = None
+    total = 0
+    for c in commits:
+        fecha = c["timestamp"]
+        if fecha_inicio is None or fecha < fecha_inicio:
+            fecha_inicio = fecha
+        if fecha_fin is None or fecha > fecha_fin:
+            fecha_fin = fecha
+        mensaje = c["mensaje"]
+        tipos[mensaje["tipo"]] += 1
+        escopos[mensaje["escopo"] or ""] += 1
+        autores[c["autor"]["email"]] += 1
+        total += 1
+
+    throughput = round(total / ((fecha_fin - fecha_inicio) // 86400 or 1), 2) if total else 0.0
+    return {
+        "tag": tag,
+        "sha": sha,
+        "anterior": anterior,
+        "commits": total,
+        "fecha_inicio": fecha_inicio,
+        "fecha_fin": fecha_fin,
+        "throughput_commits_por_dia": throughput,
+        "task_distribution": dict(tipos),
+        "escopos": dict(escopos),
+        "autores": dict(autores),
+    }
+
+
+def tags_semanticos(repo) -> List[Tuple[str, str]]:
+    """
+    Listar los tags semánticos del repositorio con una sola llamada a for-each-ref.
+
+    Retorna
+    -------
+    List[Tuple[str, str]]
+        Pares (tag, hash del commit), en orden de versión
+    """
+    from scripts.tags import version_tag
+
+    salida = repo.git.for_each_ref("--format=%(refname:short)%00%(objectname)%00%(*objectname)", "refs/tags")
+    tags = []
+    for linea in salida.splitlines():
+        nombre, objeto, desreferenciado = linea.split("\0")
+        if version_tag(nombre):
+            tags.append((nombre, desreferenciado or objeto))
+    tags.sort(key=lambda tag: version_tag(tag[0]))
+    return tags
+
+
+def _alcanzables(repo, tags: List[Tuple[str, str]]) -> Set[str]:
+    """
+    Tags de `tags` (pares tag, hash del commit) alcanzables desde HEAD.
+
+    Se lee `git rev-list HEAD` por bloques y se detiene en cuanto aparecen todos los
+    commits de `tags`; como los tags nuevos suelen ser los más recientes, solo se
+    recorre el historial posterior al más antiguo de ellos. `for-each-ref --merged=HEAD`
+    recorre siempre el historial completo.
+    """
+    pendientes = {sha.encode("ascii") for _, sha in tags}
+    vistos = set()
+    if pendientes:
+        proc = subprocess.Popen(  # nosec B603 B607
+            ["git", "rev-list", "HEAD"], cwd=repo.working_dir or repo.git_dir, stdout=subprocess.PIPE
+        )
+        resto = b""
+        try:
+            while pendientes:
+                bloque = proc.stdout.read1(1 << 16)
+                if not bloque:
+                    break
+                lineas = (resto + bloque).split(b"\n")
+                resto = lineas.pop()
+                encontrados = pendientes.intersection(lineas)
+                vistos |= encontrados
+                pendientes -= encontrados
+        finally:
+            proc.kill()
+            proc.wait()
+    return {tag for tag, sha in tags if sha.encode("ascii") in vistos}
+
+
+def registrar_snapshots(repo_path: str, almacen: AlmacenSnapshots) -> List[str]:
+    """
+    Calcular y guardar los snapshots de los tags alcanzables desde HEAD que todavía no tienen uno.
+
+    Solo se recorre el rango de cada tag nuevo (desde el tag anterior en orden de
+    versión); los releases ya registrados no se vuelven a leer. Si no hay tags nuevos
+    solo se ejecuta `git for-each-ref`.
+
+    Argumentos
+    ----------
+    repo_path : str
+        Ruta del repositorio
+    almacen : AlmacenSnapshots
+        Base de snapshots
+
+    Retorna
+    -------
+    List[str]
+        Tags registrados, en orden de versión
+    """
+    from git import Repo
+
+    from scripts.changelog_generator import iter_parsed_commits
+
+    repo = Repo(repo_path)
+    registrados = almacen.registrados()
+    tags = tags_semanticos(repo)
+    for tag, sha in tags:
+        if tag in registrados and registrados[tag] != sha:
+            raise ValueError(
+                f"El tag '{tag}' apunta a {sha[:7]}, pero su snapshot se registró en "
+                f"{registrados[tag][:7]}; los snapshots son inmutables"
+            )
+    pendientes = _alcanzables(repo, [(tag, sha) for tag, sha in tags if tag not in registrados])
+
+    nuevos = []
+    anterior = None
+    for tag, sha in tags:
+        if tag in pendientes:
+            commits = iter_parsed_commits(repo_path, since=anterior, until=tag)
+            almacen.guardar(calcular_snapshot(commits, tag, sha, anterior))
+            nuevos.append(tag)
+        elif tag not in registrados:
+            # No es alcanzable desde HEAD (por ejemplo, un tag de otra rama)
+            continue
+        anterior = tag
+    return nuevos
+
+
+def formatear_tendencia(snapshots: List[Dict], dimension: Optional[str] = None) -> str:
+    """
+    Formatear los snapshots como una tabla de texto, con los conteos de `dimension`.
+    """
+    filas = [("TAG", "COMMITS", "COMMITS/DÍA", dimension.upper() if dimension else "")]
+    for s in snapshots:
+        conteos = s.get(CLAVES_DIMENSION[dimension], {}) if dimension else {}
+        detalle = ", ".join(f"{clave or '-'}={cantidad}" for clave, cantidad in conteos.items())
+        filas.append((s["tag"], str(s["commits"]), f"{s['throughput_commits_por_dia']:.2f}", detalle))
+    anchos = [max(len(fila[i]) for fila in filas) for i in range(len(filas[0]))]
+    return "\n".join(
+        "  ".join(valor.ljust(ancho) for valor, ancho in zip(fila, anchos)).rstrip() for fila in filas
+    )
+
+
+def snapshots_cli(argv: List[str]) -> int:
+    """
+    Subcomando `snapshots`: registrar snapshots de métricas por release y consultar tendencias.
+
+    Uso:
+        python -m scripts.changelog_generator snapshots registrar [--dir .] [--db ARCHIVO]
+        python -m scripts.changelog_generator snapshots consultar [--db ARCHIVO] [--ultimos N]
+                                                                  [--dimension tipo|escopo|autor] [--json]
+    """
+    parser = argparse.ArgumentParser(prog="changelog_generator snapshots")
+    parser.add_argument("accion", choices=["registrar", "consultar"])
+    parser.add_argument("--db", type=str, default=ARCHIVO_SNAPSHOTS, help="Base SQLite de snapshots")
+    parser.add_argument("--dir", type=str, default=".", help="Ruta del repositorio (registrar)")
+    parser.add_argument("--ultimos", type=int, default=20, help="Cantidad de releases a consultar")
+    parser.add_argument("--dimension", choices=DIMENSIONES, default=None, help="Conteos a mostrar por release")
+    parser.add_argument("--json", action="store_true", help="Imprimir los snapshots en JSON")
+    args = parser.parse_args(argv)
+
+    with AlmacenSnapshots(args.db) as almacen:
+        if args.accion == "registrar":
+            nuevos = registrar_snapshots(args.dir, almacen)
+            print(f"Snapshots registrados: {', '.join(nuevos) if nuevos else 'ninguno'} ({len(almacen)} en total)")
+            return 0
+        dimensiones = [args.dimension] if args.dimension else ([] if not args.json else DIMENSIONES)
+        snapshots = almacen.ultimos(args.ultimos, dimensiones)
+    if args.json:
+        print(json.dumps(snapshots, indent=2, ensure_ascii=False))
+    else:
+        print(formatear_tendencia(snapshots, args.dimension))
+    return 0
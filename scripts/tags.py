@@ -0,0 +1,150 @@
+"""
+tags.py
+
+Resolución del último tag semántico alcanzable desde HEAD.
+
+En lugar de cargar cada tag y su commit con GitPython, se consulta `git describe`,
+que recorre el historial desde HEAD solo hasta encontrar un tag que coincida. El
+resultado se guarda en el directorio .git junto con una huella del estado de los refs,
+de modo que las ejecuciones siguientes no consultan git mientras HEAD y los tags no
+cambien.
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import Optional, Tuple
+
+from git import Repo
+
+SEMVER_TAG = re.compile(r"^v?(\d+)\.(\d+)\.(\d+)$")
+
+ARCHIVO_CACHE = "changelog-ultimo-tag.json"
+
+
+def version_tag(nombre: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Obtener la versión (mayor, menor, parche) de un tag semántico, o None si no lo es.
+    """
+    match = SEMVER_TAG.match(nombre)
+    return tuple(map(int, match.groups())) if match else None
+
+
+def _leer(ruta: str) -> bytes:
+    try:
+        with open(ruta, "rb") as f:
+            return f.read()
+    except OSError:
+        return b""
+
+
+def _stat(ruta: str) -> str:
+    try:
+        st = os.stat(ruta)
+    except OSError:
+        return "-"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def estado_refs(repo: Repo) -> str:
+    """
+    Calcular una huella del estado de HEAD y de los tags sin ejecutar git.
+
+    La huella cambia cuando HEAD apunta a otra rama o commit, cuando se
+    reescribe packed-refs o cuando se crean o eliminan tags sueltos.
+
+    Argumentos
+    ----------
+    repo : Repo
+        Repositorio a inspeccionar
+
+    Retorna
+    -------
+    str
+        Huella del estado de los refs
+    """
+    comun = repo.common_dir
+    head = _leer(os.path.join(repo.git_dir, "HEAD"))
+    partes = [head]
+    if head.startswith(b"ref: "):
+        ref = head[5:].strip().decode("utf-8", errors="replace")
+        partes.append(_leer(os.path.join(comun, ref)))
+    partes.append(_stat(os.path.join(comun, "packed-refs")).encode())
+    partes.append(_stat(os.path.join(comun, "refs", "tags")).encode())
+    return hashlib.sha1(b"\0".join(partes)).hexdigest()  # nosec B324
+
+
+def _consultar_ultimo_tag(repo: Repo) -> Optional[str]:
+    """
+    Buscar el tag semántico alcanzable más cercano a HEAD con `git describe`.
+
+    `git describe` recorre el historial desde HEAD solo hasta encontrar un tag, sin
+    listar la alcanzabilidad de todos. Si el tag encontrado no es semántico (por ejemplo
+    "v1.2.0-rc1"), se vuelve a consultar excluyendo los tags de ese commit. Si varios
+    tags semánticos apuntan al mismo commit, se elige el de mayor versión.
+    """
+    from git.exc import GitCommandError
+
+    excluidos = set()
+    while True:
+        try:
+            nombre = repo.git.describe(
+                "--tags",
+                "--abbrev=0",
+                "--match=v[0-9]*",
+                "--match=[0-9]*",
+                *(f"--exclude={tag}" for tag in sorted(excluidos)),
+                "HEAD",
+            )
+        except GitCommandError:
+            # Sin tags alcanzables que coincidan
+            return None
+        en_commit = repo.git.tag("--points-at", f"{nombre}^{{commit}}").split()
+        semanticos = [tag for tag in en_commit if version_tag(tag) is not None]
+        if semanticos:
+            return max(semanticos, key=version_tag)
+        if excluidos.issuperset(en_commit):
+            # Un nombre que --exclude no logra excluir (p. ej. con caracteres de glob)
+            return None
+        excluidos.update(en_commit)
+
+
+def resolver_ultimo_tag(repo: Repo, usar_cache: bool = True) -> Optional[str]:
+    """
+    Obtener el último tag semántico alcanzable desde HEAD.
+
+    Argumentos
+    ----------
+    repo : Repo
+        Repositorio a analizar
+    usar_cache : bool
+        Reutilizar el resultado guardado si los refs no cambiaron
+
+    Retorna
+    -------
+    Optional[str]
+        Nombre del tag, o None si el repositorio no tiene tags semánticos alcanzables
+    """
+    ruta_cache = os.path.join(repo.git_dir, ARCHIVO_CACHE)
+    estado = estado_refs(repo)
+
+    if usar_cache:
+        try:
+            with open(ruta_cache, encoding="utf-8") as f:
+                guardado = json.load(f)
+            if guardado.get("estado") == estado:
+                return guardado["tag"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    tag = _consultar_ultimo_tag(repo)
+
+    if usar_cache:
+        try:
+            with open(ruta_cache, "w", encoding="utf-8") as f:
+                json.dump({"estado": estado, "tag": tag}, f)
+        except OSError:
+            # Un .git de solo lectura no impide resolver el tag
+            pass
+    return tag
@@ -0,0 +1,168 @@
+"""
+validador.py
+
+Validación por lotes de los mensajes de un rango de commits, para el hook pre-push.
+
+Los mensajes se leen de un único stream de `git log` y se validan con el mismo
+parser que usa changelog_generator. Los hashes de commits válidos se guardan en
+.git/changelog-validados, de modo que en el siguiente push (por ejemplo, después
+de un rebase que conserva gran parte del historial) solo se revisan los commits
+nuevos. Todas las violaciones se reportan juntas, con su hash.
+
+Para no agregar costo de arranque al hook, este módulo usa subprocess directamente
+en lugar de GitPython.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess  # nosec B404
+
+from scripts.conventional import validar_mensaje, version_parser
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, Iterator, List, Tuple
+
+ARCHIVO_CACHE = "changelog-validados"
+
+MAX_CACHE = 200_000
+
+
+def _git(repo_path: str, *args: str) -> str:
+    resultado = subprocess.run(  # nosec B603 B607
+        ["git", *args], cwd=repo_path, capture_output=True, text=True
+    )
+    if resultado.returncode != 0:
+        raise RuntimeError(resultado.stderr.strip() or f"git {args[0]} terminó con error")
+    return resultado.stdout.strip()
+
+
+def iter_mensajes(rango: List[str], repo_path: str = ".") -> Iterator[Tuple[str, str]]:
+    """
+    Leer hash y mensaje de cada commit del rango como un stream.
+
+    Argumentos
+    ----------
+    rango : List[str]
+        Argumentos de revisión para git (por ejemplo ["origin/main..HEAD"])
+    repo_path : str
+        Ruta del repositorio
+
+    Retorna
+    -------
+    Iterator[Tuple[str, str]]
+        Pares (hash, mensaje) del más reciente al más antiguo
+    """
+    proc = subprocess.Popen(  # nosec B603 B607
+        ["git", "log", "--format=%x1e%H%x1f%B", *rango],
+        cwd=repo_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    pendiente = b""
+    try:
+        while True:
+            bloque = proc.stdout.read(65536)
+            if not bloque:
+                break
+            partes = (pendiente + bloque).split(b"\x1e")
+            pendiente = partes.pop()
+            for parte in partes:
+                if parte:
+                    sha, _, mensaje = parte.decode("utf-8", errors="replace").partition("\x1f")
+                    yield sha, mensaje
+        if pendiente:
+            sha, _, mensaje = pendiente.decode("utf-8", errors="replace").partition("\x1f")
+            yield sha, mensaje
+    finally:
+        proc.stdout.close()
+        error = proc.stderr.read().decode("utf-8", errors="replace").strip()
+        proc.stderr.close()
+        proc.wait()
+    # Fuera del finally: si el consumidor deja de iterar antes, el generador se cierra sin error
+    if proc.returncode != 0:
+        raise RuntimeError(error or f"git log {' '.join(rango)} terminó con error")
+
+
+def _leer_cache(ruta: str) -> Dict[str, None]:
+    # Un dict conserva el orden del archivo, del hash más antiguo al más reciente
+    try:
+        with open(ruta, encoding="utf-8") as f:
+            if f.readline().strip() != version_parser():
+                # Con otro parser, los commits validados antes pueden no ser válidos ahora
+                return {}
+            return dict.fromkeys(linea.strip() for linea in f if linea.strip())
+    except OSError:
+        return {}
+
+
+def _guardar_cache(ruta: str, existentes: Dict[str, None], nuevos: List[str]) -> None:
+    # git log entrega los commits del más reciente al más antiguo; el archivo va al revés
+    nuevos = nuevos[::-1]
+    if len(existentes) + len(nuevos) > MAX_CACHE:
+        # Se reescribe la caché acotada descartando los hashes más antiguos
+        conservados = (list(existentes) + nuevos)[-MAX_CACHE:]
+        modo = "w"
+    else:
+        conservados = nuevos
+        modo = "a" if existentes else "w"
+    with open(ruta, modo, encoding="utf-8") as f:
+        if modo == "w":
+            f.write(version_parser() + "\n")
+        f.writelines(sha + "\n" for sha in conservados)
+
+
+def validar_rango(
+    rango: List[str], repo_path: str = ".", tamano_lote: int = 1000, usar_cache: bool = True
+) -> Tuple[List[Tuple[str, str]], int, int]:
+    """
+    Validar todos los mensajes de commit de un rango.
+
+    Argumentos
+    ----------
+    rango : List[str]
+        Argumentos de revisión para git
+    repo_path : str
+        Ruta del repositorio
+    tamano_lote : int
+        Cantidad de commits validados por lote
+    usar_cache : bool
+        Omitir los commits ya validados en ejecuciones anteriores
+
+    Retorna
+    -------
+    Tuple[List[Tuple[str, str]], int, int]
+        (violaciones como pares (hash, encabezado), commits revisados, commits omitidos por la caché)
+    """
+    ruta_cache = os.path.join(
+        repo_path, _git(repo_path, "rev-parse", "--git-common-dir"), ARCHIVO_CACHE
+    )
+    validados = _leer_cache(ruta_cache) if usar_cache else {}
+
+    violaciones = []
+    nuevos_validos = []
+    revisados = omitidos = 0
+    lote = []
+
+    def procesar(lote):
+        for sha, mensaje in lote:
+            if validar_mensaje(mensaje):
+                nuevos_validos.append(sha)
+            else:
+                violaciones.append((sha, mensaje.strip().partition("\n")[0]))
+
+    for sha, mensaje in iter_mensajes(rango, repo_path):
+        revisados += 1
+        if sha in validados:
+            omitidos += 1
+            continue
+        lote.append((sha, mensaje))
+        if len(lote) >= tamano_lote:
+            procesar(lote)
+            lote = []
+    procesar(lote)
+
+    if usar_cache and nuevos_validos:
+        _guardar_cache(ruta_cache, validados, nuevos_validos)
+    return violaciones, revisados, omitidos
@@ -1,7 +1,11 @@
+import json
 import pytest
 from git import Repo
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 import tempfile
+import threading
+import time
 
 
 @pytest.fixture
@@ -154,3 +158,118 @@ def changelog_commits():
             "Documentation": ["actualizar documentación"],
         },
     }
+
+
+# Servidor HTTP local que reemplaza a los webhooks de Slack/Discord
+@pytest.fixture
+def webhook_stub():
+    """
+    Levanta un servidor HTTP local que registra los payloads recibidos.
+    Devuelve un diccionario con:
+        - url base del servidor,
+        - lista de payloads recibidos,
+        - lista de códigos de respuesta a usar en orden (luego responde 200),
+        - demora en segundos antes de responder.
+    """
+    estado = {"recibidos": [], "respuestas": [], "demora": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            largo = int(self.headers.get("Content-Length", 0))
+            estado["recibidos"].append((self.path, json.loads(self.rfile.read(largo))))
+            time.sleep(estado["demora"])
+            codigo = estado["respuestas"].pop(0) if estado["respuestas"] else 200
+            self.send_response(codigo)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    estado["url"] = f"http://127.0.0.1:{servidor.server_address[1]}"
+    yield estado
+    servidor.shutdown()
+    servidor.server_close()
+
+
+@pytest.fixture
+def temp_git_repo_historial(tmp_path) -> dict:
+    """
+    Crea un repositorio con varias versiones, una rama integrada con merge
+    después de un tag y commits sin release.
+    Devuelve la ruta del repo y las descripciones esperadas por versión.
+    """
+    repo = Repo.init(tmp_path / "repo_historial")
+    archivo = Path(repo.working_tree_dir) / "archivo.txt"
+
+    def commit(mensaje, parents=None):
+        archivo.write_text(mensaje)
+        repo.index.add([str(archivo)])
+        if parents is None:
+            return repo.index.commit(mensaje)
+        return repo.index.commit(mensaje, parent_commits=parents)
+
+    commit("chore: inicial")
+    repo.create_tag("v1.0.0")
+    base = commit("feat: primera funcionalidad")
+    rama = commit("fix(rama): arreglo en rama", parents=(base,))
+    # Volver la rama principal a `base` dejando el arreglo fuera de v1.1.0
+    repo.head.reset(base, index=True, working_tree=True)
+    principal = commit("feat: segunda funcionalidad")
+    repo.create_tag("v1.1.0")
+    commit("Merge branch 'rama'", parents=(principal, rama))
+    commit("feat!: cambio incompatible")
+    repo.create_tag("v2.0.0")
+    commit("docs: pendiente de release")
+
+    return {
+        "repo_path": Path(repo.working_tree_dir),
+        "esperado": {
+            "Unreleased": ["pendiente de release"],
+            "v2.0.0": ["arreglo en rama", "Merge branch 'rama'", "cambio incompatible"],
+            "v1.1.0": ["primera funcionalidad", "segunda funcionalidad"],
+            "v1.0.0": ["inicial"],
+        },
+    }
+
+
+@pytest.fixture
+def repo_con_merges(tmp_path):
+    """
+    Repositorio con una rama integrada con merge, un cherry-pick de uno de sus commits,
+    un par revert/revertido dentro del rango y el revert de un commit ya publicado.
+    """
+    repo = Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test")
+        config.set_value("user", "email", "test@example.com")
+
+    def commit(archivo, mensaje):
+        (Path(tmp_path) / archivo).write_text(mensaje)
+        repo.index.add([archivo])
+        return repo.index.commit(mensaje).hexsha
+
+    commit("inicial.txt", "chore: inicial")
+    publicado = commit("publicado.txt", "feat: publicado")
+    repo.create_tag("v1.0.0")
+    principal = repo.active_branch
+
+    shas = {"a": commit("a.txt", "feat: a")}
+    repo.create_head("rama").checkout()
+    shas["b"] = commit("b.txt", "fix: b")
+    shas["c"] = commit("c.txt", "feat: c")
+    principal.checkout(force=True)
+    shas["d"] = commit("d.txt", "docs: d")
+    repo.git.cherry_pick(shas["b"])
+    shas["b_cherry"] = repo.head.commit.hexsha
+    repo.git.merge("rama", "--no-ff", "-m", "Merge branch 'rama'")
+    shas["merge"] = repo.head.commit.hexsha
+    shas["x"] = commit("x.txt", "feat: x")
+    repo.git.revert(shas["x"], "--no-edit")
+    shas["revert_x"] = repo.head.commit.hexsha
+    repo.git.revert(publicado, "--no-edit")
+    shas["revert_publicado"] = repo.head.commit.hexsha
+    return str(tmp_path), shas
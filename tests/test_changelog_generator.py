@@ -1,42 +1,43 @@
+import json
 from scripts import changelog_generator as cg
 from git import Repo
 import pytest
 
 
-@pytest.mark.parametrize(
-    "mensaje, tipo, escopo, descripcion, cuerpo",
-    [
-        (
-            "feat(api): agregar caracteristica\n\nAgregar caracteristica importante.",
-            "feat",
-            "api",
-            "agregar caracteristica",
-            "Agregar caracteristica importante.",
-        ),
-        (
-            "fix: arreglar error\n\nArreglar error fatal.",
-            "fix",
-            None,
-            "arreglar error",
-            "Arreglar error fatal.",
-        ),
-        ("commit inicial", "otro", None, "commit inicial", None),
-        (
-            "feat(api): agregar caracteristica\n\n\n\n\n",
-            "feat",
-            "api",
-            "agregar caracteristica",
-            None,
-        ),
-        (
-            "feat!(break): agregar caracteristica\n\nAgregar caracteristica importante.",
-            "BREAKING CHANGE",
-            "break",
-            "agregar caracteristica",
-            "Agregar caracteristica importante.",
-        ),
-    ],
-)
+CASOS_PARSEO = [
+    (
+        "feat(api): agregar caracteristica\n\nAgregar caracteristica importante.",
+        "feat",
+        "api",
+        "agregar caracteristica",
+        "Agregar caracteristica importante.",
+    ),
+    (
+        "fix: arreglar error\n\nArreglar error fatal.",
+        "fix",
+        None,
+        "arreglar error",
+        "Arreglar error fatal.",
+    ),
+    ("commit inicial", "otro", None, "commit inicial", None),
+    (
+        "feat(api): agregar caracteristica\n\n\n\n\n",
+        "feat",
+        "api",
+        "agregar caracteristica",
+        None,
+    ),
+    (
+        "feat!(break): agregar caracteristica\n\nAgregar caracteristica importante.",
+        "BREAKING CHANGE",
+        "break",
+        "agregar caracteristica",
+        "Agregar caracteristica importante.",
+    ),
+]
+
+
+@pytest.mark.parametrize("mensaje, tipo, escopo, descripcion, cuerpo", CASOS_PARSEO)
 def test_parse_commits(mensaje, tipo, escopo, descripcion, cuerpo):
     """
     Probar funcionalidad de parseo de commits.
@@ -50,6 +51,21 @@ def test_parse_commits(mensaje, tipo, escopo, descripcion, cuerpo):
     assert result["mensaje"]["cuerpo"] == cuerpo
 
 
+@pytest.mark.parametrize("cuerpo_lazy", [False, True])
+def test_parse_commit_messages(cuerpo_lazy):
+    """
+    Probar que el parseo por lotes coincida con parse_commit_message.
+    """
+    entradas = [(f"hash{i}", caso[0]) for i, caso in enumerate(CASOS_PARSEO)]
+
+    registros = list(cg.parse_commit_messages(entradas, cuerpo_lazy=cuerpo_lazy))
+
+    assert [r.to_dict() for r in registros] == [
+        cg.parse_commit_message(mensaje, commit_hash) for commit_hash, mensaje in entradas
+    ]
+    assert [r.cuerpo for r in registros] == [caso[4] for caso in CASOS_PARSEO]
+
+
 def test_get_commits(temp_git_repo):
     """
     Probar funcionalidad de obtención de commits en repositorio.
@@ -182,3 +198,162 @@ def test_flujo_liberacion(temp_git_repo):
     # Validar que el nuevo tag existe en el repo
     tags = [t.name for t in repo.tags]
     assert siguiente_version in tags
+
+
+def test_iter_parsed_commits(temp_git_repo):
+    """
+    Probar que el modo streaming entregue los mismos commits, del más antiguo al más reciente.
+    """
+    repo_path = temp_git_repo["repo_path"]
+    expected = temp_git_repo["expected_commits"]
+
+    commits = cg.iter_parsed_commits(str(repo_path), since="v1.0.0")
+
+    assert not isinstance(commits, list)
+    assert [(c["commit"], c["mensaje"]["tipo"]) for c in commits] == [
+        (e["commit"], e["tipo"]) for e in expected
+    ]
+
+
+def test_consumidores_streaming(temp_git_repo, tmp_path):
+    """
+    Probar que el JSON, el changelog y las métricas acepten generadores de commits.
+    """
+    repo_path = str(temp_git_repo["repo_path"])
+    esperado = cg.get_commits_since_last_tag(repo_path)
+
+    json_path = tmp_path / "commits.json"
+    total = cg.escribir_commits_json(
+        cg.iter_parsed_commits(repo_path, since="v1.0.0"), str(json_path)
+    )
+    assert total == len(esperado)
+    assert json.loads(json_path.read_text(encoding="utf-8")) == esperado
+
+    changelog_path = tmp_path / "CHANGELOG.md"
+    cg.generar_changelog_md(
+        cg.iter_parsed_commits(repo_path, since="v1.0.0"), "v2.0.0", str(changelog_path)
+    )
+    assert "- eliminar API obsoleta" in changelog_path.read_text(encoding="utf-8")
+
+    metrics_path = tmp_path / "metrics.json"
+    cg.calcular_metricas_flujo(
+        cg.iter_parsed_commits(repo_path, since="v1.0.0"),
+        archivo_salida=str(metrics_path),
+        repo=Repo(repo_path),
+    )
+    metricas = json.loads(metrics_path.read_text(encoding="utf-8"))
+    assert sum(metricas["task_distribution"].values()) == len(esperado)
+
+
+def test_metadatos_en_una_pasada(temp_git_repo, tmp_path):
+    """
+    Probar que el parseo incluya fecha, autor y estadísticas, y que las métricas
+    se calculen sin consultar el repositorio.
+    """
+    repo_path = str(temp_git_repo["repo_path"])
+    repo = Repo(repo_path)
+
+    commits = list(cg.iter_parsed_commits(repo_path, since="v1.0.0", stats=True))
+
+    for c in commits:
+        original = repo.commit(c["commit"])
+        assert c["timestamp"] == original.committed_date
+        assert c["autor"]["email"] == original.author.email
+        assert c["stats"] == {"archivos": 1, "inserciones": 1, "eliminaciones": 1}
+
+    metrics_path = tmp_path / "metrics.json"
+    cg.calcular_metricas_flujo(commits, archivo_salida=str(metrics_path), repo=None)
+    assert json.loads(metrics_path.read_text(encoding="utf-8"))["task_distribution"] == {
+        "feat": 1,
+        "fix": 1,
+        "BREAKING CHANGE": 1,
+    }
+
+
+def test_registros_compactos(temp_git_repo, tmp_path):
+    """
+    Probar que los registros compactos se lean como los diccionarios y produzcan
+    el mismo JSON, la misma versión y el mismo changelog.
+    """
+    repo_path = str(temp_git_repo["repo_path"])
+    diccionarios = list(cg.iter_parsed_commits(repo_path, since="v1.0.0", stats=True))
+    compactos = list(cg.iter_parsed_commits(repo_path, since="v1.0.0", stats=True, compacto=True))
+
+    assert all(isinstance(c, cg.CommitParseado) for c in compactos)
+    assert [c.to_dict() for c in compactos] == diccionarios
+    assert [dict(c["mensaje"]) for c in compactos] == [c["mensaje"] for c in diccionarios]
+    assert compactos[0]._sha == bytes.fromhex(diccionarios[0]["commit"])
+    assert compactos[0].get("padres") is None
+
+    json_path = tmp_path / "commits.json"
+    cg.escribir_commits_json(compactos, str(json_path))
+    assert json.loads(json_path.read_text(encoding="utf-8")) == diccionarios
+
+    version = cg.siguiente_version(compactos, "v1.0.0")
+    assert version == cg.siguiente_version(diccionarios, "v1.0.0") == temp_git_repo["expected_version"]
+    assert cg.renderizar_seccion(compactos, version) == cg.renderizar_seccion(diccionarios, version)
+    assert cg.calcular_metricas(compactos) == cg.calcular_metricas(diccionarios)
+
+
+def test_registro_compacto_interna_valores():
+    """
+    Probar que tipo, escopo y autor se compartan entre registros y que el cuerpo se procese al leerlo.
+    """
+    mensaje = "feat(api): agregar\n\n  Cuerpo largo.  \n"
+    a = cg.CommitParseado.desde_mensaje(mensaje, "a" * 40, autor=("Ana", "ana@example.com"))
+    b = cg.CommitParseado.desde_mensaje(mensaje, "b" * 40, autor=("".join(["A", "na"]), "ana@example.com"))
+
+    assert a.escopo is b.escopo
+    assert a["autor"]["nombre"] is b["autor"]["nombre"]
+    assert a._resto is not None
+    assert a["mensaje"]["cuerpo"] == "Cuerpo largo."
+    assert a._resto is None
+    assert a._sha == bytes.fromhex("a" * 40)
+
+    # Sin compactar (parse_commit_messages), el hash se guarda como str sin convertir
+    (c,) = cg.parse_commit_messages([("c" * 40, mensaje)])
+    assert c._sha == c["commit"] == "c" * 40
+    assert list(a) == ["commit", "mensaje", "autor"]
+
+
+def test_importacion_liviana(tmp_path):
+    """
+    Probar que importar el módulo no cargue dependencias pesadas ni cree archivos.
+    """
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    raiz = Path(cg.__file__).resolve().parents[1]
+    codigo = (
+        "import sys, scripts.changelog_generator; "
+        "print(sorted(m for m in ('git', 'requests', 'logging', 'sqlite3') if m in sys.modules))"
+    )
+    salida = subprocess.run(
+        [sys.executable, "-S", "-c", codigo],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(raiz)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert salida.stdout.strip() == "[]"
+    assert not (tmp_path / "logs").exists()
+
+
+def test_validar_cli(tmp_path, capsys):
+    """
+    Probar el subcomando validate con mensajes y con un archivo de mensaje.
+    """
+    archivo = tmp_path / "COMMIT_EDITMSG"
+    archivo.write_text("fix(api): corregir error\n\nDetalle.", encoding="utf-8")
+
+    assert cg.validar_cli(["feat: agregar algo", "--file", str(archivo)]) == 0
+    assert cg.validar_cli(["feat: agregar algo", "agregar algo"]) == 1
+    assert "  agregar algo" in capsys.readouterr().out
+    assert cg.validar_cli([]) == 2
+
+    with pytest.raises(SystemExit) as salida:
+        cg.main(["validate", "docs: actualizar"])
+    assert salida.value.code == 0
@@ -0,0 +1,81 @@
+import os
+import stat
+
+from scripts import changelog_generator as cg
+from scripts.changelog_incremental import _escanear, actualizar_changelog_md, leer_indice
+
+
+def _commits(*entradas):
+    return [{"mensaje": {"tipo": tipo, "descripcion": descripcion}} for tipo, descripcion in entradas]
+
+
+def test_agregar_versiones(tmp_path):
+    """
+    Probar que cada versión nueva se agregue al inicio conservando las anteriores,
+    con el mismo formato que generar_changelog_md.
+    """
+    ruta = str(tmp_path / "CHANGELOG.md")
+    primera = _commits(("feat", "primera"))
+    segunda = _commits(("fix", "segunda"), ("feat", "otra"))
+
+    assert actualizar_changelog_md(primera, "v1.0.0", ruta)
+    cg.generar_changelog_md(primera, "v1.0.0", str(tmp_path / "simple.md"))
+    assert open(ruta).read() == (tmp_path / "simple.md").read_text()
+
+    assert actualizar_changelog_md(segunda, "v1.1.0", ruta)
+    contenido = open(ruta).read()
+    secciones = [cg.renderizar_seccion(segunda, "v1.1.0"), cg.renderizar_seccion(primera, "v1.0.0")]
+    assert contenido == "# Changelog\n\n" + "\n".join(secciones)
+    assert leer_indice(ruta) == _escanear(ruta)
+
+
+def test_reejecucion_idempotente(tmp_path):
+    """
+    Probar que volver a generar la misma versión no modifique el archivo.
+    """
+    ruta = str(tmp_path / "CHANGELOG.md")
+    commits = _commits(("feat", "funcionalidad"))
+    actualizar_changelog_md(commits, "v1.0.0", ruta)
+    antes = os.stat(ruta).st_mtime_ns
+
+    assert not actualizar_changelog_md(commits, "v1.0.0", ruta)
+    assert os.stat(ruta).st_mtime_ns == antes
+
+
+def test_reemplazar_seccion_existente(tmp_path):
+    """
+    Probar que solo se reemplace la sección de la versión indicada, aun si el
+    archivo se editó por fuera y el índice quedó desactualizado.
+    """
+    ruta = str(tmp_path / "CHANGELOG.md")
+    actualizar_changelog_md(_commits(("feat", "vieja")), "v1.0.0", ruta)
+    actualizar_changelog_md(_commits(("fix", "parcial")), "v1.1.0", ruta)
+    with open(ruta, "a") as f:
+        f.write("- nota agregada a mano\n")
+
+    actualizar_changelog_md(_commits(("fix", "parcial"), ("feat", "completa")), "v1.1.0", ruta)
+
+    contenido = open(ruta).read()
+    assert contenido.count("## v1.1.0") == 1
+    assert "- completa" in contenido
+    assert "- vieja" in contenido
+    assert contenido.endswith("- nota agregada a mano\n")
+    assert leer_indice(ruta) == _escanear(ruta)
+
+
+def test_conservar_permisos(tmp_path):
+    """
+    Probar que el changelog y su índice no queden con los permisos del temporal.
+    """
+    ruta = str(tmp_path / "CHANGELOG.md")
+    umask = os.umask(0o022)
+    try:
+        actualizar_changelog_md(_commits(("feat", "primera")), "v1.0.0", ruta)
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(os.stat(ruta).st_mode) == 0o644
+    assert stat.S_IMODE(os.stat(ruta + ".idx").st_mode) == 0o644
+
+    os.chmod(ruta, 0o664)
+    actualizar_changelog_md(_commits(("fix", "segunda")), "v1.1.0", ruta)
+    assert stat.S_IMODE(os.stat(ruta).st_mode) == 0o664
@@ -0,0 +1,88 @@
+import struct
+
+import pytest
+
+from scripts.changelog_generator import iter_parsed_commits
+from scripts.formatos import MAGIA_COLUMNAR, LectorColumnar, escribir_commits, inferir_formato, leer_commits
+
+
+@pytest.mark.parametrize(
+    "nombre, formato, compresion",
+    [
+        ("commits.json", "json", None),
+        ("commits.ndjson", "ndjson", None),
+        ("commits.ndjson.gz", "ndjson", "gzip"),
+        ("commits.col", "columnar", None),
+    ],
+)
+def test_formatos_ida_y_vuelta(temp_git_repo, tmp_path, nombre, formato, compresion):
+    """
+    Probar que cada formato devuelva al leerse los mismos commits que se escribieron,
+    incluyendo fechas, autores y estadísticas.
+    """
+    esperados = list(iter_parsed_commits(temp_git_repo["repo_path"], since="v1.0.0", stats=True))
+    ruta = str(tmp_path / nombre)
+
+    assert escribir_commits(iter(esperados), ruta, formato, compresion) == len(esperados)
+    assert inferir_formato(ruta) == (formato, compresion)
+    assert list(leer_commits(ruta)) == esperados
+
+
+def test_columnar_mmap(tmp_path):
+    """
+    Probar el acceso por columnas sin copia y los campos faltantes.
+    """
+    commits = [
+        {
+            "commit": f"{i:040x}",
+            "mensaje": {"tipo": "feat" if i % 2 else "fix", "escopo": None, "descripcion": f"cambio {i}", "cuerpo": ""},
+            "timestamp": 1_600_000_000 + i,
+        }
+        for i in range(100)
+    ]
+    ruta = str(tmp_path / "commits.col")
+    escribir_commits(commits, ruta, "columnar")
+
+    with LectorColumnar(ruta) as lector:
+        assert len(lector) == 100
+        assert sum(lector.columna("timestamp")) == sum(c["timestamp"] for c in commits)
+        assert lector.diccionarios["tipo"] == ["fix", "feat"]
+        assert lector[7] == commits[7]
+
+
+def test_msgpack(tmp_path, changelog_commits):
+    """
+    Probar el formato msgpack con compresión gzip, si el paquete está instalado.
+    """
+    pytest.importorskip("msgpack")
+    ruta = str(tmp_path / "commits.msgpack.gz")
+    escribir_commits(changelog_commits["commits"], ruta, "msgpack", "gzip")
+    assert list(leer_commits(ruta)) == changelog_commits["commits"]
+
+
+@pytest.mark.parametrize(
+    "contenido",
+    [
+        b"",
+        b"no es columnar",
+        b'{"commits": []}',
+        MAGIA_COLUMNAR + MAGIA_COLUMNAR,
+        MAGIA_COLUMNAR + b"{roto" + struct.pack("<Q", 5) + MAGIA_COLUMNAR,
+        MAGIA_COLUMNAR + b"\xff\xfe" + struct.pack("<Q", 2) + MAGIA_COLUMNAR,
+        MAGIA_COLUMNAR + b"{}" + struct.pack("<Q", 2) + MAGIA_COLUMNAR,
+    ],
+)
+def test_columnar_invalido(tmp_path, contenido):
+    """
+    Probar que un archivo que no es columnar, o con el índice truncado o corrupto, dé
+    ValueError y no deje el archivo abierto.
+    """
+    ruta = tmp_path / "commits.col"
+    ruta.write_bytes(contenido)
+    with pytest.raises(ValueError, match="no es un archivo columnar"):
+        LectorColumnar(str(ruta))
+
+
+def test_columnar_sin_compresion(tmp_path):
+    with pytest.raises(ValueError):
+        escribir_commits([], str(tmp_path / "commits.col"), "columnar", "gzip")
@@ -0,0 +1,68 @@
+import pytest
+from git import Repo
+
+from scripts.changelog_generator import iter_parsed_commits
+from scripts.grafo import GrafoCommits, escribir_grafo, leer_refs, registros_desde_grafo
+
+
+@pytest.mark.parametrize("opciones", [{}, {"first_parent": True}, {"no_merges": True}])
+def test_rango_igual_a_git_log(repo_con_merges, opciones):
+    """
+    Probar que el recorrido con commit-graph produzca los mismos commits, en el mismo
+    orden y con los mismos datos, que el recorrido con git log.
+    """
+    repo_path, _ = repo_con_merges
+    repo = Repo(repo_path)
+    # Tags anotados en packed-refs y sueltos
+    repo.create_tag("v1.1.0", ref="HEAD~1", message="anotado")
+    repo.git.pack_refs("--all")
+    repo.create_tag("v1.2.0", ref="HEAD~1", message="anotado suelto")
+    escribir_grafo(repo)
+
+    for since in ("v1.0.0", "v1.1.0", "v1.2.0", None):
+        esperado = list(iter_parsed_commits(repo_path, since=since, padres=True, **opciones))
+        assert list(iter_parsed_commits(repo_path, since=since, padres=True, grafo=True, **opciones)) == esperado
+
+
+def test_lectura_del_grafo(repo_con_merges):
+    """
+    Probar que padres, fechas y refs se lean del commit-graph y de packed-refs sin git.
+    """
+    repo_path, shas = repo_con_merges
+    repo = Repo(repo_path)
+    # Merge de tres padres, cuyos padres adicionales se guardan en el chunk EDGE
+    octopus = repo.git.commit_tree("HEAD^{tree}", "-p", "HEAD", "-p", shas["c"], "-p", shas["d"], "-m", "octopus")
+    repo.git.update_ref("refs/heads/octopus", octopus)
+    repo.git.pack_refs("--all")
+    escribir_grafo(repo)
+
+    refs = leer_refs(repo.common_dir)
+    assert refs["refs/tags/v1.0.0"] == repo.commit("v1.0.0").hexsha
+
+    with GrafoCommits.abrir(repo) as grafo:
+        merge = grafo.posicion(shas["merge"])
+        commit = repo.commit(shas["merge"])
+        assert [grafo.sha(p) for p in grafo.padres(merge)] == [p.hexsha for p in commit.parents]
+        assert grafo.fecha(merge) == commit.committed_date
+        assert grafo.generacion(merge) > max(grafo.generacion(p) for p in grafo.padres(merge))
+        assert [grafo.sha(p) for p in grafo.padres(grafo.posicion(octopus))] == [
+            repo.head.commit.hexsha,
+            shas["c"],
+            shas["d"],
+        ]
+        assert grafo.posicion("0" * 40) is None
+
+
+def test_sin_grafo_usa_git_log(repo_con_merges):
+    """
+    Probar que sin commit-graph, o con commits posteriores a su escritura, se use git log.
+    """
+    repo_path, _ = repo_con_merges
+    repo = Repo(repo_path)
+    assert registros_desde_grafo(repo, "v1.0.0", "HEAD") is None
+
+    escribir_grafo(repo)
+    repo.index.commit("feat: posterior al grafo")
+    assert registros_desde_grafo(repo, "v1.0.0", "HEAD") is None
+    commits = list(iter_parsed_commits(repo_path, since="v1.0.0", grafo=True))
+    assert commits[-1]["mensaje"]["descripcion"] == "posterior al grafo"
@@ -0,0 +1,39 @@
+import re
+
+from scripts import changelog_generator as cg
+from scripts.historial import generar_changelog_historico
+
+
+def test_generar_changelog_historico(temp_git_repo_historial, tmp_path):
+    """
+    Probar que cada commit quede en la primera versión que lo contiene y que las
+    secciones se escriban de la versión más reciente a la más antigua.
+    """
+    repo_path = str(temp_git_repo_historial["repo_path"])
+    esperado = temp_git_repo_historial["esperado"]
+    changelog_path = tmp_path / "CHANGELOG.md"
+
+    versiones = generar_changelog_historico(repo_path, str(changelog_path))
+
+    assert versiones == list(esperado)
+    contenido = changelog_path.read_text(encoding="utf-8")
+    secciones = dict(re.findall(r"## (\S+)\n(.*?)(?=\n## |\Z)", contenido, re.S))
+    for version, descripciones in esperado.items():
+        assert sorted(re.findall(r"^- (.*)$", secciones[version], re.M)) == sorted(descripciones)
+
+
+def test_seccion_igual_a_changelog_simple(temp_git_repo_historial, tmp_path):
+    """
+    Probar que una sección del historial tenga el mismo formato que generar_changelog_md.
+    """
+    repo_path = str(temp_git_repo_historial["repo_path"])
+    historico = tmp_path / "historico.md"
+    simple = tmp_path / "simple.md"
+
+    generar_changelog_historico(repo_path, str(historico))
+    cg.generar_changelog_md(
+        cg.iter_parsed_commits(repo_path, since="v1.0.0", until="v1.1.0"), "v1.1.0", str(simple)
+    )
+
+    seccion = simple.read_text(encoding="utf-8").split("# Changelog\n", 1)[1]
+    assert seccion in historico.read_text(encoding="utf-8")
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from scripts.changelog_generator import iter_parsed_commits
+from scripts.instrumentacion import Instrumentacion, agregar_tiempos, cargar_umbrales
+
+
+def test_etapas_anidadas_y_contadores(temp_git_repo):
+    """
+    Probar que el tiempo de las etapas anidadas se descuente de la etapa que las
+    contiene y que se cuenten los commits recorridos y parseados.
+    """
+    instrumentacion = Instrumentacion()
+    with instrumentacion.etapa("escritura"):
+        commits = list(
+            iter_parsed_commits(temp_git_repo["repo_path"], since="v1.0.0", instrumentacion=instrumentacion)
+        )
+    total = len(temp_git_repo["expected_commits"])
+
+    assert len(commits) == total
+    etapas = instrumentacion.resumen()["etapas"]
+    assert etapas["recorrido"]["commits"] == total
+    assert etapas["parseo"]["commits"] == total
+    assert etapas["escritura"]["llamadas"] == 1
+    assert sum(e["segundos"] for e in etapas.values()) <= instrumentacion.total()
+
+
+def test_umbrales(tmp_path):
+    """
+    Probar la combinación de umbrales por defecto, archivo y pares etapa=segundos,
+    y la detección de etapas excedidas.
+    """
+    archivo = tmp_path / "umbrales.json"
+    archivo.write_text(json.dumps({"parseo": 5, "tag": 1}))
+
+    umbrales = cargar_umbrales(str(archivo), ["tag=0"])
+    assert umbrales == {"total": 15.0, "parseo": 5.0, "tag": 0.0}
+    with pytest.raises(ValueError):
+        cargar_umbrales(pares=["parseo"])
+
+    instrumentacion = Instrumentacion(umbrales)
+    with instrumentacion.etapa("tag"):
+        pass
+    assert [e[0] for e in instrumentacion.excedidos()] == ["tag"]
+
+
+def test_agregar_tiempos_y_memoria(tmp_path):
+    """
+    Probar que los tiempos se agreguen a metrics.json junto con el pico de memoria.
+    """
+    metricas = tmp_path / "metrics.json"
+    metricas.write_text(json.dumps({"throughput_commits_por_dia": 1.0}))
+
+    instrumentacion = Instrumentacion()
+    instrumentacion.iniciar_memoria()
+    with instrumentacion.etapa("metricas"):
+        datos = [bytes(1000) for _ in range(100)]
+    instrumentacion.detener()
+    agregar_tiempos(str(metricas), instrumentacion.resumen())
+
+    guardado = json.loads(metricas.read_text())
+    assert guardado["throughput_commits_por_dia"] == 1.0
+    assert "metricas" in guardado["tiempos"]["etapas"]
+    assert guardado["tiempos"]["memoria"]["pico_bytes"] >= 100 * 1000
+    del datos
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from scripts.metricas import (
+    calcular_metricas_ventanas,
+    cargar_columnas,
+    calcular_ventanas,
+    parsear_fecha,
+    percentiles,
+)
+
+DIA = 86400
+
+
+@pytest.fixture
+def commits_con_fechas():
+    """
+    Commits en tres días distintos (con un día sin commits entre medio).
+    """
+    inicio = parsear_fecha("2024-01-01")  # lunes
+    datos = [
+        (0, "feat"),
+        (3600, "fix"),
+        (7200, "feat"),
+        (2 * DIA, "fix"),
+        (3 * DIA + 60, "docs"),
+    ]
+    return [{"timestamp": inicio + t, "mensaje": {"tipo": tipo}} for t, tipo in datos]
+
+
+def test_calcular_ventanas_por_dia(commits_con_fechas):
+    """
+    Probar throughput diario con días vacíos, promedio móvil y tendencia por tipo.
+    """
+    metricas = calcular_ventanas(cargar_columnas(commits_con_fechas), "dia", movil=2)
+
+    assert [(v["inicio"], v["commits"], v["promedio_movil"]) for v in metricas["throughput_por_ventana"]] == [
+        ("2024-01-01", 3, 3.0),
+        ("2024-01-02", 0, 1.5),
+        ("2024-01-03", 1, 0.5),
+        ("2024-01-04", 1, 1.0),
+    ]
+    assert metricas["tendencia_por_tipo"] == {
+        "feat": [2, 0, 0, 0],
+        "fix": [1, 0, 1, 0],
+        "docs": [0, 0, 0, 1],
+    }
+    assert metricas["lead_time_segundos"]["p50"] == 3 * DIA + 60 - 7200
+
+
+def test_calcular_ventanas_por_semana(commits_con_fechas):
+    """
+    Probar que las semanas comiencen el lunes.
+    """
+    metricas = calcular_ventanas(cargar_columnas(commits_con_fechas), "semana")
+
+    assert metricas["throughput_por_ventana"] == [
+        {"inicio": "2024-01-01", "commits": 5, "promedio_movil": 5.0}
+    ]
+
+
+def test_percentiles():
+    """
+    Probar percentiles con interpolación lineal.
+    """
+    assert percentiles([10, 20, 30, 40, 50], (0, 50, 90, 100)) == {
+        "p0": 10,
+        "p50": 30,
+        "p90": 46.0,
+        "p100": 50,
+    }
+
+
+def test_calcular_metricas_ventanas(commits_con_fechas, tmp_path):
+    """
+    Probar el filtro por rango de fechas y la escritura de metrics.json.
+    """
+    salida = tmp_path / "metrics.json"
+
+    calcular_metricas_ventanas(
+        iter(commits_con_fechas), str(salida), desde=parsear_fecha("2024-01-02")
+    )
+
+    metricas = json.loads(salida.read_text(encoding="utf-8"))
+    assert metricas["task_distribution"] == {"fix": 1, "docs": 1}
+    assert metricas["desde"] == "2024-01-03"
+    assert metricas["gap_entre_commits_segundos"]["p50"] == DIA + 60
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+from git import Repo
+
+from scripts.monorepo import Clasificador, procesar_monorepo
+
+COMPONENTES = {"api": ["services/api"], "web": ["apps/web", "libs/ui"]}
+
+
+@pytest.fixture
+def monorepo(tmp_path):
+    """
+    Monorepo con dos componentes: api publicado en api/v1.0.0 y web sin tags.
+    """
+    repo_path = tmp_path / "repo"
+    repo = Repo.init(repo_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test")
+        config.set_value("user", "email", "test@example.com")
+
+    def commit(archivos, mensaje):
+        for archivo in archivos:
+            ruta = repo_path / archivo
+            ruta.parent.mkdir(parents=True, exist_ok=True)
+            ruta.write_text(mensaje)
+        repo.index.add(archivos)
+        return repo.index.commit(mensaje).hexsha
+
+    commit(["services/api/main.py"], "feat(api): endpoint inicial")
+    commit(["apps/web/index.html"], "feat(web): página inicial")
+    repo.create_tag("api/v1.0.0")
+    commit(["services/api/main.py"], "fix(api): corregir respuesta")
+    commit(["libs/ui/boton.js", "services/api/tipos.py"], "feat: tipos compartidos")
+    commit(["README.md"], "docs: readme")
+    return str(repo_path)
+
+
+def test_clasificador_prefijo_mas_largo():
+    """
+    Probar que cada ruta se asigne al prefijo de directorio más largo y no a prefijos parciales.
+    """
+    clasificador = Clasificador({"raiz": ["services"], "api": ["services/api/"]})
+    assert clasificador.componente("services/api/main.py") == "api"
+    assert clasificador.componente("services/otro/main.py") == "raiz"
+    assert clasificador.componente("services-legacy/main.py") is None
+    assert clasificador.componentes(["services/api/a.py", "docs/x.md"]) == {"api"}
+
+
+def test_changelog_por_componente(monorepo, tmp_path):
+    """
+    Probar que un solo recorrido genere versión, changelog y métricas por componente,
+    respetando el último tag de cada uno.
+    """
+    salida = tmp_path / "releases"
+    resumen = procesar_monorepo(monorepo, COMPONENTES, str(salida))
+    resultados = {r["componente"]: r for r in resumen["componentes"]}
+
+    # api: solo los commits posteriores a api/v1.0.0
+    assert resultados["api"]["version_actual"] == "v1.0.0"
+    assert resultados["api"]["commits"] == 2
+    assert resultados["api"]["version"] == "v1.1.0"
+    assert resultados["api"]["tag"] == "api/v1.1.0"
+
+    # web no tiene tags: todo su historial cuenta
+    assert resultados["web"]["commits"] == 2
+    assert resultados["web"]["version"] == "v0.1.0"
+
+    # Sin tags en web se recorre todo el historial una sola vez
+    assert resumen["commits_recorridos"] == 5
+
+    with open(salida / "api" / "parsed_commits.json", encoding="utf-8") as f:
+        descripciones = [c["mensaje"]["descripcion"] for c in json.load(f)]
+    assert descripciones == ["corregir respuesta", "tipos compartidos"]
+    assert "tipos compartidos" in (salida / "web" / "CHANGELOG.md").read_text(encoding="utf-8")
+    assert (salida / "web" / "metrics.json").exists()
+    assert json.loads((salida / "resumen.json").read_text(encoding="utf-8")) == resumen
+
+
+def test_recorrido_desde_ancestro_comun(monorepo, tmp_path):
+    """
+    Probar que, con todos los componentes publicados, el recorrido empiece en el ancestro común de sus tags.
+    """
+    repo = Repo(monorepo)
+    repo.create_tag("web/v0.1.0", ref="HEAD~2")
+    resumen = procesar_monorepo(monorepo, COMPONENTES, str(tmp_path / "releases"))
+    resultados = {r["componente"]: r for r in resumen["componentes"]}
+
+    assert resumen["desde"] == repo.commit("api/v1.0.0").hexsha
+    assert resumen["commits_recorridos"] == 3
+    assert resultados["api"]["commits"] == 2
+    assert resultados["web"]["commits"] == 1
+    assert resultados["web"]["version"] == "v0.2.0"
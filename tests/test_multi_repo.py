@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from scripts.changelog_generator import main
+from scripts.multi_repo import leer_manifiesto, procesar_repositorios
+
+
+def test_procesar_repositorios(temp_git_repo, temp_git_repo_no_tags, tmp_path):
+    """
+    Probar que cada repositorio genere sus archivos y que un repositorio con
+    errores no detenga a los demás.
+    """
+    rutas = [str(temp_git_repo["repo_path"]), str(temp_git_repo_no_tags), str(tmp_path / "no-existe")]
+    salida = tmp_path / "releases"
+
+    resumen = procesar_repositorios(rutas, str(salida), max_procesos=2)
+
+    assert (resumen["total"], resumen["exitosos"], resumen["fallidos"]) == (3, 1, 2)
+    ok, sin_tags, inexistente = resumen["repositorios"]
+    assert ok["version"] == temp_git_repo["expected_version"]
+    assert ok["commits"] == len(temp_git_repo["expected_commits"])
+    assert "tags" in sin_tags["error"]
+    assert inexistente["estado"] == "error"
+
+    for archivo in ("CHANGELOG.md", "metrics.json", "parsed_commits.json"):
+        assert (salida / ok["salida"].split("/")[-1] / archivo).exists()
+    assert json.loads((salida / "resumen.json").read_text(encoding="utf-8")) == resumen
+
+
+@pytest.mark.parametrize("fallido, codigo", [(False, 0), (True, 1)])
+def test_repos_codigo_de_salida(temp_git_repo, tmp_path, monkeypatch, fallido, codigo):
+    """
+    Probar que `--repos` termine con código 1 si algún repositorio falla.
+    """
+    monkeypatch.chdir(tmp_path)
+    rutas = [str(temp_git_repo["repo_path"])] + ([str(tmp_path / "no-existe")] if fallido else [])
+
+    with pytest.raises(SystemExit) as salida:
+        main(["--repos", *rutas, "--salida", str(tmp_path / "releases")])
+    assert salida.value.code == codigo
+
+
+def test_leer_manifiesto(tmp_path):
+    """
+    Probar que el manifiesto ignore comentarios y resuelva rutas relativas.
+    """
+    manifiesto = tmp_path / "repos.txt"
+    manifiesto.write_text("# servicios\nservicio-a\n\n/abs/servicio-b\n", encoding="utf-8")
+
+    assert leer_manifiesto(str(manifiesto)) == [str(tmp_path / "servicio-a"), "/abs/servicio-b"]
@@ -0,0 +1,81 @@
+import time
+
+from scripts.notificaciones import Notificador, cargar_configuracion
+
+
+def test_envio_slack_y_discord(webhook_stub):
+    """
+    Probar que cada destino reciba su payload a través del servidor local.
+    """
+    url = webhook_stub["url"]
+    notificador = Notificador({"slack": f"{url}/slack", "discord": f"{url}/discord"})
+
+    assert notificador.enviar("slack", "hola slack")
+    assert notificador.enviar("discord", "hola discord")
+    assert notificador.flush(timeout=5)
+    notificador.cerrar()
+
+    assert sorted(webhook_stub["recibidos"]) == [
+        ("/discord", {"content": "hola discord"}),
+        ("/slack", {"text": "hola slack"}),
+    ]
+    assert notificador.enviados == 2
+
+
+def test_reintentos_con_backoff(webhook_stub):
+    """
+    Probar que los errores 5xx se reintenten y los 4xx no.
+    """
+    url = webhook_stub["url"]
+    webhook_stub["respuestas"] = [500, 503]
+    notificador = Notificador({"slack": url}, reintentos=3, backoff=0.01)
+
+    notificador.enviar("slack", "reintentar")
+    notificador.flush(timeout=5)
+    assert len(webhook_stub["recibidos"]) == 3
+    assert (notificador.enviados, notificador.fallidos) == (1, 0)
+
+    webhook_stub["respuestas"] = [404]
+    notificador.enviar("slack", "no reintentar")
+    notificador.flush(timeout=5)
+    notificador.cerrar()
+    assert len(webhook_stub["recibidos"]) == 4
+    assert notificador.fallidos == 1
+
+
+def test_webhook_lento_no_bloquea(webhook_stub):
+    """
+    Probar que un webhook lento no bloquee a quien envía la alerta, que el
+    timeout corte la solicitud y que la cola acotada descarte el exceso.
+    """
+    webhook_stub["demora"] = 1
+    notificador = Notificador(
+        {"slack": webhook_stub["url"]}, timeout=0.2, reintentos=0, max_cola=1, hilos=1
+    )
+
+    inicio = time.perf_counter()
+    resultados = [notificador.enviar("slack", f"alerta {i}") for i in range(5)]
+    assert time.perf_counter() - inicio < 0.1
+    assert not all(resultados)
+    assert notificador.descartados > 0
+
+    assert notificador.flush(timeout=5)
+    notificador.cerrar()
+    assert notificador.fallidos >= 1
+
+
+def test_configuracion_desde_entorno(tmp_path, monkeypatch):
+    """
+    Probar que las variables de entorno tengan prioridad sobre el archivo.
+    """
+    archivo = tmp_path / "notificaciones.json"
+    archivo.write_text('{"slack": "http://archivo", "discord": "http://d", "timeout": 2}')
+    monkeypatch.setenv("SLACK_WEBHOOK_URL", "http://entorno")
+    monkeypatch.delenv("DISCORD_WEBHOOK_URL", raising=False)
+
+    configuracion = cargar_configuracion(str(archivo))
+
+    assert configuracion == {
+        "webhooks": {"slack": "http://entorno", "discord": "http://d"},
+        "timeout": 2,
+    }
@@ -0,0 +1,46 @@
+import pytest
+
+from scripts.changelog_generator import generar_changelog_md, iter_parsed_commits
+from scripts.paralelo import iter_paralelo, tamano_bloque
+
+
+@pytest.mark.parametrize(
+    "opciones",
+    [{}, {"stats": True, "padres": True}, {"rutas": True}, {"first_parent": True}, {"deduplicar": True}, {"compacto": True}],
+)
+def test_jobs_igual_a_secuencial(repo_con_merges, opciones):
+    """
+    Probar que el parseo en paralelo produzca los mismos commits, en el mismo orden.
+    """
+    repo_path, _ = repo_con_merges
+    esperado = list(iter_parsed_commits(repo_path, since="v1.0.0", **opciones))
+
+    assert list(iter_parsed_commits(repo_path, since="v1.0.0", jobs=2, **opciones)) == esperado
+
+
+def test_tramos_cubren_el_rango(repo_con_merges, tmp_path):
+    """
+    Probar que con tramos de un commit se lean todos los commits una vez, que el
+    changelog no cambie y que siguiendo el primer padre el orden sea el secuencial.
+    """
+    repo_path, shas = repo_con_merges
+    esperado = list(iter_parsed_commits(repo_path))
+
+    commits = list(iter_paralelo(str(repo_path), None, "HEAD", 2, bloque=1))
+    assert sorted(commits, key=lambda c: c["commit"]) == sorted(esperado, key=lambda c: c["commit"])
+    # Los commits de la rama integrada quedan en el tramo del merge
+    orden = [c["commit"] for c in commits]
+    assert orden.index(shas["b"]) == orden.index(shas["merge"]) - 2
+
+    generar_changelog_md(esperado, "v2.0.0", str(tmp_path / "secuencial.md"))
+    generar_changelog_md(commits, "v2.0.0", str(tmp_path / "paralelo.md"))
+    assert (tmp_path / "paralelo.md").read_text() == (tmp_path / "secuencial.md").read_text()
+
+    primer_padre = list(iter_paralelo(str(repo_path), "v1.0.0", "HEAD", 2, bloque=1, recorrido=["--first-parent"]))
+    assert primer_padre == list(iter_parsed_commits(repo_path, since="v1.0.0", first_parent=True))
+
+
+def test_tamano_bloque():
+    assert tamano_bloque(500000, 16) == 7813
+    assert tamano_bloque(100, 16) == 500
+    assert tamano_bloque(10**8, 2) == 20000
@@ -0,0 +1,120 @@
+import pytest
+from git import Repo
+
+from scripts import changelog_generator as cg
+from scripts.instrumentacion import Instrumentacion
+from scripts.parse_cache import CacheParseo
+
+
+def _recorridos(repo_path, cache, **opciones):
+    """
+    Commits del rango desde v1.0.0 y cuántos se leyeron con `git log`.
+    """
+    instrumentacion = Instrumentacion()
+    commits = list(
+        cg.iter_parsed_commits(repo_path, since="v1.0.0", cache=cache, instrumentacion=instrumentacion, **opciones)
+    )
+    return commits, instrumentacion.etapas.get("recorrido", {}).get("commits", 0)
+
+
+def test_cache_reutiliza_commits(temp_git_repo, tmp_path):
+    """
+    Probar que una segunda ejecución reutilice todos los commits ya parseados
+    y entregue el mismo resultado.
+    """
+    repo_path = str(temp_git_repo["repo_path"])
+    ruta_cache = str(tmp_path / "cache.sqlite")
+
+    with CacheParseo(ruta_cache, cg.version_parser()) as cache:
+        primera = list(cg.iter_parsed_commits(repo_path, since="v1.0.0", cache=cache))
+        assert (cache.aciertos, cache.fallos) == (0, 3)
+
+    with CacheParseo(ruta_cache, cg.version_parser()) as cache:
+        segunda = list(cg.iter_parsed_commits(repo_path, since="v1.0.0", cache=cache))
+        assert (cache.aciertos, cache.fallos) == (3, 0)
+
+    assert segunda == primera
+
+
+def test_cache_invalida_otra_version(tmp_path):
+    """
+    Probar que un cambio en la versión del parser descarte las entradas guardadas.
+    """
+    ruta_cache = str(tmp_path / "cache.sqlite")
+    with CacheParseo(ruta_cache, "v1") as cache:
+        cache.guardar([("abc", {"tipo": "feat"})])
+
+    with CacheParseo(ruta_cache, "v2") as cache:
+        assert len(cache) == 0
+        assert cache.obtener(["abc"]) == {}
+
+
+def test_cache_limita_tamano(tmp_path):
+    """
+    Probar que se descarten las entradas usadas hace más tiempo al superar el límite.
+    """
+    with CacheParseo(str(tmp_path / "cache.sqlite"), "v1", max_entradas=2) as cache:
+        cache.guardar([("a", {}), ("b", {})])
+        cache.obtener(["a"])
+        cache.guardar([("c", {}), ("c", {})])
+
+        assert len(cache) == 2
+        assert cache._conn.execute("SELECT COUNT(*) FROM commits").fetchone()[0] == 2
+        assert set(cache.obtener(["a", "b", "c"])) == {"a", "c"}
+
+
+@pytest.mark.parametrize("opciones", [{}, {"stats": True, "padres": True}, {"first_parent": True}, {"compacto": True}])
+def test_cache_recorre_solo_commits_nuevos(repo_con_merges, tmp_path, opciones):
+    """
+    Probar que con el rango guardado solo se recorran los commits posteriores a la punta
+    anterior, y que el resultado sea el mismo que sin caché.
+    """
+    repo_path, _ = repo_con_merges
+    repo = Repo(repo_path)
+    with CacheParseo(str(tmp_path / "cache.sqlite"), cg.version_parser()) as cache:
+        primera, recorridos = _recorridos(repo_path, cache, **opciones)
+        assert recorridos == len(primera)
+
+        assert _recorridos(repo_path, cache, **opciones) == (primera, 0)
+
+        repo.index.commit("feat: nuevo")
+        repo.index.commit("fix: otro")
+        commits, recorridos = _recorridos(repo_path, cache, **opciones)
+        assert recorridos == 2
+        assert commits == list(cg.iter_parsed_commits(repo_path, since="v1.0.0", **opciones))
+
+
+def test_cache_rango_reescrito(repo_con_merges, tmp_path):
+    """
+    Probar que se recorra el rango completo si la punta anterior ya no es ancestro
+    o si el tag base se movió.
+    """
+    repo_path, shas = repo_con_merges
+    repo = Repo(repo_path)
+    with CacheParseo(str(tmp_path / "cache.sqlite"), cg.version_parser()) as cache:
+        _recorridos(repo_path, cache)
+
+        repo.head.reset("HEAD~1", index=True, working_tree=False)
+        repo.index.commit("fix: reescrito")
+        commits, recorridos = _recorridos(repo_path, cache)
+        assert recorridos == len(commits)
+        assert commits == list(cg.iter_parsed_commits(repo_path, since="v1.0.0"))
+
+        repo.create_tag("v1.0.0", ref=shas["a"], force=True)
+        commits, recorridos = _recorridos(repo_path, cache)
+        assert recorridos == len(commits)
+        assert shas["a"] not in [c["commit"] for c in commits]
+
+
+def test_cache_recorrido_interrumpido(repo_con_merges, tmp_path):
+    """
+    Probar que un recorrido abandonado a medias no deje un rango incompleto.
+    """
+    repo_path, _ = repo_con_merges
+    esperado = list(cg.iter_parsed_commits(repo_path, since="v1.0.0"))
+    with CacheParseo(str(tmp_path / "cache.sqlite"), cg.version_parser()) as cache:
+        commits = cg.iter_parsed_commits(repo_path, since="v1.0.0", cache=cache, tamano_lote=2)
+        next(commits)
+        commits.close()
+        assert _recorridos(repo_path, cache, tamano_lote=2) == (esperado, len(esperado))
+        assert _recorridos(repo_path, cache) == (esperado, 0)
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from git import Repo
+
+from scripts.changelog_generator import iter_parsed_commits, main, renderizar_seccion, siguiente_version
+from scripts.ramas import previsualizar_ramas
+
+
+def test_ramas_igual_a_recorrido_por_rama(repo_con_merges):
+    """
+    Probar que la vista previa de cada rama coincida con recorrer esa rama por separado.
+    """
+    repo_path, shas = repo_con_merges
+    repo = Repo(repo_path)
+    repo.create_head("vieja", "v1.0.0")
+    repo.create_head("ruptura", shas["d"]).checkout()
+    repo.index.commit("feat!: nueva API")
+    repo.create_head("copia", "ruptura")
+
+    resumen = previsualizar_ramas(repo_path)
+    ramas = {r["rama"]: r for r in resumen["ramas"]}
+
+    assert resumen["tag"] == "v1.0.0"
+    assert set(ramas) == {h.name for h in repo.heads}
+    # Cada commit se parsea una vez aunque lo compartan varias ramas
+    assert resumen["commits_recorridos"] == len(repo.git.rev_list("^v1.0.0", "--all").split())
+    for nombre, rama in ramas.items():
+        commits = list(iter_parsed_commits(repo_path, since="v1.0.0", until=nombre))
+        version = siguiente_version(commits, "v1.0.0")
+        assert (rama["commits"], rama["version"]) == (len(commits), version)
+        assert rama["changelog"] == (renderizar_seccion(commits, version) if commits else "")
+
+    assert (ramas["vieja"]["commits"], ramas["vieja"]["incremento"]) == (0, None)
+    assert (ramas["rama"]["version"], ramas["rama"]["incremento"]) == ("v1.1.0", "menor")
+    assert (ramas["ruptura"]["version"], ramas["ruptura"]["incremento"]) == ("v2.0.0", "mayor")
+    assert ramas["copia"]["changelog"] == ramas["ruptura"]["changelog"]
+
+
+def test_ramas_cli(repo_con_merges, tmp_path, capsys):
+    """
+    Probar la salida en tabla y en JSON del subcomando.
+    """
+    repo_path, _ = repo_con_merges
+    salida = tmp_path / "ramas.json"
+
+    with pytest.raises(SystemExit) as salida_cli:
+        main(["ramas", "--dir", repo_path, "--salida", str(salida)])
+    assert salida_cli.value.code == 0
+    tabla = capsys.readouterr().out.splitlines()
+    assert tabla[1].split() == ["RAMA", "COMMITS", "VERSIÓN", "INCREMENTO"]
+    assert ["rama", "3", "v1.1.0", "menor"] in [fila.split() for fila in tabla[2:]]
+
+    resumen = json.loads(salida.read_text())
+    assert {r["rama"] for r in resumen["ramas"]} == {fila.split()[0] for fila in tabla[2:]}
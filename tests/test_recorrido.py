@@ -0,0 +1,37 @@
+from scripts.changelog_generator import iter_parsed_commits
+
+
+def _recorrer(repo_path, **opciones):
+    return [c["commit"] for c in iter_parsed_commits(repo_path, since="v1.0.0", **opciones)]
+
+
+def test_first_parent_y_no_merges(repo_con_merges):
+    """
+    Probar que --first-parent omita los commits de la rama integrada y --no-merges el merge.
+    """
+    repo_path, shas = repo_con_merges
+
+    todos = _recorrer(repo_path)
+    assert set(todos) == set(shas.values())
+    assert set(_recorrer(repo_path, no_merges=True)) == set(shas.values()) - {shas["merge"]}
+    assert set(_recorrer(repo_path, first_parent=True)) == set(shas.values()) - {shas["b"], shas["c"]}
+
+
+def test_deduplicar_y_cancelar_reverts(repo_con_merges):
+    """
+    Probar que se conserve una sola copia del cambio repetido por cherry-pick, que se
+    descarte el par revert/revertido del rango y que se conserve el revert de un
+    commit publicado en un release anterior.
+    """
+    repo_path, shas = repo_con_merges
+
+    deduplicados = _recorrer(repo_path, deduplicar=True)
+    assert len(deduplicados) == len(shas) - 1
+    assert len({shas["b"], shas["b_cherry"]} & set(deduplicados)) == 1
+
+    sin_reverts = _recorrer(repo_path, cancelar_reverts=True)
+    assert set(sin_reverts) == set(shas.values()) - {shas["x"], shas["revert_x"]}
+
+    ambos = _recorrer(repo_path, deduplicar=True, cancelar_reverts=True, no_merges=True)
+    assert len(ambos) == len(shas) - 4
+    assert shas["revert_publicado"] in ambos
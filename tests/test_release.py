@@ -0,0 +1,74 @@
+import pytest
+from git import Repo
+
+from scripts.release import decidir_release, ejecutar_releases, preparar_release, publicar_release
+
+
+@pytest.fixture
+def repo_con_remoto(temp_git_repo, tmp_path):
+    """
+    Repositorio de `temp_git_repo` con un repositorio bare local como remoto "origin".
+    """
+    remoto = Repo.init(tmp_path / "remoto.git", bare=True)
+    repo = Repo(temp_git_repo["repo_path"])
+    repo.create_remote("origin", remoto.working_dir)
+    return repo, remoto, temp_git_repo["expected_version"]
+
+
+def test_release_no_interactivo(repo_con_remoto, tmp_path):
+    """
+    Probar que el modo no interactivo cree y envíe el tag, y que una segunda ejecución no haga nada.
+    """
+    repo, remoto, version = repo_con_remoto
+
+    resumen = ejecutar_releases([repo.working_dir], salida_dir=str(tmp_path / "releases"))
+    resultado = resumen["repositorios"][0]
+
+    assert resumen["publicados"] == 1
+    assert (resultado["tag"], resultado["accion_tag"], resultado["accion_push"]) == (version, "crear", "nuevo")
+    assert repo.tags[version].commit.hexsha == resultado["sha"]
+    assert remoto.git.rev_parse(version) == resultado["sha"]
+
+    resumen = ejecutar_releases([repo.working_dir], salida_dir=str(tmp_path / "releases"))
+    assert resumen["repositorios"][0]["estado"] == "sin_cambios"
+
+
+def test_tag_remoto_existente(repo_con_remoto, tmp_path):
+    """
+    Probar que un tag remoto distinto solo se reemplace con --forzar o si el usuario lo confirma.
+    """
+    repo, remoto, version = repo_con_remoto
+    anterior = repo.head.commit.parents[0].hexsha
+    repo.git.push("origin", f"{anterior}:refs/tags/{version}")
+    salida = str(tmp_path / "releases")
+
+    resumen = ejecutar_releases([repo.working_dir], salida_dir=salida)
+    assert resumen["repositorios"][0]["estado"] == "local"
+    assert remoto.git.rev_parse(version) == anterior
+
+    preguntas = []
+    resumen = ejecutar_releases(
+        [repo.working_dir], salida_dir=salida, confirmar=lambda pregunta, _: preguntas.append(pregunta) or False
+    )
+    assert resumen["repositorios"][0]["estado"] == "local"
+    assert preguntas == [f"El tag '{version}' ya existe en el remoto. ¿Deseas forzar el push?"]
+
+    resumen = ejecutar_releases([repo.working_dir], salida_dir=salida, forzar=True)
+    assert resumen["repositorios"][0]["accion_push"] == "forzar"
+    assert remoto.git.rev_parse(version) == repo.head.commit.hexsha
+
+
+def test_push_respeta_estado_consultado(repo_con_remoto, tmp_path):
+    """
+    Probar que el push falle si el tag remoto cambió después de la consulta de ls-remote.
+    """
+    repo, remoto, version = repo_con_remoto
+    resultado = preparar_release(repo.working_dir, str(tmp_path / "releases"))
+    assert resultado["tag_remoto"] is None
+
+    repo.git.push("origin", f"{repo.head.commit.parents[0].hexsha}:refs/tags/{version}")
+    decidir_release(resultado)
+    publicar_release(repo.working_dir, resultado)
+
+    assert resultado["estado"] == "error"
+    assert remoto.git.rev_parse(version) == repo.head.commit.parents[0].hexsha
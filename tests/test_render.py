@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from scripts.changelog_generator import generar_changelog_md, iter_parsed_commits, main
+from scripts.render import cargar_plantillas, renderizar_notas
+
+
+def test_formatos_incluidos(temp_git_repo, tmp_path):
+    """
+    Probar que todos los formatos se generen en una pasada y que "md" coincida con generar_changelog_md.
+    """
+    commits = list(iter_parsed_commits(temp_git_repo["repo_path"], since="v1.0.0"))
+    commits.append({"commit": "f" * 40, "mensaje": {"tipo": "fix", "escopo": "ui", "descripcion": 'a <b> & "c"'}})
+    destinos = {formato: str(tmp_path / f"notas.{formato}") for formato in ("md", "html", "json", "slack")}
+
+    # Un generador: los commits se recorren una sola vez para todos los formatos
+    renderizar_notas(iter(commits), "v2.0.0", destinos)
+
+    generar_changelog_md(commits, "v2.0.0", str(tmp_path / "CHANGELOG.md"))
+    assert (tmp_path / "notas.md").read_text() == (tmp_path / "CHANGELOG.md").read_text()
+
+    notas = json.loads((tmp_path / "notas.json").read_text())
+    assert (notas["version"], notas["total"]) == ("v2.0.0", len(commits))
+    fixes = next(s for s in notas["secciones"] if s["tipo"] == "fix")
+    assert fixes["commits"][-1] == {"commit": "f" * 40, "escopo": "ui", "descripcion": 'a <b> & "c"'}
+
+    assert "a &lt;b&gt; &amp; &quot;c&quot;" in (tmp_path / "notas.html").read_text()
+    slack = (tmp_path / "notas.slack").read_text()
+    assert slack.startswith(f"*Release v2.0.0* ({len(commits)} commits)")
+    assert f"*Bug Fixes* ({len(fixes['commits'])})" in slack
+
+
+def test_changelog_vacio_igual(tmp_path):
+    renderizar_notas([], "v1.0.1", {"md": str(tmp_path / "notas.md")})
+    generar_changelog_md([], "v1.0.1", str(tmp_path / "CHANGELOG.md"))
+    assert (tmp_path / "notas.md").read_text() == (tmp_path / "CHANGELOG.md").read_text()
+
+
+def test_plantillas_de_usuario(tmp_path):
+    """
+    Probar formatos propios, el reemplazo de piezas incluidas, la caché y los errores de compilación.
+    """
+    ruta = tmp_path / "plantillas.json"
+    ruta.write_text(
+        json.dumps(
+            {
+                "formatos": {
+                    "csv": {"extension": "csv", "encabezado": "tipo,commit\n", "item": "$tipo,${commit_corto}\n"},
+                    "md": {"item": "- $descripcion ($$ {$commit_corto})\n"},
+                }
+            }
+        )
+    )
+    plantillas = cargar_plantillas(str(ruta))
+    assert cargar_plantillas(str(ruta)) is plantillas
+    assert plantillas["csv"].archivo == "release-notes.csv"
+
+    commits = [{"commit": "a" * 40, "mensaje": {"tipo": "feat", "escopo": None, "descripcion": "x"}}]
+    destinos = {"csv": str(tmp_path / "notas.csv"), "md": str(tmp_path / "notas.md")}
+    renderizar_notas(commits, "v1.1.0", destinos, plantillas)
+
+    assert (tmp_path / "notas.csv").read_text() == "tipo,commit\nfeat,aaaaaaa\n"
+    assert "- x ($ {aaaaaaa})" in (tmp_path / "notas.md").read_text()
+
+    ruta.write_text(json.dumps({"formatos": {"csv": {"seccion": "$descripcion"}}}))
+    with pytest.raises(ValueError, match=r"\$descripcion desconocida en 'csv.seccion'"):
+        cargar_plantillas(str(ruta))
+
+
+def test_notas_con_plantillas_en_main(temp_git_repo, tmp_path, monkeypatch):
+    """
+    Probar que `--notas` respete el archivo "md" de `--plantillas` y que la ejecución termine.
+    """
+    ruta = tmp_path / "plantillas.json"
+    ruta.write_text(json.dumps({"formatos": {"md": {"archivo": "NOTAS.md"}}}))
+    monkeypatch.chdir(tmp_path)
+
+    main(["--dir", str(temp_git_repo["repo_path"]), "--notas", "html", "--plantillas", str(ruta)])
+
+    assert (tmp_path / "NOTAS.md").exists()
+    assert not (tmp_path / "CHANGELOG.md").exists()
+    assert (tmp_path / "release-notes.html").exists()
+    # metrics.json recibe los tiempos solo si la ejecución llegó al final
+    metricas = json.loads((tmp_path / "metrics.json").read_text())
+    assert metricas["tiempos"]["etapas"]["changelog"]["bytes"] == (tmp_path / "NOTAS.md").stat().st_size
+
+
+def test_notas_md_con_incremental(temp_git_repo, tmp_path, monkeypatch):
+    """
+    Probar que `--incremental --notas md` conserve las secciones anteriores de CHANGELOG.md.
+    """
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "CHANGELOG.md").write_text("# Changelog\n\n## v1.0.0\n\n### Features\n- inicial\n")
+
+    main(["--dir", str(temp_git_repo["repo_path"]), "--incremental", "--notas", "md", "json"])
+
+    changelog = (tmp_path / "CHANGELOG.md").read_text()
+    assert f"## {temp_git_repo['expected_version']}" in changelog
+    assert "## v1.0.0" in changelog and "- inicial" in changelog
+    assert (tmp_path / "release-notes.json").exists()
@@ -0,0 +1,119 @@
+import json
+import socket
+import threading
+import urllib.request
+
+import pytest
+from git import Repo
+
+from scripts.servidor import IndiceCommits, ServidorHTTP, ServidorUnix, TagDesconocido
+
+
+def test_indice_consultas(temp_git_repo):
+    """
+    Probar que el índice responda la siguiente versión, el changelog y las métricas
+    igual que el generador.
+    """
+    indice = IndiceCommits(temp_git_repo["repo_path"])
+
+    assert indice.siguiente_version() == {
+        "tag_actual": "v1.0.0",
+        "siguiente_version": temp_git_repo["expected_version"],
+        "commits": len(temp_git_repo["expected_commits"]),
+    }
+    assert [c["commit"] for c in indice.commits_desde()] == [c["commit"] for c in temp_git_repo["expected_commits"]]
+    assert "### Features" in indice.changelog()
+    assert sum(indice.metricas()["task_distribution"].values()) == len(temp_git_repo["expected_commits"])
+    with pytest.raises(TagDesconocido):
+        indice.commits_desde("v9.9.9")
+
+
+def test_commits_por_tipo_en_el_rango(temp_git_repo):
+    """
+    Probar que filtrar por tipo no cambie el rango: sin `desde`, ambos son desde el último tag.
+    """
+    indice = IndiceCommits(temp_git_repo["repo_path"])
+
+    for tipo in ("feat", "fix", "chore"):
+        esperados = [c for c in indice.commits() if c["mensaje"]["tipo"] == tipo]
+        assert indice.commits(tipo) == esperados
+    # El único "chore" es el commit del tag v1.0.0
+    assert indice.commits("chore") == []
+    assert [c["mensaje"]["descripcion"] for c in indice.commits("fix", "v1.0.0")] == ["corregir fallo en autenticación"]
+
+
+def test_indice_incremental(temp_git_repo):
+    """
+    Probar que al moverse los refs solo se agreguen los commits nuevos y que
+    el índice se reconstruya si el historial se reescribe.
+    """
+    indice = IndiceCommits(temp_git_repo["repo_path"])
+    repo = Repo(temp_git_repo["repo_path"])
+    total = len(indice.orden)
+
+    assert not indice.actualizar()
+
+    repo.create_tag("v2.0.0")
+    nuevo = repo.index.commit("fix: corregir algo")
+    assert indice.actualizar()
+    assert len(indice.orden) == total + 1
+    assert indice.siguiente_version() == {"tag_actual": "v2.0.0", "siguiente_version": "v2.0.1", "commits": 1}
+    assert indice.por_sha[nuevo.hexsha]["padres"] == [nuevo.parents[0].hexsha]
+
+    repo.head.reset("HEAD~1", index=True, working_tree=False)
+    assert indice.actualizar()
+    assert len(indice.orden) == total
+    assert indice.siguiente_version()["commits"] == 0
+
+
+def test_servidor_http_y_unix(temp_git_repo, tmp_path):
+    """
+    Probar los endpoints por HTTP y por socket Unix.
+    """
+    indice = IndiceCommits(temp_git_repo["repo_path"])
+    http = ServidorHTTP(("127.0.0.1", 0), indice)
+    unix = ServidorUnix(str(tmp_path / "changelog.sock"), indice)
+    for servidor in (http, unix):
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    try:
+        base = f"http://127.0.0.1:{http.server_address[1]}"
+        with urllib.request.urlopen(base + "/next-version") as r:
+            assert json.load(r)["siguiente_version"] == temp_git_repo["expected_version"]
+        with urllib.request.urlopen(base + "/commits?tipo=fix") as r:
+            assert {c["mensaje"]["tipo"] for c in json.load(r)} == {"fix"}
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(base + "/changelog?desde=v9.9.9")
+        assert error.value.code == 404
+
+        with socket.socket(socket.AF_UNIX) as s:
+            s.connect(str(tmp_path / "changelog.sock"))
+            s.sendall(b"GET /changelog HTTP/1.0\r\n\r\n")
+            respuesta = b"".join(iter(lambda: s.recv(4096), b""))
+        assert respuesta.startswith(b"HTTP/1.0 200")
+        assert b"# Changelog" in respuesta
+    finally:
+        for servidor in (http, unix):
+            servidor.shutdown()
+            servidor.server_close()
+
+
+def test_tags_alcanzables_y_commit(temp_git_repo):
+    """
+    Probar que solo se indexen los tags alcanzables desde HEAD, que el último sea el de
+    mayor versión y que `commit` consulte el índice.
+    """
+    repo = Repo(temp_git_repo["repo_path"])
+    head = repo.head.commit
+    repo.create_tag("v0.9.0", ref=head.parents[0])
+    repo.create_tag("no-semver")
+    repo.git.checkout("-b", "otra", "v1.0.0")
+    repo.index.commit("feat: fuera de HEAD")
+    repo.create_tag("v5.0.0")
+    repo.git.checkout("-")
+
+    indice = IndiceCommits(temp_git_repo["repo_path"])
+
+    assert set(indice.tags) == {"v1.0.0", "v0.9.0"}
+    assert indice.ultimo_tag() == "v1.0.0"
+    assert indice.commit(head.hexsha)["commit"] == head.hexsha
+    assert indice.commit("0" * 40) is None
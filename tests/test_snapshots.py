@@ -0,0 +1,120 @@
+import sqlite3
+
+import pytest
+from git import Repo
+
+import scripts.changelog_generator as cg
+from scripts.snapshots import AlmacenSnapshots, registrar_snapshots
+
+
+@pytest.fixture
+def repo_con_releases(temp_git_repo):
+    """
+    `temp_git_repo` con tags v1.1.0 (feat) y v1.1.1 (fix) además de v1.0.0.
+    """
+    repo_path = str(temp_git_repo["repo_path"])
+    repo = Repo(repo_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test")
+        config.set_value("user", "email", "test@example.com")
+    repo.create_tag("v1.1.0", ref="HEAD~2")
+    repo.create_tag("v1.1.1", ref="HEAD~1", message="anotado")
+    return repo_path, repo
+
+
+def test_registrar_solo_el_delta(repo_con_releases, tmp_path, monkeypatch):
+    """
+    Probar que cada tag se registre una vez, recorriendo solo su rango.
+    """
+    repo_path, repo = repo_con_releases
+    rangos = []
+    original = cg.iter_parsed_commits
+
+    def espiar(*args, **kwargs):
+        rangos.append((kwargs.get("since"), kwargs.get("until")))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(cg, "iter_parsed_commits", espiar)
+
+    with AlmacenSnapshots(str(tmp_path / "snapshots.sqlite")) as almacen:
+        assert registrar_snapshots(repo_path, almacen) == ["v1.0.0", "v1.1.0", "v1.1.1"]
+        assert rangos == [(None, "v1.0.0"), ("v1.0.0", "v1.1.0"), ("v1.1.0", "v1.1.1")]
+
+        assert registrar_snapshots(repo_path, almacen) == []
+        repo.create_tag("v2.0.0")
+        assert registrar_snapshots(repo_path, almacen) == ["v2.0.0"]
+        assert rangos[-1] == ("v1.1.1", "v2.0.0")
+
+        snapshot = almacen.ultimos(1)[0]
+        commits = list(original(repo_path, since="v1.1.1", until="v2.0.0"))
+        metricas = cg.calcular_metricas(commits)
+        assert snapshot["throughput_commits_por_dia"] == metricas["throughput_commits_por_dia"]
+        assert snapshot["task_distribution"] == metricas["task_distribution"] == {"BREAKING CHANGE": 1}
+        assert snapshot["escopos"] == {"core": 1}
+        assert snapshot["autores"] == {commits[0]["autor"]["email"]: 1}
+        assert snapshot["sha"] == repo.head.commit.hexsha
+
+
+def test_tags_fuera_de_head(repo_con_releases, tmp_path):
+    """
+    Probar que los tags de otra rama no se registren hasta que sean alcanzables desde HEAD.
+    """
+    repo_path, repo = repo_con_releases
+    repo.git.checkout("-b", "mantenimiento", "v1.0.0")
+    repo.index.commit("fix: parche de mantenimiento")
+    repo.create_tag("v1.0.1")
+    repo.git.checkout("-")
+
+    with AlmacenSnapshots(str(tmp_path / "snapshots.sqlite")) as almacen:
+        assert registrar_snapshots(repo_path, almacen) == ["v1.0.0", "v1.1.0", "v1.1.1"]
+        repo.git.merge("--no-ff", "-m", "Merge mantenimiento", "mantenimiento")
+        repo.create_tag("v2.0.0")
+        assert registrar_snapshots(repo_path, almacen) == ["v1.0.1", "v2.0.0"]
+
+
+def test_snapshots_inmutables(repo_con_releases, tmp_path):
+    """
+    Probar que la base rechace cambios y que un tag movido sea un error.
+    """
+    repo_path, repo = repo_con_releases
+    ruta = str(tmp_path / "snapshots.sqlite")
+    with AlmacenSnapshots(ruta) as almacen:
+        registrar_snapshots(repo_path, almacen)
+
+    conn = sqlite3.connect(ruta)
+    with pytest.raises(sqlite3.IntegrityError, match="inmutables"):
+        conn.execute("UPDATE snapshots SET commits = 0")
+    with pytest.raises(sqlite3.IntegrityError, match="inmutables"):
+        conn.execute("DELETE FROM conteos")
+    conn.close()
+
+    repo.create_tag("v1.1.0", ref="HEAD", force=True)
+    with AlmacenSnapshots(ruta) as almacen:
+        with pytest.raises(ValueError, match="v1.1.0"):
+            registrar_snapshots(repo_path, almacen)
+
+
+def test_consultar_sin_git(repo_con_releases, tmp_path, capsys, monkeypatch):
+    """
+    Probar que las consultas solo lean la base, en orden de versión.
+    """
+    repo_path, _ = repo_con_releases
+    ruta = str(tmp_path / "snapshots.sqlite")
+    with pytest.raises(SystemExit):
+        cg.main(["snapshots", "registrar", "--dir", repo_path, "--db", ruta])
+
+    monkeypatch.setattr(Repo, "__init__", lambda *_: pytest.fail("la consulta no debe abrir el repositorio"))
+    with AlmacenSnapshots(ruta) as almacen:
+        ultimos = almacen.ultimos(2, ["tipo"])
+    assert [(s["tag"], s["commits"], s["task_distribution"]) for s in ultimos] == [
+        ("v1.1.0", 1, {"feat": 1}),
+        ("v1.1.1", 1, {"fix": 1}),
+    ]
+    assert "escopos" not in ultimos[0]
+
+    capsys.readouterr()
+    with pytest.raises(SystemExit):
+        cg.main(["snapshots", "consultar", "--db", ruta, "--ultimos", "2", "--dimension", "tipo"])
+    tabla = capsys.readouterr().out.splitlines()
+    assert tabla[0].split() == ["TAG", "COMMITS", "COMMITS/DÍA", "TIPO"]
+    assert tabla[2].split() == ["v1.1.1", "1", "1.00", "fix=1"]
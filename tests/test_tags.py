@@ -0,0 +1,51 @@
+import os
+
+from git import Repo
+
+from scripts.tags import ARCHIVO_CACHE, resolver_ultimo_tag
+
+
+def test_resolver_ultimo_tag(temp_git_repo):
+    """
+    Probar que se elija el último tag semántico alcanzable, ignorando tags
+    no semánticos (aunque empiecen con "v") y tags de ramas que no forman parte de HEAD.
+    """
+    repo = Repo(temp_git_repo["repo_path"])
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test")
+        config.set_value("user", "email", "test@example.com")
+    principal = repo.active_branch
+
+    repo.create_tag("v1.1.0", ref="HEAD~1")
+    repo.create_tag("no-semver")
+    repo.create_tag("v1.3.0-rc1")
+    repo.create_tag("v1.2.0", ref="HEAD~1", message="tag anotado")
+
+    rama = repo.create_head("experimento", "HEAD~2")
+    rama.checkout()
+    repo.index.commit("feat: experimento")
+    repo.create_tag("v9.0.0")
+    principal.checkout()
+
+    assert resolver_ultimo_tag(repo, usar_cache=False) == "v1.2.0"
+
+
+def test_resolver_ultimo_tag_cache(temp_git_repo):
+    """
+    Probar que el resultado se guarde en .git y se invalide al cambiar los refs.
+    """
+    repo = Repo(temp_git_repo["repo_path"])
+
+    assert resolver_ultimo_tag(repo) == "v1.0.0"
+    assert os.path.exists(os.path.join(repo.git_dir, ARCHIVO_CACHE))
+    assert resolver_ultimo_tag(repo) == "v1.0.0"
+
+    repo.create_tag("v2.0.0")
+    assert resolver_ultimo_tag(repo) == "v2.0.0"
+
+
+def test_resolver_sin_tags(temp_git_repo_no_tags):
+    """
+    Probar que se devuelva None si no hay tags semánticos.
+    """
+    assert resolver_ultimo_tag(Repo(temp_git_repo_no_tags)) is None
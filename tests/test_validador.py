@@ -0,0 +1,79 @@
+import os
+
+import pytest
+from git import Repo
+
+from scripts import validador
+from scripts.validador import ARCHIVO_CACHE, iter_mensajes, validar_rango
+
+
+def test_validar_rango_reporta_todas_las_violaciones(temp_git_repo):
+    """
+    Probar que se reporten todos los commits inválidos del rango con su hash.
+    """
+    repo = Repo(temp_git_repo["repo_path"])
+    malo_1 = repo.index.commit("arreglos varios")
+    repo.index.commit("fix: corregir validación")
+    malo_2 = repo.index.commit("WIP\n\ncuerpo")
+
+    violaciones, revisados, omitidos = validar_rango(
+        ["v1.0.0..HEAD"], repo_path=temp_git_repo["repo_path"], tamano_lote=2
+    )
+
+    assert violaciones == [(malo_2.hexsha, "WIP"), (malo_1.hexsha, "arreglos varios")]
+    assert revisados == len(list(repo.iter_commits("v1.0.0..HEAD")))
+    assert omitidos == 0
+
+
+def test_validar_rango_cache(temp_git_repo):
+    """
+    Probar que los commits válidos se guarden en .git y se omitan en la siguiente
+    ejecución, mientras que los inválidos se siguen reportando.
+    """
+    repo = Repo(temp_git_repo["repo_path"])
+    malo = repo.index.commit("sin formato")
+
+    _, revisados, _ = validar_rango(["v1.0.0..HEAD"], repo_path=temp_git_repo["repo_path"])
+    assert os.path.exists(os.path.join(repo.git_dir, ARCHIVO_CACHE))
+
+    violaciones, revisados_2, omitidos = validar_rango(
+        ["v1.0.0..HEAD"], repo_path=temp_git_repo["repo_path"]
+    )
+    assert violaciones == [(malo.hexsha, "sin formato")]
+    assert revisados_2 == revisados
+    assert omitidos == revisados - 1
+
+
+def test_iter_mensajes_errores_de_git(temp_git_repo):
+    """
+    Probar que un rango inválido reporte el mensaje de git y que cortar la iteración no sea un error.
+    """
+    with pytest.raises(RuntimeError, match="unknown revision"):
+        list(iter_mensajes(["no-existe..HEAD"], temp_git_repo["repo_path"]))
+
+    # git sigue escribiendo el mensaje largo cuando se cierra el generador
+    repo = Repo(temp_git_repo["repo_path"])
+    repo.index.commit("docs: largo\n\n" + "x" * (1 << 20))
+    repo.index.commit("fix: corto")
+    mensajes = iter_mensajes(["HEAD"], temp_git_repo["repo_path"])
+    assert next(mensajes)[1] == "fix: corto\n"
+    mensajes.close()
+
+
+def test_cache_descarta_los_mas_antiguos(temp_git_repo, monkeypatch):
+    """
+    Probar que al superar MAX_CACHE se conserven los hashes validados más recientemente.
+    """
+    repo = Repo(temp_git_repo["repo_path"])
+    ruta = os.path.join(repo.git_dir, ARCHIVO_CACHE)
+    for i in range(20):
+        repo.index.commit(f"fix: arreglo {i}")
+    validar_rango(["v1.0.0..HEAD"], repo_path=temp_git_repo["repo_path"])
+    anteriores = open(ruta).read().split()[1:]
+    assert anteriores == repo.git.rev_list("--reverse", "v1.0.0..HEAD").split()
+
+    monkeypatch.setattr(validador, "MAX_CACHE", len(anteriores))
+    nuevo = repo.index.commit("fix: otro arreglo")
+    validar_rango(["v1.0.0..HEAD"], repo_path=temp_git_repo["repo_path"])
+
+    assert open(ruta).read().split()[1:] == anteriores[1:] + [nuevo.hexsha]